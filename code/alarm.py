@@ -1,36 +1,69 @@
+from __future__ import annotations
 import pygame as pg
+import heapq
+from itertools import count
+
+class Scheduler:
+    '''a heap of alarm deadlines, each frame only touches the alarms that are due'''
+    def __init__(self):
+        self.heap = [] # (deadline, order, generation, alarm)
+        self.order = count() # breaks ties between equal deadlines so alarms are never compared
+        self.now = 0
+
+    def schedule(self, alarm: Alarm) -> None:
+        heapq.heappush(self.heap, (alarm.deadline, next(self.order), alarm.generation, alarm))
+
+    def update(self, now: int) -> None:
+        '''a looping alarm can fire several times per update when its length is shorter than the frame's time step'''
+        self.now = now
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            _, _, generation, alarm = heapq.heappop(heap)
+            if generation == alarm.generation: # otherwise the alarm was stopped/restarted after this entry was pushed
+                alarm.end()
+
+scheduler = Scheduler() # shared by every alarm, updated once per frame by the main loop
+
 
 class Alarm:
-    def __init__(self, length: int, fn: callable=None, auto: bool=False, loop: bool=False, track_pct: bool=False, *args, **kwargs):
+    def __init__(self, length: int, fn: callable=None, auto: bool=False, loop: bool=False, *args, **kwargs):
         self.length = length
         self.fn = fn
         self.loop = loop
-        self.track_pct = track_pct
-        if self.track_pct:
-            self.pct = 0
         self.args = args
         self.kwargs = kwargs
         
         self.running = False
+        self.start_time = 0
+        self.deadline = 0
+        self.generation = 0 # invalidates the alarm's older heap entries
         if auto: 
             self.start()
 
-    def start(self) -> None:
+    @property
+    def pct(self) -> float:
+        '''computed when read rather than every frame'''
+        if not self.running:
+            return 0
+        return min(100, ((scheduler.now - self.start_time) / self.length) * 100)
+
+    def start(self, start_time: float=None) -> None:
+        if self.loop and not self.length > 0: # it would be due again as soon as it fired & the scheduler would never catch up
+            raise ValueError(f'looping alarms need a positive length, got {self.length}')
         self.running = True
-        self.start_time = pg.time.get_ticks()
+        self.start_time = scheduler.now if start_time is None else start_time
+        self.deadline = self.start_time + self.length
+        self.generation += 1
+        scheduler.schedule(self)
+
+    def stop(self) -> None:
+        self.running = False
+        self.generation += 1
 
     def end(self) -> None:
         self.running = False
         self.start_time = 0
         if self.fn:
             self.fn(*self.args, **self.kwargs)
-        if self.loop:
-            self.start()
-
-    def update(self) -> None:
-        if self.running:
-            progress = pg.time.get_ticks() - self.start_time
-            if self.track_pct:
-                self.pct = (progress / self.length) * 100
-            if progress >= self.length:
-                self.end()
\ No newline at end of file
+        if self.loop: # restart from the deadline rather than now so the time that ran over into this frame isn't lost
+            self.start(self.deadline)
@@ -13,6 +13,8 @@ from assembler_ui import AssemblerUI
 from alarm import Alarm
 
 class Assembler(Machine):
+    sleeps = True
+
     def __init__(
         self, 
         xy: tuple[int, int], 
@@ -52,13 +54,15 @@ class Assembler(Machine):
         self.item = list(data.keys())[idx]
         self.inv.output_slot.valid_inputs = {self.item}
         self.recipe = list(data.values())[idx]['recipe']
+        for alarm in self.alarms.values():
+            alarm.stop()
         for dct in (self.inv.input_slots, self.alarms, self.assemble_progress):
             dct.clear()
         for item in self.recipe:
             self.assemble_progress[item] = 0
             self.inv.input_slots[item] = MachineInventorySlot(item, valid_inputs={item}) # assigning the rect in the ui class
-            self.alarms[item] = Alarm(2500, self.update_slot, loop=True, track_pct=True, slot=self.inv.input_slots[item]) # TODO: have alarm length vary by material
-        self.alarms[self.item] = Alarm(max(self.recipe.values()) * 2500, loop=True, track_pct=True, slot=self.inv.output_slot)
+            self.alarms[item] = Alarm(2500, self.update_slot, loop=True, slot=self.inv.input_slots[item]) # TODO: have alarm length vary by material
+        self.alarms[self.item] = Alarm(max(self.recipe.values()) * 2500, loop=True, slot=self.inv.output_slot)
     
     def update_slot(self, slot: InvSlot) -> None:
         slot.amount -= 1
@@ -71,15 +75,38 @@ class Assembler(Machine):
             for alarm in self.alarms.values():
                 if not alarm.running:
                     alarm.start()
-                else:
-                    alarm.update()
             if all(self.assemble_progress[item] >= self.recipe[item] for item in self.recipe):
                 if not self.inv.output_slot.item:
                     self.inv.output_slot.item = self.item
                 self.inv.output_slot.amount += 1
                 for item in self.recipe:
                     self.assemble_progress[item] = 0
+        else: # the scheduler would keep firing them, so pause until every input is stocked again
+            for alarm in self.alarms.values():
+                alarm.stop()
+
+    def catch_up(self, elapsed: float) -> float:
+        '''completes 1 craft per cycle of the output alarm, consuming the recipe's amounts'''
+        if not self.recipe:
+            return elapsed
+        slots, output = self.inv.input_slots, self.inv.output_slot
+        cycle_length = self.alarms[self.item].length
+        num_cycles = int(elapsed // cycle_length)
+        num_crafted = min(
+            num_cycles, 
+            output.max_capacity - output.amount, 
+            *(slots[item].amount // amount for item, amount in self.recipe.items())
+        )
+        if num_crafted > 0:
+            for item, amount in self.recipe.items():
+                slots[item].amount -= amount * num_crafted
+                if not slots[item].amount:
+                    slots[item].item = None
+            if not output.item:
+                output.item = self.item
+            output.amount += num_crafted
+        # the rest of an unfinished cycle carries over to the next sync, a blocked assembler idles through it instead
+        return num_crafted * cycle_length if num_crafted == num_cycles else elapsed
 
     def update(self, dt=None) -> None:
-        self.assemble()
-        self.ui.update()
\ No newline at end of file
+        self.assemble()
\ No newline at end of file
@@ -36,11 +36,12 @@ class AssemblerUI(MachineUI):
         self.machine_icons, self.item_surf = None, None
         self.inv_box_len = 40
         self.inv = self.machine.inv
+        self.panel.margin = self.padding # labels under the bottom row can hang past the background
         self.update_bg_dimensions()
 
     def get_icons(self, folder: dict[str, pg.Surface], keys: list[str], scale: int=None) -> dict[str, pg.Surface]:
         return {
-            k: pg.transform.scale(surf, (self.icon_size, self.icon_size) if scale is None else (self.box_len * scale, self.box_len * scale)) 
+            k: self.get_icon(surf, (self.icon_size, self.icon_size) if scale is None else (self.box_len * scale, self.box_len * scale)) 
             for k, surf in folder.items() if k in keys
         }
 
@@ -60,37 +61,70 @@ class AssemblerUI(MachineUI):
             self.bg_w = (num_slots * self.inv_box_len) + (self.padding * ((num_slots % self.item_cols) + 1))
             self.bg_h = self.inv_box_len + self.category_rect.height + (self.padding * (self.item_rows + 1))
 
+    def update_category_rect(self) -> None:
+        if self.machine.item_category:
+            self.category_rect = pg.Rect(
+                self.bg_rect.topleft + pg.Vector2((self.bg_w // 2) - (self.box_len // 2), 5 if self.machine.item else self.padding), (self.box_len, self.box_len)
+            )
+
+    def get_category_outlines(self) -> list[tuple[pg.Rect, str]]:
+        outlines = []
+        for x in range(self.category_cols):
+            for y in range(self.category_rows):
+                outline = pg.Rect(
+                    self.bg_rect.topleft + pg.Vector2((self.padding * (x + 1)) + (x * self.box_len), (self.padding * (y + 1)) + (y * self.box_len)), 
+                    (self.box_len, self.box_len)
+                )
+                outlines.append((outline, self.category_names[x + (y * self.category_cols)]))
+        return outlines
+
+    def get_item_outlines(self) -> list[pg.Rect]:
+        y = self.category_rect.bottom - self.bg_rect.top
+        outlines = []
+        for i in range(len(self.machine_icons)):
+            row, col = divmod(i, self.item_cols)
+            outlines.append(pg.Rect(
+                self.bg_rect.topleft + pg.Vector2((self.padding * (col + 1)) + (col * self.inv_box_len), y + (self.padding * (row + 1)) + (row * self.inv_box_len)), 
+                (self.inv_box_len, self.inv_box_len)
+            ))
+        return outlines
+
+    def get_hovered_outline(self) -> int | None:
+        if not self.machine.item_category:
+            outlines = [outline for outline, _ in self.get_category_outlines()]
+        elif not self.machine.item:
+            outlines = self.get_item_outlines()
+        else:
+            return None
+        return next((i for i, outline in enumerate(outlines) if outline.collidepoint(self.mouse.screen_xy)), None)
+
     def render_item_categories(self) -> None:
+        surf = self.panel.surf
         if not self.machine.item_category:
-            for x in range(self.category_cols):
-                for y in range(self.category_rows):
-                    outline = pg.Rect(
-                        self.bg_rect.topleft + pg.Vector2((self.padding * (x + 1)) + (x * self.box_len), (self.padding * (y + 1)) + (y * self.box_len)), 
-                        (self.box_len, self.box_len)
-                    )
-                    self.gen_bg(outline, self.colors['ui bg highlight'] if outline.collidepoint(self.mouse.screen_xy) else 'black') 
-                    self.gen_outline(outline)
-                    category = self.category_names[x + (y * self.category_cols)]
-                    icon = self.icons[category]
-                    self.screen.blit(icon, icon.get_rect(center=outline.center))
-                    font = self.fonts['item label small'].render(category, True, self.colors['text'])
-                    self.screen.blit(font, font.get_rect(midtop=outline.midbottom + pg.Vector2(0, 1)))
-                    self.get_category_input(outline, category)
+            hovered = self.get_hovered_outline()
+            for i, (outline, category) in enumerate(self.get_category_outlines()):
+                outline = self.panel.to_local(outline)
+                self.gen_bg(outline, self.colors['ui bg highlight'] if i == hovered else 'black', surf=surf) 
+                self.gen_outline(outline, surf=surf)
+                icon = self.icons[category]
+                surf.blit(icon, icon.get_rect(center=outline.center))
+                font = self.render_text(self.fonts['item label small'], category, True, self.colors['text'])
+                surf.blit(font, font.get_rect(midtop=outline.midbottom + pg.Vector2(0, 1)))
         elif not self.machine.item:
-            self.category_rect = pg.Rect(self.bg_rect.topleft + pg.Vector2((self.bg_w // 2) - (self.box_len // 2), self.padding), (self.box_len, self.box_len))
-            font = self.fonts['item label'].render(self.machine.item_category, True, self.colors['text'])
-            self.screen.blit(font, font.get_rect(midtop=self.category_rect.midbottom - pg.Vector2(0, 8))) # subtracring since the icon is smaller than the rect
-            self.screen.blit(self.icons[self.machine.item_category], self.category_rect)
+            category_rect = self.panel.to_local(self.category_rect)
+            font = self.render_text(self.fonts['item label'], self.machine.item_category, True, self.colors['text'])
+            surf.blit(font, font.get_rect(midtop=category_rect.midbottom - pg.Vector2(0, 8))) # subtracring since the icon is smaller than the rect
+            surf.blit(self.icons[self.machine.item_category], category_rect)
             self.render_item_options()
         else:
-            self.category_rect = pg.Rect(self.bg_rect.topleft + pg.Vector2((self.bg_w // 2) - (self.box_len // 2), 5), (self.box_len, self.box_len))
-            self.screen.blit(self.item_surf, self.category_rect)
-            font = self.fonts['item label small'].render(self.machine.item, True, self.colors['text'])
-            self.screen.blit(font, font.get_rect(midtop=self.category_rect.midbottom + pg.Vector2(0, 1)))
+            category_rect = self.panel.to_local(self.category_rect)
+            surf.blit(self.item_surf, category_rect)
+            font = self.render_text(self.fonts['item label small'], self.machine.item, True, self.colors['text'])
+            surf.blit(font, font.get_rect(midtop=category_rect.midbottom + pg.Vector2(0, 1)))
             self.render_inv(slot_preview=True)
             for item in self.machine.recipe:
-                font = self.fonts['item label small'].render(item, True, self.colors['text'])
-                self.screen.blit(font, font.get_rect(midtop=self.inv.input_slots[item].rect.midbottom + pg.Vector2(0, self.progress_bar_height + 2)))
+                font = self.render_text(self.fonts['item label small'], item, True, self.colors['text'])
+                surf.blit(font, font.get_rect(midtop=self.panel.to_local(self.inv.input_slots[item].rect).midbottom + pg.Vector2(0, self.progress_bar_height + 2)))
     
     def get_category_input(self, input_box: pg.Rect, category: str) -> None:
         if input_box.collidepoint(self.mouse.screen_xy) and self.mouse.buttons_pressed['left']:
@@ -98,31 +132,33 @@ class AssemblerUI(MachineUI):
             self.machine_icons = self.get_icons(self.graphics, self.machine.item_category_data[category].keys())
             self.update_bg_dimensions() 
 
+    def get_item_input(self, input_box: pg.Rect, idx: int) -> None:
+        if input_box.collidepoint(self.mouse.screen_xy) and self.mouse.buttons_pressed['left']:
+            self.machine.assign_item(idx)
+            self.item_surf = self.get_icon(self.graphics[self.machine.item], self.category_rect.size)
+            self.update_bg_dimensions()
+
     def render_item_options(self) -> None:
+        surf = self.panel.surf
         icon_names, icon_surfs = list(self.machine_icons.keys()), list(self.machine_icons.values())
-        y = self.category_rect.bottom - self.bg_rect.top
-        for i in range(len(icon_names)):
-            row, col = divmod(i, self.item_cols)
-            outline = pg.Rect(
-                self.bg_rect.topleft + pg.Vector2((self.padding * (col + 1)) + (col * self.inv_box_len), y + (self.padding * (row + 1)) + (row * self.inv_box_len)), 
-                (self.inv_box_len, self.inv_box_len)
-            )
-            if outline.collidepoint(self.mouse.screen_xy):
+        hovered = self.get_hovered_outline()
+        for i, outline in enumerate(self.get_item_outlines()):
+            outline = self.panel.to_local(outline)
+            if i == hovered:
                 color = self.colors['ui bg highlight']
-                if self.mouse.buttons_pressed['left']:
-                    self.machine.assign_item(i)
-                    self.item_surf = pg.transform.scale(self.graphics[self.machine.item].copy(), self.category_rect.size)
-                    self.update_bg_dimensions()
-                font = self.fonts['item label small'].render(icon_names[i], True, self.colors['text'])
-                self.screen.blit(font, font.get_rect(midtop=outline.midbottom + pg.Vector2(0, 1)))
+                font = self.render_text(self.fonts['item label small'], icon_names[i], True, self.colors['text'])
+                surf.blit(font, font.get_rect(midtop=outline.midbottom + pg.Vector2(0, 1)))
             else:
                 color = 'black'
-            self.gen_bg(outline, color) 
-            self.gen_outline(outline)
+            self.gen_bg(outline, color, surf=surf) 
+            self.gen_outline(outline, surf=surf)
             icon_surf = icon_surfs[i]
-            self.screen.blit(icon_surf, icon_surf.get_rect(center=outline.center))
+            surf.blit(icon_surf, icon_surf.get_rect(center=outline.center))
 
     def update_inv_rects(self) -> None:
+        self.update_category_rect()
+        if not self.machine.item:
+            return
         y = self.padding + self.category_rect.bottom - self.bg_rect.top
         for i, item in enumerate(self.machine.recipe):
             rect = pg.Rect(self.bg_rect.topleft + pg.Vector2((self.padding * (i + 1)) + (i * self.inv_box_len), y), (self.inv_box_len, self.inv_box_len))
@@ -138,21 +174,30 @@ class AssemblerUI(MachineUI):
         if self.keyboard.pressed_keys[pg.K_x] and self.machine.rect.collidepoint(self.mouse.world_xy):
             self.machine.item_category, self.machine_icons = None, None
             self.update_bg_dimensions()
-            
-    def render_interface(self) -> None:
-        self.update_bg_rect()
-        if self.rect_in_sprite_radius(self.player, self.bg_rect, rect_world_space=False):
-            self.gen_bg(self.bg_rect, transparent=True)
-            self.gen_outline(self.bg_rect)
-            self.render_item_categories()
-            self.undo_selection()
-            for slot in [s for s in [*self.inv.input_slots.values(), self.inv.output_slot] if s.rect]:
-                self.render_progress_bar(
-                    slot.rect, 
-                    self.machine.alarms[next(iter(slot.valid_inputs))].pct, 
-                    self.inv_box_len, 
-                    pg.Vector2(0, 2), 
-                    self.colors['progress bar']
-                )
-        else:
-            self.render = False
\ No newline at end of file
+
+    def check_panel_input(self) -> None:
+        self.update_category_rect()
+        if not self.machine.item_category:
+            for outline, category in self.get_category_outlines():
+                self.get_category_input(outline, category)
+        elif not self.machine.item:
+            for i, outline in enumerate(self.get_item_outlines()):
+                self.get_item_input(outline, i)
+        self.undo_selection()
+
+    def get_progress_pcts(self) -> list[tuple[InvSlot, float]]:
+        if not self.machine.item:
+            return []
+        return [(slot, self.machine.alarms[next(iter(slot.valid_inputs))].pct) for slot in self.get_slots()]
+
+    def get_panel_key(self) -> tuple:
+        progress = tuple(self.get_progress_width(pct, self.inv_box_len) for _, pct in self.get_progress_pcts())
+        return (*super().get_panel_key(), self.machine.item_category, self.machine.item, self.get_hovered_outline(), progress)
+
+    def render_panel(self) -> None:
+        bg_rect = self.panel.to_local(self.bg_rect)
+        self.gen_bg(bg_rect, transparent=True, surf=self.panel.surf)
+        self.gen_outline(bg_rect, surf=self.panel.surf)
+        self.render_item_categories()
+        for slot, pct in self.get_progress_pcts():
+            self.render_progress_bar(slot.rect, pct, self.inv_box_len, pg.Vector2(0, 2), self.colors['progress bar'])
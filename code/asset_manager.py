@@ -1,8 +1,10 @@
 import pygame as pg
 from os.path import join
 
-from settings import BIOMES, TREE_BIOMES, TILES, RAMP_TILES, TOOLS, PRODUCTION, LOGISTICS, ELECTRICITY, MATERIALS, PIPE_TRANSPORT_DIRS, TILE_SIZE
+from settings import BIOMES, TREE_BIOMES, TILES, RAMP_TILES, TOOLS, PRODUCTION, LOGISTICS, ELECTRICITY, MATERIALS, PIPE_TRANSPORT_DIRS, TILE_SIZE, \
+    ROTATION_CACHE_MAX_BYTES, ROTATION_ANGLE_STEP, TEXT_CACHE_MAX_BYTES, ICON_ATLAS_PAGE_SIZE
 from helper_functions import load_image, load_folder, load_subfolders, load_frames
+from surface_cache import RotationCache, TextCache, IconAtlas
 
 class AssetManager:
     def __init__(self):
@@ -29,6 +31,9 @@ class AssetManager:
                 'number': pg.font.Font(join('..', 'graphics', 'fonts', 'PKMN RBYGSC.ttf'), size=8)
             },
             'colors': {'outline bg': 'gray18', 'text': 'ivory4', 'ui bg highlight': 'gray4', 'progress bar': 'gray18'}, 
+            'rotation cache': RotationCache(ROTATION_CACHE_MAX_BYTES, ROTATION_ANGLE_STEP), # shared by every rotating graphic
+            'text cache': TextCache(TEXT_CACHE_MAX_BYTES), # shared by every ui label
+            'icon atlas': IconAtlas(ICON_ATLAS_PAGE_SIZE) # item icons at each size the ui draws them
         }
         self.graphics = self.assets['graphics']
         for surf in self.graphics['transport dirs'].values():
@@ -2,47 +2,36 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import pygame as pg
+    import numpy as np
 
-from settings import CHUNK_SIZE, TILE_SIZE, MAP_SIZE, RES
+from settings import CHUNK_SIZE, TILE_SIZE, MAP_SIZE
 import math
 
 class ChunkManager:
-    def __init__(self, camera_offset: pg.Vector2) -> None:
+    '''computes the window of visible tiles once per frame for every render pass to share'''
+    def __init__(self, camera_offset: pg.Vector2, view_size: pg.Vector2, tile_map: np.ndarray) -> None:
         self.camera_offset = camera_offset
-
-    @staticmethod
-    def get_chunk(topleft_x: int, topleft_y: int) -> list[tuple[int, int]]:
-        '''divide the map into chunks of tiles to render as needed'''
-        chunk_coords = []
-        for x in range(CHUNK_SIZE):
-            for y in range(CHUNK_SIZE):
-                # coordinates for individual tiles within a chunk
-                tile_x = x + topleft_x 
-                tile_y = y + topleft_y 
-                chunk_coords.append((tile_x, tile_y))
-        
-        return chunk_coords
-
-    def update(self) -> list[list[tuple[int, int]]]:
-        '''add/remove chunks as the camera offset shifts'''
-        visible_chunks = []
-        
-        # calculate how many chunks are needed to fill the screen
-        num_chunks_x = math.ceil(RES[0] / (CHUNK_SIZE * TILE_SIZE))
-        num_chunks_y = math.ceil(RES[1] / (CHUNK_SIZE * TILE_SIZE))
-
-        for x in range(num_chunks_x):
-            for y in range(num_chunks_y):
-                chunk_x = (x * CHUNK_SIZE) + (self.camera_offset.x // TILE_SIZE)
-                chunk_y = (y * CHUNK_SIZE) + (self.camera_offset.y // TILE_SIZE)
-
-                max_x = MAP_SIZE[0] - CHUNK_SIZE
-                max_y = MAP_SIZE[1] - CHUNK_SIZE
-
-                target_x = max(0, min(chunk_x, max_x))
-                target_y = max(0, min(chunk_y, max_y))
-
-                chunk = self.get_chunk(topleft_x = int(target_x), topleft_y = int(target_y))
-                visible_chunks.append(chunk)
-
-        return visible_chunks
\ No newline at end of file
+        self.view_size = view_size
+        self.tile_map = tile_map
+
+        self.min_x = self.min_y = self.max_x = self.max_y = 0
+        self.tile_slice = (slice(0, 0), slice(0, 0))
+        self.chunk_keys = []
+
+    @property
+    def visible_tiles(self) -> np.ndarray:
+        '''view of the tile map clipped to the screen, index [0, 0] corresponds to (min_x, min_y)'''
+        return self.tile_map[self.tile_slice]
+
+    def update(self) -> None:
+        self.min_x = max(0, int(self.camera_offset.x // TILE_SIZE))
+        self.min_y = max(0, int(self.camera_offset.y // TILE_SIZE))
+        self.max_x = min(MAP_SIZE[0], math.ceil((self.camera_offset.x + self.view_size.x) / TILE_SIZE))
+        self.max_y = min(MAP_SIZE[1], math.ceil((self.camera_offset.y + self.view_size.y) / TILE_SIZE))
+        self.tile_slice = (slice(self.min_x, max(self.min_x, self.max_x)), slice(self.min_y, max(self.min_y, self.max_y)))
+        # chunk coordinates aligned to the map grid
+        self.chunk_keys = [
+            (x, y)
+            for x in range(self.min_x // CHUNK_SIZE, math.ceil(self.max_x / CHUNK_SIZE))
+            for y in range(self.min_y // CHUNK_SIZE, math.ceil(self.max_y / CHUNK_SIZE))
+        ]
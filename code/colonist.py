@@ -66,15 +66,13 @@ class Colonist(AnimatedSprite):
         if self.underwater:
             if not self.alarms['lose oxygen'].running:
                 self.alarms['lose oxygen'].start()
-            self.render_oxygen_icons()
 
     def render_oxygen_icons(self) -> None:
         x_padding = self.oxygen_icon_w * (self.oxygen_lvl // 2)
-        for i in range(self.oxygen_lvl):
-            self.screen.blit(
-                self.oxygen_icon, 
-                self.rect.midtop - self.cam_offset + pg.Vector2((self.oxygen_icon_w * i) - x_padding, -self.oxygen_icon_h)
-            ) 
+        topleft = self.rect.midtop - self.cam_offset - pg.Vector2(x_padding, self.oxygen_icon_h)
+        self.sprite_manager.render_queue.extend(
+            'overlays', [(self.oxygen_icon, topleft + pg.Vector2(self.oxygen_icon_w * i, 0)) for i in range(self.oxygen_lvl)]
+        )
 
     def lose_oxygen(self) -> None:
         if self.oxygen_lvl >= 1:
@@ -89,6 +87,8 @@ class Colonist(AnimatedSprite):
         if self.z == Z_LAYERS['player']: 
             self.respawn()
         else:
+            for alarm in self.alarms.values():
+                alarm.stop()
             self.kill()
 
     def drop_inventory(self) -> None:
@@ -111,15 +111,14 @@ class Colonist(AnimatedSprite):
     def regen_hp(self) -> None:
         self.hp += 1
 
-    def update_alarms(self) -> None:
-        for alarm in [a for a in self.alarms.values() if a.running]:
-            alarm.update()
-
     def update(self, dt: float) -> None:
         self.update_current_biome()
         self.check_oxygen_level()
         self.check_hp_level()
-        self.update_alarms()
+
+    def render(self) -> None:
+        if self.underwater:
+            self.render_oxygen_icons()
 
     def get_save_data(self) -> dict[str, any]:
         return {
@@ -3,11 +3,11 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ui import UI
     from sprite_manager import SpriteManager
-    from crafting import Crafting
 
 import pygame as pg
 from math import ceil
 
+from crafting import CraftabilityIndex
 from settings import TILE_SIZE, TOOLS, MATERIALS, ELECTRICITY, PRODUCTION, LOGISTICS, RESEARCH, STORAGE, DECOR
 
 class CraftWindow:
@@ -21,6 +21,8 @@ class CraftWindow:
         self.gen_bg = ui.gen_bg
         self.render_inv_item_name = ui.render_inv_item_name
         self.get_scaled_image = ui.get_scaled_image
+        self.render_text = ui.render_text
+        self.render_item_amount = ui.render_item_amount
         self.sprite_manager = sprite_manager
 
         self.graphics = ui.assets['graphics']
@@ -33,6 +35,8 @@ class CraftWindow:
             self.inventory_ui.outline_rect_closed.right + self.padding, self.padding, self.width, self.height # the right side is the same with either outline rect
         )
         self.opened = False
+        self.panel = ui.panel()
+        self.craftability = CraftabilityIndex(self.player.inventory)
         self.cell_height = self.cell_width = TILE_SIZE * 2 # for the grid of items comprising a given category
         self.category_grid = CategoryGrid(self)
         self.item_grid = ItemGrid(
@@ -41,15 +45,20 @@ class CraftWindow:
         )
 
     def render(self) -> None:
-        self.gen_outline(self.outline_rect, color='black')
-        self.gen_bg(pg.Rect(self.outline_rect.topleft, self.outline_rect.size), transparent=True)
+        if self.panel.needs_redraw(self.outline_rect, (self.category_grid.selected_category, self.craftability.version)):
+            rect = self.panel.to_local(self.outline_rect)
+            self.gen_outline(rect, color='black', surf=self.panel.surf)
+            self.gen_bg(rect, transparent=True, surf=self.panel.surf)
+            self.category_grid.render_grid()
+            self.item_grid.render_item_slots()
+        self.panel.render()
 
     def update(self) -> None:
         if self.opened:
-            self.render()
             self.category_grid.opened = self.opened
             self.category_grid.update()
             self.item_grid.selected_category = self.category_grid.selected_category
+            self.render()
             self.item_grid.update()
 
 
@@ -66,6 +75,8 @@ class CategoryGrid:
         self.gen_outline = craft_window.gen_outline
         self.gen_bg = craft_window.gen_bg
         self.inv_ui = craft_window.inventory_ui
+        self.panel = craft_window.panel
+        self.render_text = craft_window.render_text
 
         self.opened = False
         self.categories = {
@@ -106,18 +117,20 @@ class CategoryGrid:
         return borders
 
     def render_grid(self) -> None:
+        surf = self.panel.surf
+        window_rect = self.panel.to_local(self.window_outline_rect)
         for col in range(self.num_cols):
-            left = self.window_outline_rect.left + (self.col_width * col)
-            col_rect = pg.Rect(left, self.window_outline_rect.top, self.col_width, self.row_height * self.num_rows)
-            self.gen_outline(col_rect)
-            pg.draw.rect(self.screen, 'black', col_rect, 1)
+            left = window_rect.left + (self.col_width * col)
+            col_rect = pg.Rect(left, window_rect.top, self.col_width, self.row_height * self.num_rows)
+            self.gen_outline(col_rect, surf=surf)
+            pg.draw.rect(surf, 'black', col_rect, 1)
             for row in range(self.num_rows):
-                top = self.window_outline_rect.top + (self.row_height * row)
+                top = window_rect.top + (self.row_height * row)
                 row_rect = pg.Rect(
-                    self.window_outline_rect.left, top, 
-                    self.window_outline_rect.width - self.outline_padding, self.row_height
+                    window_rect.left, top, 
+                    window_rect.width - self.outline_padding, self.row_height
                 )
-                pg.draw.rect(self.screen, 'black', row_rect, 1)
+                pg.draw.rect(surf, 'black', row_rect, 1)
                 category = self.category_keys[col + (row * self.num_cols)]
                 self.render_category_images(category, col, row)
                 self.render_category_names((left, top), category)
@@ -134,19 +147,19 @@ class CategoryGrid:
             (col * self.col_width) + (padding_x // 2), 
             (row * self.row_height) + (padding_y // 2) + self.image_padding
         ) 
-        image_rect = image.get_rect(topleft = self.window_outline_rect.topleft + offset)
-        self.screen.blit(image, image_rect)
+        image_rect = image.get_rect(topleft = self.panel.to_local(self.window_outline_rect.topleft) + offset)
+        self.panel.surf.blit(image, image_rect)
 
     def render_category_names(self, topleft: tuple[int, int], category: str) -> None:
-        text = self.fonts['craft menu category'].render(category, True, self.colors['text'])
+        text = self.render_text(self.fonts['craft menu category'], category, True, self.colors['text'])
         border = pg.Rect(
             topleft + pg.Vector2(self.outline_padding, self.outline_padding), 
             text.size + pg.Vector2(self.outline_padding * 2, self.outline_padding * 2)
         )
-        self.gen_bg(border, transparent=True)
-        self.gen_outline(border, color='black')
+        self.gen_bg(border, transparent=True, surf=self.panel.surf)
+        self.gen_outline(border, color='black', surf=self.panel.surf)
         text_rect = text.get_rect(topleft=topleft + pg.Vector2(self.outline_padding * 2, self.outline_padding * 2))
-        self.screen.blit(text, text_rect)
+        self.panel.surf.blit(text, text_rect)
 
     def select_category(self) -> None:
         if self.opened:
@@ -169,7 +182,6 @@ class CategoryGrid:
         ]
 
     def update(self) -> None:
-        self.render_grid()
         self.select_category()
 
 
@@ -185,8 +197,13 @@ class ItemGrid:
         self.gen_outline = craft_window.gen_outline
         self.render_inv_item_name = craft_window.render_inv_item_name
         self.get_scaled_image = craft_window.get_scaled_image
+        self.render_item_amount = craft_window.render_item_amount
+        self.craftability = craft_window.craftability
         self.craft_item = craft_item
         self.top_pt = top_pt
+        self.panel = craft_window.panel
+        self.selected_category = None
+        self.item_rects = [] # (screen rect, item name) of the icons on the panel
         
         self.cell_width = self.cell_height = TILE_SIZE * 2
         self.x_cells = self.window_outline_rect.width // self.cell_width
@@ -194,6 +211,9 @@ class ItemGrid:
         self.left = self.window_outline_rect.left + self.left_padding
 
     def render_item_slots(self) -> None: # not defining these in __init__ since they rely on the selected category
+        self.item_rects.clear()
+        if not self.selected_category:
+            return
         self.num_slots = len(self.categories[self.selected_category])
         for x in range(self.x_cells):
             for y in range(ceil(self.num_slots / self.x_cells)):
@@ -203,11 +223,21 @@ class ItemGrid:
                         self.left + (self.cell_width * x), self.top_pt + (self.cell_height * y), 
                         self.cell_width - 1, self.cell_height - 1
                     )
-                    rect = pg.draw.rect(self.screen, 'black', cell, 1)
+                    pg.draw.rect(self.panel.surf, 'black', self.panel.to_local(cell), 1)
                     self.render_item_images(index, x, y)
 
+    def get_count(self, item_name: str) -> int | None:
+        '''tools & chests have 1 cell but are indexed per material (e.g 'stone pickaxe'), so they show their most craftable material'''
+        data = self.categories[self.selected_category][item_name]
+        if not isinstance(data, dict) or 'recipe' in data:
+            return self.craftability.get_count(item_name)
+        counts = [self.craftability.get_count(f'{material} {item_name}') for material in data.get('materials', data)]
+        counts = [count for count in counts if count is not None]
+        return max(counts) if counts else None
+
     def render_item_images(self, index: int, x: int, y: int) -> None:
         item_name = list(self.categories[self.selected_category].keys())[index]
+        count = self.get_count(item_name)
         if item_name == 'pipe':
             item_name += ' 0' # add the default pipe index
         try:
@@ -215,13 +245,18 @@ class ItemGrid:
                 image = self.graphics[item_name]
                 padding = 2
                 scaled_image = self.get_scaled_image(image, item_name, self.cell_width, self.cell_height, padding)
+                if count == 0:
+                    scaled_image = scaled_image.copy() # the atlas image is shared
+                    scaled_image.set_alpha(100)
                 rect = scaled_image.get_rect(center = (
                     self.left + (self.cell_width * x) + (self.cell_width // 2), 
                     self.top_pt + (self.cell_height * y) + (self.cell_height // 2)
                 ))
-                self.screen.blit(scaled_image, rect)
-                self.render_inv_item_name(rect, item_name)
-                self.get_selected_item(rect, item_name)
+                self.panel.surf.blit(scaled_image, self.panel.to_local(rect))
+                if count is not None:
+                    cell_corner = (self.left + (self.cell_width * (x + 1)), self.top_pt + (self.cell_height * (y + 1)))
+                    self.render_item_amount(count, self.panel.to_local(cell_corner) - pg.Vector2(5, 5), surf=self.panel.surf)
+                self.item_rects.append((rect, item_name))
         except KeyError:
             pass
     
@@ -231,5 +266,6 @@ class ItemGrid:
             self.craft_item(item_name, item_data['recipe'], self.player)
 
     def update(self) -> None:
-        if self.selected_category:
-            self.render_item_slots()
\ No newline at end of file
+        for rect, item_name in self.item_rects:
+            self.render_inv_item_name(rect, item_name)
+            self.get_selected_item(rect, item_name)
\ No newline at end of file
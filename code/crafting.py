@@ -1,4 +1,12 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from inventory import SpriteInventory
+
 import pygame as pg
+from collections import defaultdict
+
+from settings import TOOLS, MATERIALS, PRODUCTION, LOGISTICS, ELECTRICITY, STORAGE, RESEARCH
 
 class Crafting:
     @staticmethod
@@ -8,4 +16,51 @@ class Crafting:
         if all(inv.contents.get(item, {}).get('amount', 0) >= amt for item, amt in recipe):
             for item, amt in recipe:
                 inv.remove_item(item, amt)
-            inv.add_item(name)
\ No newline at end of file
+            inv.add_item(name)
+
+
+class CraftabilityIndex:
+    '''how many times each recipe can be crafted from an inventory, only the recipes using a changed item are recounted'''
+    def __init__(self, inventory: SpriteInventory):
+        self.recipes = self.get_recipes()
+        self.recipes_using = defaultdict(list) # {ingredient: [products whose recipe includes it]}
+        for name, recipe in self.recipes.items():
+            for item in recipe:
+                self.recipes_using[item].append(name)
+        self.amounts = {item: data['amount'] for item, data in inventory.contents.items()}
+        self.counts = {name: self.calc_count(recipe) for name, recipe in self.recipes.items()}
+        self.version = 0 # incremented whenever a count changes
+        inventory.add_listener(self.update_item)
+
+    @staticmethod
+    def get_recipes() -> dict[str, dict[str, int]]:
+        '''flatten the recipe tables into {product name: recipe}'''
+        recipes = {}
+        for category in (MATERIALS, PRODUCTION, LOGISTICS, ELECTRICITY, RESEARCH):
+            for name, data in category.items():
+                if data['recipe']:
+                    recipes[name] = data['recipe']
+        for tool, materials in TOOLS.items(): # e.g 'stone pickaxe'
+            for material, data in materials.items():
+                recipes[f'{material} {tool}'] = data['recipe']
+        for material, data in STORAGE['chest']['materials'].items():
+            recipes[f'{material} chest'] = data['recipe']
+        return recipes
+
+    def calc_count(self, recipe: dict[str, int]) -> int:
+        return min(self.amounts.get(item, 0) // amount for item, amount in recipe.items())
+
+    def update_item(self, item: str, amount: int) -> None:
+        if amount > 0:
+            self.amounts[item] = amount
+        else:
+            self.amounts.pop(item, None)
+        for name in self.recipes_using.get(item, ()):
+            count = self.calc_count(self.recipes[name])
+            if count != self.counts[name]:
+                self.counts[name] = count
+                self.version += 1
+
+    def get_count(self, name: str) -> int | None:
+        '''None for items without a recipe'''
+        return self.counts.get(name)
@@ -38,7 +38,7 @@ class DrillUI(MachineUI):
         self.box_len = 40
         self.ore_names = list(self.machine.ore_data.keys())
         self.num_ores = len(self.ore_names)
-        self.ore_surfs = {k: pg.transform.scale2x(self.graphics[k]) for k in self.ore_names}
+        self.ore_surfs = {k: self.get_icon(self.graphics[k], pg.Vector2(self.graphics[k].get_size()) * 2) for k in self.ore_names}
         self.select_ui = OreSelectUI(dict(zip(self.machine.ore_data.keys(), [self.machine.ore_data[k]['amount'] for k in self.machine.ore_data])))
 
     def update_inv_rects(self) -> None:
@@ -51,22 +51,27 @@ class DrillUI(MachineUI):
             self.machine.inv.output_slot.rect = pg.Rect(self.bg_rect.midbottom - pg.Vector2(0, self.padding), (self.box_len, self.box_len))
         self.select_ui.rect = pg.Rect(self.bg_rect.midtop - pg.Vector2(self.select_ui.box_len // 2, -self.padding), (self.select_ui.box_len, self.select_ui.box_len))
 
+    def get_preview_alpha(self) -> int | None:
+        '''fade in a preview of the ore as it's extracted for the 1st time'''
+        if self.machine.target_ore and not self.machine.inv.output_slot.amount:
+            return 155 + int(self.machine.get_pct())
+        return None
+
     def render_ore_select_ui(self) -> None:
-        self.gen_outline(self.select_ui.rect)
+        surf, select_rect = self.panel.surf, self.panel.to_local(self.select_ui.rect)
+        self.gen_outline(select_rect, surf=surf)
         name = self.ore_names[self.select_ui.idx]
-        if not self.machine.target_ore:
-            self.update_target_ore() 
-        elif not self.machine.inv.output_slot.amount: # fade in a preview of the ore as it's extracted for the 1st time
+        if (preview_alpha := self.get_preview_alpha()) is not None:
             ore_preview_surf = self.graphics[name].copy()
-            ore_preview_surf.set_alpha(155 + int(self.machine.alarms['extract'].pct))
-            self.screen.blit(ore_preview_surf, ore_preview_surf.get_rect(center=self.machine.inv.output_slot.rect.center))
+            ore_preview_surf.set_alpha(preview_alpha)
+            surf.blit(ore_preview_surf, ore_preview_surf.get_rect(center=self.panel.to_local(self.machine.inv.output_slot.rect.center)))
         ore_surf = self.ore_surfs[name] 
-        self.screen.blit(ore_surf, ore_surf.get_rect(center=self.select_ui.rect.center))
-        name_surf = self.fonts['item label small'].render(name, True, self.colors['text'])
-        name_rect = name_surf.get_rect(midtop=self.select_ui.rect.midbottom + pg.Vector2(0, self.padding // 2))
-        self.screen.blit(name_surf, name_rect) 
-        amount_surf = self.fonts['item label small'].render(f'available: {self.machine.ore_data[name]["amount"]}', True, self.colors['text'])
-        self.screen.blit(amount_surf, amount_surf.get_rect(midtop=name_rect.midbottom))
+        surf.blit(ore_surf, ore_surf.get_rect(center=select_rect.center))
+        name_surf = self.render_text(self.fonts['item label small'], name, True, self.colors['text'])
+        name_rect = name_surf.get_rect(midtop=select_rect.midbottom + pg.Vector2(0, self.padding // 2))
+        surf.blit(name_surf, name_rect) 
+        amount_surf = self.render_text(self.fonts['item label small'], f'available: {self.machine.ore_data[name]["amount"]}', True, self.colors['text'])
+        surf.blit(amount_surf, amount_surf.get_rect(midtop=name_rect.midbottom))
 
     def update_target_ore(self) -> None:
         if self.keyboard.pressed_keys[pg.K_RIGHT]:
@@ -78,16 +83,24 @@ class DrillUI(MachineUI):
             self.machine.target_ore = ore
             self.machine.num_ore_available = self.machine.ore_data[ore]['amount']
 
-    def render_interface(self) -> None:
-        self.update_bg_rect()
-        if self.rect_in_sprite_radius(self.player, self.bg_rect, rect_world_space=False):
-            self.gen_bg(self.bg_rect, color='black', transparent=True) 
-            self.gen_outline(self.bg_rect)
-            self.render_inv()
-            self.render_ore_select_ui()
-            if self.machine.target_ore:
-                self.render_progress_bar(self.machine.inv.output_slot.rect, self.machine.alarms['extract'].pct, color=self.colors['progress bar'])
-                if self.machine.variant == 'burner':
-                    self.render_progress_bar(self.machine.inv.input_slots['fuel'].rect, self.machine.alarms['burn fuel'].pct, color=self.colors['progress bar'])
-        else:
-            self.render = False
\ No newline at end of file
+    def check_panel_input(self) -> None:
+        if not self.machine.target_ore:
+            self.update_target_ore()
+
+    def get_panel_key(self) -> tuple:
+        name = self.ore_names[self.select_ui.idx]
+        progress = None
+        if self.machine.target_ore:
+            progress = (self.get_progress_width(self.machine.get_pct()), self.get_progress_width(self.machine.get_fuel_pct()))
+        return (*super().get_panel_key(), self.select_ui.idx, self.machine.ore_data[name]['amount'], self.get_preview_alpha(), progress)
+
+    def render_panel(self) -> None:
+        bg_rect = self.panel.to_local(self.bg_rect)
+        self.gen_bg(bg_rect, color='black', transparent=True, surf=self.panel.surf) 
+        self.gen_outline(bg_rect, surf=self.panel.surf)
+        self.render_inv()
+        self.render_ore_select_ui()
+        if self.machine.target_ore:
+            self.render_progress_bar(self.machine.inv.output_slot.rect, self.machine.get_pct(), color=self.colors['progress bar'])
+            if self.machine.variant == 'burner':
+                self.render_progress_bar(self.machine.inv.input_slots['fuel'].rect, self.machine.get_fuel_pct(), color=self.colors['progress bar'])
\ No newline at end of file
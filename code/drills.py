@@ -11,12 +11,13 @@ from collections import Counter
 from random import choice
 from abc import ABC
 
-from alarm import Alarm
 from drill_ui import DrillUI
-from machine_sprite_base import Machine, MachineInventory, MachineInventorySlot
+from machine_sprite_base import MachineInventory
+from machine_table import MachineTable, TableMachine
+from tile_edits import tile_edits
 from settings import TILE_SIZE, TILE_ORE_RATIO, MAP_SIZE, RES, Z_LAYERS
 
-class Drill(Machine, ABC):
+class Drill(TableMachine, ABC):
     def __init__(
         self, 
         xy: tuple[int, int], 
@@ -33,16 +34,20 @@ class Drill(Machine, ABC):
         rect_in_sprite_radius: callable, 
         save_data: dict[str, any], 
         names_to_ids: dict[str, int], 
-        ids_to_names: dict[int, str]
+        ids_to_names: dict[int, str],
+        machine_table: MachineTable
     ):
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui,
-            rect_in_sprite_radius, save_data
+            rect_in_sprite_radius, save_data, machine_table
         )
         self.names_to_ids= names_to_ids
         self.ids_to_names = ids_to_names
 
-        self.inv = MachineInventory(input_slots=None) # only burners have an input slot (for fuel)
+        self.inv = MachineInventory(input_slots=None, output_slot=self.get_slot('output')) # only burners have an input slot (for fuel)
+        self.machine_table.capacity[self.row] = self.inv.output_slot.max_capacity
+        if save_data:
+            self.load_slot(self.inv.output_slot, save_data['output'])
         min_x, max_x = self.rect.left // TILE_SIZE, self.rect.right // TILE_SIZE
         min_y = self.rect.bottom // TILE_SIZE
         max_y = min_y + min(MAP_SIZE[1] - min_y, RES[1] // 4)
@@ -55,7 +60,15 @@ class Drill(Machine, ABC):
         self.ore_col = save_data['ore col'] if save_data else 0
         self.ore_row = save_data['ore row'] if save_data else 0
         self.extract_time_factor = 1.05 # extraction times increase as the drill moves deeper into the ground
-        self.alarms = {'extract': Alarm(2000 * self.speed_factor * self.extract_time_factor * (self.ore_row + 1), self.extract, loop=True, track_pct=True)}
+        self.machine_table.length[self.row] = 2000 * self.speed_factor * self.extract_time_factor * (self.ore_row + 1)
+
+    @property
+    def num_ore_available(self) -> int:
+        return int(self.machine_table.input[self.row])
+
+    @num_ore_available.setter
+    def num_ore_available(self, amount: int) -> None:
+        self.machine_table.input[self.row] = amount
 
     def get_ore_data(self) -> dict[str, int]:
         ore_data = {
@@ -66,22 +79,22 @@ class Drill(Machine, ABC):
             ore_data[k]['locations'] = np.argwhere(self.map_slice == self.names_to_ids[k])
         return ore_data
 
-    def extract(self) -> None:
-        self.num_ore_available -= 1
+    def complete_cycle(self, num_cycles: int) -> None:
+        '''the table has already moved num_cycles ores from the ground to the output'''
         if not self.num_ore_available:
             self.convert_tile(self.ore_xy)
-        self.inv.output_slot.amount += 1
         if not self.inv.output_slot.item:
             self.inv.output_slot.item = self.target_ore
         if self.ore_col % self.span_x == 0:
-            self.ore_row += 1
-            self.alarms['extract'].length *= self.extract_time_factor
+            self.ore_row += num_cycles
+            self.machine_table.length[self.row] *= self.extract_time_factor ** num_cycles
 
     def convert_tile(self, tile_xy: tuple[int, int]) -> None: 
         if dirs := self.get_neighbor_dirs(tile_xy):
             neighbor_id_counter = Counter(self.tile_map[tile_xy + xy] for xy in dirs)
         else:
             self.tile_map[tile_xy] = self.names_to_ids['air']
+            tile_edits.mark(tile_xy)
             return
         (ids, freqs) = zip(*neighbor_id_counter.most_common())
         f0, f1, f2, f3 = (list(freqs) + [0, 0, 0])[:4] # adding zeros to follow in case the original list has less than 4 elements
@@ -91,6 +104,7 @@ class Drill(Machine, ABC):
             self.tile_map[tile_xy] = choice(ids[:2])
         else: # all indices store different tiles
             self.tile_map[tile_xy] = choice(ids)
+        tile_edits.mark(tile_xy)
 
     def get_neighbor_dirs(self, tile_xy: tuple[int, int]) -> list[tuple[int, int]]:
         dirs = [(0, -1), (1, 0), (0, 1), (-1, 0)]
@@ -107,29 +121,6 @@ class Drill(Machine, ABC):
             dirs.remove((0, 1))
         return dirs
 
-    def get_active_state(self) -> bool:
-        conditions = self.inv.input_slots['fuel'].item and self.inv.output_slot.amount < self.max_capacity['output'] # TODO: the fuel condition will have to be updated for the electric drill
-        if not self.active:
-            if conditions:
-                self.active = True
-        elif not conditions:
-            self.active = False
-            self.alarms.clear()
-        return self.active
-    
-    def update(self, dt: float) -> None:
-        if self.target_ore and self.get_active_state():
-            if self.alarms['extract'].running: 
-                self.alarms['extract'].update()
-            else:
-                self.alarms['extract'].start()
-            if self.variant == 'burner':
-                if self.alarms['burn fuel'].running:
-                    self.alarms['burn fuel'].update()
-                else:
-                    self.alarms['burn fuel'].start()
-        self.ui.update()
-        
     def get_save_data(self) -> dict[str, list|dict]:
         return {
             'xy': list(self.rect.topleft),
@@ -139,7 +130,8 @@ class Drill(Machine, ABC):
             'num ore available': self.num_ore_available,
             'ore col': self.ore_col,
             'ore row': self.ore_row,
-            'output': self.output
+            'fuel input': self.get_slot_save_data(self.inv.input_slots['fuel'] if self.inv.input_slots else None),
+            'output': self.get_slot_save_data(self.inv.output_slot)
         }
 
 
@@ -160,25 +152,23 @@ class BurnerDrill(Drill):
         rect_in_sprite_radius: callable, 
         save_data: dict[str, any], 
         names_to_ids: dict[str, int], 
-        ids_to_names: dict[int, str]
+        ids_to_names: dict[int, str],
+        machine_table: MachineTable
     ):
         self.speed_factor = 1
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui,
-            rect_in_sprite_radius, save_data, names_to_ids, ids_to_names
+            rect_in_sprite_radius, save_data, names_to_ids, ids_to_names, machine_table
         )
         self.variant = 'burner'
         self.fuel_sources = {'wood': {'capacity': 99, 'burn speed': 3000}, 'coal': {'capacity': 99, 'burn speed': 6000}}
         self.max_capacity = {'fuel': 50, 'output': 99}
-        self.inv.input_slots = {'fuel': MachineInventorySlot(valid_inputs=self.fuel_sources.keys(), max_capacity=self.max_capacity['fuel'])}
-        self.alarms['burn fuel'] = Alarm(2000 * self.speed_factor * self.extract_time_factor * (self.ore_row + 1), self.burn_fuel, loop=True, track_pct=True)
+        self.inv.input_slots = {'fuel': self.get_slot('fuel', valid_inputs=self.fuel_sources.keys(), max_capacity=self.max_capacity['fuel'])}
+        if save_data:
+            self.load_slot(self.inv.input_slots['fuel'], save_data['fuel input'])
+        self.machine_table.fuel_length[self.row] = 2000 * self.speed_factor * self.extract_time_factor * (self.ore_row + 1)
         self.init_ui(DrillUI)
 
-    def burn_fuel(self) -> None:
-        self.inv.input_slots['fuel'].amount -= 1
-        if not self.inv.input_slots['fuel'].amount:
-            self.self.inv.input_slots['fuel'].item = None
-
 class ElectricDrill(Drill):
     def __init__(
         self, 
@@ -196,12 +186,13 @@ class ElectricDrill(Drill):
         rect_in_sprite_radius: callable, 
         save_data: dict[str, any], 
         names_to_ids: dict[str, int], 
-        ids_to_names: dict[int, str]
+        ids_to_names: dict[int, str],
+        machine_table: MachineTable
     ):
         self.speed_factor = 1.5
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui,
-            rect_in_sprite_radius, save_data, names_to_ids, ids_to_names
+            rect_in_sprite_radius, save_data, names_to_ids, ids_to_names, machine_table
         )
         self.variant = 'electric'
         self.fuel_sources = {'electric poles'}
@@ -33,19 +33,22 @@ class FurnaceUI(MachineUI):
         if self.machine.variant == 'burner': 
             self.machine.inv.input_slots['fuel'].rect = pg.Rect(self.bg_rect.bottomleft - pg.Vector2(-self.padding, self.box_len + self.padding), (self.box_len, self.box_len))
         
-    def render_interface(self) -> None:
-        self.update_bg_rect()
-        if self.rect_in_sprite_radius(self.player, self.bg_rect, rect_world_space=False):
-            self.gen_bg(self.bg_rect, transparent=True) 
-            self.gen_outline(self.bg_rect)
-            self.render_inv()
-            self.screen.blit(self.right_arrow_surf, self.right_arrow_surf.get_rect(center=self.bg_rect.center))
+    def get_panel_key(self) -> tuple:
+        progress = None
+        if self.machine.active:
+            progress = (self.get_progress_width(self.machine.get_pct()), self.get_progress_width(self.machine.get_fuel_pct()))
+        return (*super().get_panel_key(), progress)
+
+    def render_panel(self) -> None:
+        surf, bg_rect = self.panel.surf, self.panel.to_local(self.bg_rect)
+        self.gen_bg(bg_rect, transparent=True, surf=surf) 
+        self.gen_outline(bg_rect, surf=surf)
+        self.render_inv()
+        surf.blit(self.right_arrow_surf, self.right_arrow_surf.get_rect(center=bg_rect.center))
+        if self.machine.variant == 'burner':
+            offset = pg.Vector2(0, (self.machine.inv.input_slots['fuel'].rect.top - self.machine.inv.input_slots['smelt'].rect.bottom) // 2)
+            surf.blit(self.fuel_icon, self.fuel_icon.get_rect(center=self.panel.to_local(self.machine.inv.input_slots['smelt'].rect.midbottom) + offset))
+        if self.machine.active:
+            self.render_progress_bar(self.machine.inv.input_slots['smelt'].rect, self.machine.get_pct())
             if self.machine.variant == 'burner':
-                offset = pg.Vector2(0, (self.machine.inv.input_slots['fuel'].rect.top - self.machine.inv.input_slots['smelt'].rect.bottom) // 2)
-                self.screen.blit(self.fuel_icon, self.fuel_icon.get_rect(center=self.machine.inv.input_slots['smelt'].rect.midbottom + offset))
-            if self.machine.active and 'smelt' in self.machine.alarms:
-                self.render_progress_bar(self.machine.inv.input_slots['smelt'].rect, self.machine.alarms['smelt'].percent)
-                if self.machine.variant == 'burner':
-                    self.render_progress_bar(self.machine.inv.input_slots['fuel'].rect, self.machine.alarms['fuel'].percent)
-        else:
-            self.render = False
\ No newline at end of file
+                self.render_progress_bar(self.machine.inv.input_slots['fuel'].rect, self.machine.get_fuel_pct())
\ No newline at end of file
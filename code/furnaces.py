@@ -10,12 +10,12 @@ import pygame as pg
 from dataclasses import dataclass, field
 from abc import ABC
 
-from machine_sprite_base import Machine, MachineInventory, MachineInventorySlot
+from machine_sprite_base import MachineInventory
+from machine_table import MachineTable, TableMachine
 from furnace_ui import FurnaceUI
-from alarm import Alarm
 from settings import Z_LAYERS, PRODUCTION
 
-class Furnace(Machine, ABC):
+class Furnace(TableMachine, ABC):
     def __init__(
         self, 
         xy: pg.Vector2, 
@@ -30,11 +30,12 @@ class Furnace(Machine, ABC):
         obj_map: np.ndarray, 
         ui: UI,
         rect_in_sprite_radius: callable, 
-        save_data: dict[str, any]
+        save_data: dict[str, any],
+        machine_table: MachineTable
     ):  
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui, 
-            rect_in_sprite_radius, save_data
+            rect_in_sprite_radius, save_data, machine_table
         )
         self.can_smelt = {
             'copper': {'speed': 3000, 'output': 'copper plate'}, 
@@ -43,63 +44,40 @@ class Furnace(Machine, ABC):
         }
         self.inv = MachineInventory(
             input_slots={
-                'fuel': MachineInventorySlot(valid_inputs=self.fuel_sources.keys()), 
-                'smelt': MachineInventorySlot(valid_inputs=self.can_smelt.keys())
-            }
+                'fuel': self.get_slot('fuel', valid_inputs=self.fuel_sources.keys()), 
+                'smelt': self.get_slot('input', valid_inputs=self.can_smelt.keys(), on_item_change=self.update_cycle)
+            },
+            output_slot=self.get_slot('output', on_item_change=self.update_cycle)
         )
-        self.alarms = {}
-
-    def update_active_state(self) -> None:
-        self.active = self.inv.input_slots['smelt'].item and self.inv.input_slots['fuel'].item and \
-        self.inv.output_slot.amount < self.inv.output_slot.max_capacity
-        if not self.active:
-            self.alarms.clear()
-    
-    def smelt(self) -> None:
-        if not self.alarms:
-            self.alarms['smelt'] = Alarm(
-                length=self.can_smelt[self.inv.input_slots['smelt'].item]['speed'] // self.speed_factor, 
-                fn=self.update_inv_slot, 
-                auto=True, 
-                loop=True, 
-                track_pct=True, 
-                smelt=True
-            )
-            self.alarms['smelt'].start()
-            if self.variant == 'burner':
-                self.alarms['fuel'] = Alarm(
-                    length=self.can_smelt[self.inv.input_slots['smelt'].item]['speed'] // self.speed_factor, 
-                    fn=self.update_inv_slot, 
-                    auto=True, 
-                    loop=True, 
-                    track_pct=True, 
-                    smelt=True, 
-                    fuel=True
-                )
-                self.alarms['fuel'].start()
-        for alarm in self.alarms.values():
-            alarm.update()
+        self.update_cycle()
+        if save_data:
+            for key, slot in zip(('fuel input', 'smelt input', 'output'), self.inv):
+                self.load_slot(slot, save_data[key])
 
-    def update_inv_slot(self, smelt: bool=False, fuel: bool=False) -> None:
-        data = self.inv.input_slots['smelt' if smelt or self.variant != 'burner' else 'fuel']
-        data.amount -= 1
-        if not data.amount:
-            data.item = None
-            self.active = False
-        if smelt and data.item:
-            output_item = self.can_smelt[data.item]['output']
-            if not self.inv.output_slot.item:
-                self.inv.output_slot.item = output_item
-            self.inv.output_slot.amount += 1
+    def update_cycle(self) -> None:
+        '''the smelting time depends on the item & an output slot holding something else blocks the furnace'''
+        smelt, output = self.inv.input_slots['smelt'], self.inv.output_slot
+        data = self.can_smelt.get(smelt.item)
+        length = data['speed'] // self.speed_factor if data else 0
+        self.machine_table.length[self.row] = length
+        self.machine_table.fuel_length[self.row] = length if self.variant == 'burner' else 0 # 1 fuel is burned per item smelted
+        blocked = data and output.item not in {None, data['output']}
+        self.machine_table.capacity[self.row] = 0 if blocked else output.max_capacity
 
-    def get_save_data(self) -> dict[str, list|str]:
-        return {'xy': list(self.rect.topleft), 'smelt input': self.smelt_input, 'fuel input': self.fuel_input, 'output': self.output}
+    def complete_cycle(self, num_cycles: int) -> None:
+        smelt, output = self.inv.input_slots['smelt'], self.inv.output_slot
+        if not output.item:
+            output.item = self.can_smelt[smelt.item]['output']
+        if not smelt.amount:
+            smelt.item = None
 
-    def update(self, dt: float) -> None:
-        self.ui.update()
-        self.update_active_state()
-        if self.active:
-            self.smelt()
+    def get_save_data(self) -> dict[str, list|dict]:
+        return {
+            'xy': list(self.rect.topleft), 
+            'smelt input': self.get_slot_save_data(self.inv.input_slots['smelt']), 
+            'fuel input': self.get_slot_save_data(self.inv.input_slots['fuel']), 
+            'output': self.get_slot_save_data(self.inv.output_slot)
+        }
         
             
 class BurnerFurnace(Furnace):
@@ -117,17 +95,17 @@ class BurnerFurnace(Furnace):
         obj_map: np.ndarray, 
         ui: UI,
         rect_in_sprite_radius: callable, 
-        save_data: dict[str, any]
+        save_data: dict[str, any],
+        machine_table: MachineTable
     ):  
         self.fuel_sources = {'wood': {'capacity': 99, 'burn speed': 2000}, 'coal': {'capacity': 99, 'burn speed': 4000}}
-        print(rect_in_sprite_radius)
+        self.variant = 'burner' # assigned before the table row's cycle length is set
+        self.speed_factor = 1
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui, 
-            rect_in_sprite_radius, save_data
+            rect_in_sprite_radius, save_data, machine_table
         )
-        self.variant = 'burner'
         self.recipe = PRODUCTION['burner furnace']['recipe']
-        self.speed_factor = 1
         self.init_ui(FurnaceUI)
 
 
@@ -146,13 +124,15 @@ class SteelFurnace(Furnace):
         obj_map: np.ndarray, 
         ui: UI,
         rect_in_sprite_radius: callable, 
-        save_data: dict[str, any]
+        save_data: dict[str, any],
+        machine_table: MachineTable
     ):  
+        self.variant = 'steel'
+        self.speed_factor = 2
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui, 
-            rect_in_sprite_radius, save_data
+            rect_in_sprite_radius, save_data, machine_table
         )
-        self.variant = 'steel'
         self.recipe = MACHINES['steel furnace']['recipe']
         self.fuel_sources = {
             'non-electric': {
@@ -161,7 +141,6 @@ class SteelFurnace(Furnace):
             },
             'electric': {'electric poles'}
         }
-        self.speed_factor = 2
         self.init_ui(FurnaceUI)
 
 
@@ -180,15 +159,16 @@ class ElectricFurnace(Furnace):
         obj_map: np.ndarray, 
         ui: UI,
         rect_in_sprite_radius: callable, 
-        save_data: dict[str, any]
+        save_data: dict[str, any],
+        machine_table: MachineTable
     ):  
+        self.variant = 'electric'
+        self.speed_factor = 2.5
         super().__init__(
             xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui, 
-            rect_in_sprite_radius, save_data
+            rect_in_sprite_radius, save_data, machine_table
         )
-        self.variant = 'electric'
         self.recipe = MACHINES['electric furnace']['recipe']
         self.inv = Inventory(input_slots={'smelt': InvSlot(valid_inputs=self.can_smelt.keys())})
         self.fuel_sources = {'electric poles'}
-        self.speed_factor = 2.5
         self.init_ui(FurnaceUI)
\ No newline at end of file
@@ -7,20 +7,28 @@ if TYPE_CHECKING:
     from sprite_manager import SpriteManager
     from chunk_manager import ChunkManager
     from input_manager import Mouse
+    from render_queue import RenderQueue
     
 import pygame as pg
+import numpy as np
 from os import walk
 from os.path import join
 from math import ceil, floor, sin
 from random import randint
+from dataclasses import dataclass
+from collections import defaultdict
 
 from settings import *
 from weather import Weather
+from lighting import Lighting
+from surface_cache import SurfaceCache, RotationCache
+from sprite_groups import ANIMATED, COLONIST
 
 class GraphicsEngine:
     def __init__(
         self, 
         screen: pg.Surface, 
+        render_queue: RenderQueue,
         cam: Camera, 
         graphics: dict[str, list[pg.Surface]], 
         ui: UI, 
@@ -32,6 +40,7 @@ class GraphicsEngine:
         save_data: dict[str, any]
     ):
         self.screen = screen
+        self.render_queue = render_queue
         self.cam = cam
         self.graphics = graphics
         self.ui = ui
@@ -45,6 +54,7 @@ class GraphicsEngine:
         
         self.terrain = Terrain(
             self.screen, 
+            self.render_queue,
             self.graphics, 
             self.cam.offset, 
             self.chunk_manager, 
@@ -53,8 +63,10 @@ class GraphicsEngine:
             self.player
         )
 
-        self.tool_animation = ToolAnimation(self.screen, self.render_item_held)
-        self.weather = Weather(self.screen, save_data['weather'] if save_data else None)
+        self.key_cycle_render_scale = self.ui.keyboard.key_bindings['cycle render scale']
+        self.tool_animation = ToolAnimation(self.screen, self.render_item_held, self.sprite_manager.assets['rotation cache'])
+        self.weather = Weather(self.render_queue, save_data['weather'] if save_data else None)
+        self.lighting = Lighting(self.render_queue, self.cam.offset, self.chunk_manager, proc_gen, self.weather.sky)
         # only render an equipped item while the sprite is in a given state
         self.item_render_states = {
             'pickaxe': {'mining', 'fighting'},
@@ -69,41 +81,40 @@ class GraphicsEngine:
             spr.frame_index += spr.animation_speed[spr.state] * dt
             if self.flip_sprite_x(spr):
                 spr.facing_left = not spr.facing_left
-            spr.image = pg.transform.flip(spr.frames[spr.state][int(spr.frame_index % len(spr.frames[spr.state]))], not spr.facing_left, False)
+            frames = spr.frame_sets[spr.facing_left][spr.state]
+            spr.image = frames[int(spr.frame_index % len(frames))]
         else:
-            image = spr.frames['idle'][0]
             # added 'and sprite.facing_left' to prevent flipping left after lifting the right key
-            spr.image = image if not self.flip_sprite_x(spr) and spr.facing_left else pg.transform.flip(image, True, False)
+            spr.image = spr.frame_sets[not self.flip_sprite_x(spr) and spr.facing_left]['idle'][0]
         
     @staticmethod
     def flip_sprite_x(sprite: pg.sprite.Sprite) -> bool:
         return sprite.facing_left and sprite.direction.x > 0 or not sprite.facing_left and sprite.direction.x < 0
         
     def render_sprites(self, dt: float) -> None:
-        for spr in sorted(self.sprite_manager.get_sprites_in_radius(self.player.rect, self.all_sprites), key=lambda spr: spr.z): 
-            self.screen.blit(spr.image, spr.rect.topleft - self.cam.offset)
-            if groups := self.sprite_manager.get_sprite_groups(spr): # the sprite isn't just a member of all_sprites
-                self.render_group_action(groups, spr, dt)
+        rect_in_sprite_radius, player_rect = self.sprite_manager.rect_in_sprite_radius, self.player.rect
+        for spr in self.all_sprites.sprites_by_z(): # already in z order
+            if rect_in_sprite_radius(spr, player_rect):
+                self.render_queue.add('sprites', spr.image, spr.rect.topleft - self.cam.offset)
+                if spr.render_flags: # the sprite isn't just a member of all_sprites
+                    self.render_group_action(spr, dt)
             
-    def render_group_action(self, groups: set[pg.sprite.Group], sprite: pg.sprite.Sprite, dt: float) -> None:
-        if self.animated_sprites in groups:
+    def render_group_action(self, sprite: pg.sprite.Sprite, dt: float) -> None:
+        if sprite.render_flags & ANIMATED:
             self.animate_sprite(sprite, dt)
         # TODO: this may need to be updated if more sprites can also hold objects
-        if self.colonist_sprites in groups:
-            self.render_item_held(dt)
+        if sprite.render_flags & COLONIST:
+            self.render_item_held(sprite, dt)
 
-    def render_item_held(self, dt: float) -> None:
+    def render_item_held(self, sprite: pg.sprite.Sprite, dt: float) -> None:
         # TODO: this is unfinished
-        for sprite in self.colonist_sprites:
-            if sprite.item_holding:
-                item_category = self.get_item_category(sprite)
-                if item_category:
-                    if item_category in self.item_render_states.keys() and sprite.state in self.item_render_states[item_category]:
-                        image = pg.transform.flip(self.graphics[item_category][sprite.item_holding], sprite.facing_left, False)
-                        image_frame = self.get_item_animation(sprite, item_category, image, dt) # get the item's animation when in use
-                        coords = sprite.rect.center - self.cam.offset + self.get_item_offset(item_category, sprite.facing_left)
-                        rect = image_frame.get_rect(center = coords) if image_frame else image.get_rect(center = coords)
-                        self.screen.blit(image_frame if image_frame else image, rect)
+        if sprite.item_holding:
+            item_category = self.get_item_category(sprite)
+            if item_category:
+                if item_category in self.item_render_states.keys() and sprite.state in self.item_render_states[item_category]:
+                    image = self.get_item_animation(sprite, item_category, self.graphics[item_category][sprite.item_holding], dt) # get the item's animation when in use
+                    coords = sprite.rect.center - self.cam.offset + self.get_item_offset(item_category, sprite.facing_left)
+                    self.render_queue.add('sprites', image, image.get_rect(center = coords))
 
     @staticmethod
     def get_item_category(sprite: pg.sprite.Sprite) -> str:
@@ -113,9 +124,8 @@ class GraphicsEngine:
         match category:
             case 'pickaxe' | 'axe':
                 if sprite.state in {'mining', 'chopping'}:
-                    image = self.tool_animation.get_rotation(sprite, image, dt)
-                    return image
-        return image
+                    return self.tool_animation.get_rotation(sprite, image, dt)
+        return self.tool_animation.rotation_cache.get_rotation(image, 0, sprite.facing_left)
     
     @staticmethod
     def get_item_offset(category, facing_left: bool) -> pg.Vector2:
@@ -126,11 +136,22 @@ class GraphicsEngine:
             case 'axe':
                 return pg.Vector2(2 if facing_left else -2, -4)
 
+    def set_render_scale(self, scale: int) -> None:
+        self.cam.set_scale(scale)
+        self.render_queue.set_scale(scale, self.cam.view_size)
+        self.ui.mouse.render_scale = scale
+
     def update(self, dt: float) -> None:
+        if self.ui.keyboard.pressed_keys[self.key_cycle_render_scale]:
+            self.set_render_scale(RENDER_SCALES[(RENDER_SCALES.index(self.cam.scale) + 1) % len(RENDER_SCALES)])
         self.cam.update(pg.Vector2(self.player.rect.center))
+        self.chunk_manager.update()
         self.weather.update() # update the weather before the terrain to keep the sky behind the rest of the world
         self.terrain.update(self.player.current_biome)
         self.render_sprites(dt)
+        self.terrain.render_water()
+        self.lighting.update()
+        self.render_queue.present() # keep the world below the ui
         self.ui.update()
         
 
@@ -138,18 +159,29 @@ class Camera:
     def __init__(self, center: pg.Vector2): 
         self.center = center
         self.offset = pg.Vector2()
-        self.max_x, self.max_y = (MAP_SIZE[0] * TILE_SIZE) - (RES[0] // 2), (MAP_SIZE[1] * TILE_SIZE) - (RES[1] // 2)
+        self.view_size = pg.Vector2() # world pixels visible, updated in place so other classes can hold a reference
+        self.set_scale(RENDER_SCALES[0])
+
+    def set_scale(self, scale: int) -> None:
+        self.scale = scale
+        self.view_size.update(RES[0] // scale, RES[1] // scale)
+        self.half_w, self.half_h = int(self.view_size.x) // 2, int(self.view_size.y) // 2
+        self.max_x, self.max_y = (MAP_SIZE[0] * TILE_SIZE) - self.half_w, (MAP_SIZE[1] * TILE_SIZE) - self.half_h
+
+    def world_to_screen(self, xy: tuple[int, int]) -> pg.Vector2:
+        return (pg.Vector2(xy) - self.offset) * self.scale
 
     def update(self, target: pg.Vector2) -> None:
         self.center += (target - self.center) * 0.05
-        self.center = pg.Vector2(max(RES[0] // 2, min(self.center.x, self.max_x)), min(self.center.y, self.max_y)) # not adding a minimum limit until the space biome (if one is to exist) is configured 
-        self.offset.x, self.offset.y = round(self.center.x) - (RES[0] // 2), round(self.center.y) - (RES[1] // 2)
+        self.center = pg.Vector2(max(self.half_w, min(self.center.x, self.max_x)), min(self.center.y, self.max_y)) # not adding a minimum limit until the space biome (if one is to exist) is configured 
+        self.offset.x, self.offset.y = round(self.center.x) - self.half_w, round(self.center.y) - self.half_h
 
 
 class Terrain:
     def __init__(
         self, 
         screen: pg.Surface, 
+        render_queue: RenderQueue,
         graphics: dict[str, list[pg.Surface]], 
         cam_offset: pg.Vector2, 
         chunk_manager: ChunkManager, 
@@ -158,17 +190,25 @@ class Terrain:
         player: Player
     ):
         self.screen = screen
+        self.render_queue = render_queue
         self.graphics = graphics
         self.cam_offset = cam_offset
         self.chunk_manager = chunk_manager
         self.tile_map = proc_gen.tile_map
         self.names_to_ids, self.ids_to_names = proc_gen.names_to_ids, proc_gen.ids_to_names
         self.current_biome, self.biome_order = proc_gen.current_biome, proc_gen.biome_order 
+        self.get_tile_material = proc_gen.get_tile_material
         self.mining_map = mining_map
         self.player = player
         self.biome_x_offsets = {biome: self.biome_order[biome] * BIOME_WIDTH * TILE_SIZE for biome in self.biome_order.keys()}
-        self.biome_transition = BiomeTransition(self.graphics, self.render_bg_imgs)
+        self.biome_transition = BiomeTransition(self.render_bg_imgs)
+        self.bg_strips = {} # {(biome, bg type, layer index): the layer tiled across the screen}
         self.elev_data = self.get_elevation_data()
+        self.chunk_cache = ChunkCache(self.graphics, proc_gen, self.mining_map)
+        self.mining_stage_images = {} # {(tile name, stage): surface}
+        self.terrain_buffer = TerrainBuffer(
+            self.graphics, self.cam_offset, self.chunk_manager.view_size, self.chunk_manager, self.chunk_cache, self.get_mining_stage, self.get_mined_tile_image
+        )
 
     def get_tile_type(self, x: int, y: int) -> str:
         return self.ids_to_names.get(self.tile_map[x, y], 'item extended')
@@ -197,17 +237,31 @@ class Terrain:
         elev_data['landscape base'] = (bottom * TILE_SIZE) - (elev_data['range'] // 2.5)
         return elev_data
 
-    def render_bg_imgs(self, bg_type: str, current_biome: str, imgs_folder: dict[int, pg.Surface] = None) -> None:
+    def get_bg_strip(self, biome: str, bg_type: str, layer_idx: int) -> pg.Surface:
+        '''tile a background layer into a single surface wide (and for the underground, tall) enough to cover the screen'''
+        key = (biome, bg_type, layer_idx)
+        if key not in self.bg_strips:
+            img = self.graphics[biome][bg_type][layer_idx]
+            img_width, img_height = img.get_size()
+            num_imgs_x = ceil(RES[0] / img_width) + 2
+            num_imgs_y = 1 if bg_type == 'landscape' else ceil(RES[1] / img_height) + 1
+            strip = pg.Surface((img_width * num_imgs_x, img_height * num_imgs_y), pg.SRCALPHA)
+            # copy the pixels as-is rather than blending them over the empty strip
+            strip.fblits([(img, (img_width * x, img_height * y)) for x in range(num_imgs_x) for y in range(num_imgs_y)], pg.BLEND_RGBA_MAX)
+            self.bg_strips[key] = strip
+        return self.bg_strips[key]
+
+    def render_bg_imgs(self, bg_type: str, biome: str, alpha: int=255) -> None:
         base_y = self.elev_data['landscape base']
-        if not imgs_folder: # only provided for biome transitions
-            imgs_folder = self.graphics[self.current_biome][bg_type]
+        imgs_folder = self.graphics[biome][bg_type]
         num_layers = len(imgs_folder)
         biome_x_offset = self.biome_x_offsets[self.current_biome]
 
         for i in range(num_layers):
-            img = imgs_folder[i]
-            img_width, img_height = img.get_width(), img.get_height()
-            num_imgs_x = ceil(RES[0] / img_width) + 2
+            strip = self.get_bg_strip(biome, bg_type, i)
+            if strip.get_alpha() != alpha: # only differs during biome transitions, the source images are never modified
+                strip.set_alpha(alpha)
+            img_width, img_height = imgs_folder[i].get_size()
 
             if bg_type == 'landscape':
                 layer_idx = num_layers - i - 1
@@ -215,52 +269,62 @@ class Terrain:
                 parallax_factor = 1.0 if num_layers < 2 else (i + 1) / num_layers
                 scroll_x = self.cam_offset.x * parallax_factor
                 start_x = floor((scroll_x - biome_x_offset) / img_width)
-                for x in range(start_x, start_x + num_imgs_x):
-                    self.screen.blit(img, ((biome_x_offset + x * img_width) - scroll_x, base_y - layer_offset_y - self.cam_offset.y))  
+                self.render_queue.add('bg', strip, ((biome_x_offset + start_x * img_width) - scroll_x, base_y - layer_offset_y - self.cam_offset.y))
             else: # underground
                 start_x = floor((self.cam_offset.x - biome_x_offset) / img_width)
                 dist_y = self.elev_data['underground span']
                 layer_dist_y = ceil(dist_y / num_layers)
                 num_imgs_y = ceil(layer_dist_y / img_height)
-                for x in range(start_x, start_x + num_imgs_x):
-                    for y in range(num_imgs_y):
-                        self.screen.blit(img, (biome_x_offset + (img_width * x), base_y + (img_height * y)) - self.cam_offset)
+                start_y = max(0, floor((self.cam_offset.y - base_y) / img_height)) # skip the rows above the screen
+                num_rows = min(strip.get_height() // img_height, num_imgs_y - start_y)
+                if num_rows > 0:
+                    if num_rows * img_height < strip.get_height(): # the bottom of the fill is on screen
+                        strip = strip.subsurface((0, 0, strip.get_width(), num_rows * img_height))
+                        strip.set_alpha(alpha)
+                    self.render_queue.add('bg', strip, (biome_x_offset + (img_width * start_x), base_y + (img_height * start_y)) - self.cam_offset)
 
     def render_tiles(self) -> None:
-        air_id = self.names_to_ids['air']
-        mining_map_keys = self.mining_map.keys()
-        for coords in self.chunk_manager.update(): # all visible tile coordinates
-            for (x, y) in coords: # individual tile coordinates
-                # ensure that the tile is within the map borders & is a solid tile
-                if 0 <= x < MAP_SIZE[0] and 0 <= y < MAP_SIZE[1] and self.tile_map[x, y] != air_id:
-                    tile = self.get_tile_type(x, y)
-                    if tile in {'water', 'item extended'} or 'inserter' in tile: # not rendering inserters here otherwise the default surface remains after being rotated
-                        continue 
-                    elif tile == 'tree base':
-                        tile = 'dirt' # otherwise the tile at the base of the tree won't be rendered
-                    self.screen.blit(
-                        self.get_mined_tile_image(x, y) if (x, y) in mining_map_keys else self.graphics[tile], 
-                        pg.Vector2(x * TILE_SIZE, y * TILE_SIZE) - self.cam_offset
-                    )
+        self.chunk_cache.update()
+        self.terrain_buffer.update()
+        self.render_queue.add('terrain', self.terrain_buffer.image, (0, 0))
     
     def render_water(self) -> None:
-        water_id = self.names_to_ids['water']
-        for coords in self.chunk_manager.update():
-            for (x, y) in coords:
-                if 0 <= x < MAP_SIZE[0] and 0 <= y < MAP_SIZE[1] and self.tile_map[x, y] == water_id:
-                    self.screen.blit(self.graphics['water'], pg.Vector2(x * TILE_SIZE, y * TILE_SIZE) - self.cam_offset)
-
-    def get_mined_tile_image(self, x: int, y: int) -> None:
-        '''reduce the opacity of a given tile as it's mined away'''
-        tile_image = self.graphics[self.get_tile_type(x, y)].copy()
-        tile_image.set_alpha(170) 
-        return tile_image
+        image = self.graphics['water']
+        xs, ys = np.nonzero(self.chunk_manager.visible_tiles == self.names_to_ids['water'])
+        xs = (xs + self.chunk_manager.min_x) * TILE_SIZE - int(self.cam_offset.x)
+        ys = (ys + self.chunk_manager.min_y) * TILE_SIZE - int(self.cam_offset.y)
+        self.render_queue.extend('water', ((image, xy) for xy in zip(xs.tolist(), ys.tolist())))
+
+    def get_mining_stage(self, x: int, y: int) -> int:
+        base_hardness = TILES[self.get_tile_material(self.tile_map[x, y])]['hardness']
+        damage = 1 - (self.mining_map[x, y]['hardness'] / base_hardness)
+        return min(MINING_STAGES - 1, max(0, int(damage * MINING_STAGES)))
+
+    def get_mined_tile_image(self, x: int, y: int) -> pg.Surface:
+        '''reduce the opacity of a given tile & crack it further as it's mined away'''
+        name = self.get_tile_type(x, y)
+        stage = self.get_mining_stage(x, y)
+        if (name, stage) not in self.mining_stage_images:
+            self.mining_stage_images[name, stage] = self.gen_mining_stage_image(self.graphics[name], stage)
+        return self.mining_stage_images[name, stage]
+
+    @staticmethod
+    def gen_mining_stage_image(image: pg.Surface, stage: int) -> pg.Surface:
+        stage_image = image.copy()
+        w, h = stage_image.get_size()
+        # each stage keeps the previous stage's cracks
+        cracks = (((w // 2, h // 2), (w // 4, 0)), ((w // 2, h // 2), (w - 1, h // 3)), ((w // 2, h // 2), (w // 3, h - 1)), ((w // 2, h // 2), (0, h // 2)))
+        for start, end in cracks[:stage + 1]:
+            pg.draw.line(stage_image, (0, 0, 0, 150), start, end)
+        stage_image.set_alpha(200 - (stage * 30))
+        return stage_image
 
     def get_biome_status(self, current_biome: str) -> None:
         if current_biome != self.current_biome:
             self.biome_transition.previous_biome = self.current_biome
             self.current_biome = current_biome
             self.biome_transition.active = True
+            self.biome_transition.num_steps = 0
             self.elev_data = self.get_elevation_data()
 
     def update(self, current_biome: str) -> None:
@@ -273,61 +337,208 @@ class Terrain:
         self.render_tiles()
 
 
-class BiomeTransition:
-    '''fade the new/old graphics in/out when crossing the border between biomes'''
-    def __init__(self, graphics: dict[str, list[pg.Surface]], render_bg_imgs: callable):
+@dataclass(slots=True)
+class TerrainChunk:
+    image: pg.Surface
+    tile_ids: np.ndarray # copy of the tile map slice the image was drawn from
+    mined_tiles: set[tuple[int, int]] # left out of the image while their mining overlay is rendered
+    large_items: dict[tuple[int, int], str] # {tile coords: graphic name}
+
+
+class ChunkCache:
+    '''pre-renders chunks of tiles into single surfaces, redrawing only the tiles that change'''
+    def __init__(self, graphics: dict[str, pg.Surface], proc_gen: ProcGen, mining_map: dict[tuple[int, int], dict[str, int]]):
         self.graphics = graphics
+        self.tile_map = proc_gen.tile_map
+        self.names_to_ids, self.ids_to_names = proc_gen.names_to_ids, proc_gen.ids_to_names
+        self.mining_map = mining_map
+
+        self.chunk_px = CHUNK_SIZE * TILE_SIZE
+        self.chunks = SurfaceCache(CHUNK_CACHE_MAX_BYTES)
+        self.dirty_rects = [] # world-space areas redrawn since the terrain buffer last checked
+        self.mined_tiles = defaultdict(set) # {chunk coords: tile coords}
+        # inserters aren't rendered here otherwise the default surface remains after being rotated
+        self.skip_ids = {self.names_to_ids[name] for name in self.names_to_ids if name in {'air', 'water', 'item extended'} or 'inserter' in name}
+        self.tile_names = {i: ('dirt' if name == 'tree base' else name) for i, name in self.ids_to_names.items()} # otherwise the tile at the base of the tree won't be rendered
+
+    def get_chunk(self, cx: int, cy: int) -> TerrainChunk:
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self.bake_chunk(cx, cy)
+        else:
+            self.refresh_chunk(cx, cy, chunk)
+        return chunk
+
+    def bake_chunk(self, cx: int, cy: int) -> TerrainChunk:
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+        tile_ids = self.tile_map[x0:x0 + CHUNK_SIZE, y0:y0 + CHUNK_SIZE].copy()
+        chunk = TerrainChunk(pg.Surface((self.chunk_px, self.chunk_px), pg.SRCALPHA), tile_ids, set(self.mined_tiles[cx, cy]), {})
+        blit_seq = []
+        for x, y in zip(*np.nonzero(~np.isin(tile_ids, tuple(self.skip_ids)))):
+            xy = (x0 + int(x), y0 + int(y))
+            if xy not in chunk.mined_tiles and (image := self.get_tile_image(chunk, xy, tile_ids[x, y])):
+                blit_seq.append((image, (int(x) * TILE_SIZE, int(y) * TILE_SIZE)))
+        chunk.image.blits(blit_seq, doreturn=False)
+        self.chunks.add((cx, cy), chunk, self.chunks.get_surf_bytes(chunk.image) + tile_ids.nbytes)
+        return chunk
+
+    def refresh_chunk(self, cx: int, cy: int, chunk: TerrainChunk) -> None:
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+        tile_ids = self.tile_map[x0:x0 + CHUNK_SIZE, y0:y0 + CHUNK_SIZE]
+        changed = {(x0 + int(x), y0 + int(y)) for x, y in np.argwhere(tile_ids != chunk.tile_ids)}
+        mined_tiles = self.mined_tiles[cx, cy]
+        changed |= chunk.mined_tiles ^ mined_tiles
+        if changed:
+            chunk.tile_ids[:] = tile_ids
+            chunk.mined_tiles = set(mined_tiles)
+            for xy in changed:
+                self.redraw_tile(chunk, xy, x0, y0)
+
+    def redraw_tile(self, chunk: TerrainChunk, xy: tuple[int, int], x0: int, y0: int) -> None:
+        local_xy = ((xy[0] - x0) * TILE_SIZE, (xy[1] - y0) * TILE_SIZE)
+        chunk.image.fill((0, 0, 0, 0), (local_xy, (TILE_SIZE, TILE_SIZE)))
+        prev_large_item = chunk.large_items.pop(xy, None)
+        tile_id = chunk.tile_ids[xy[0] - x0, xy[1] - y0]
+        if tile_id not in self.skip_ids and xy not in chunk.mined_tiles and (image := self.get_tile_image(chunk, xy, tile_id)):
+            chunk.image.blit(image, local_xy)
+        world_xy = (xy[0] * TILE_SIZE, xy[1] * TILE_SIZE)
+        self.dirty_rects.append(pg.Rect(world_xy, (TILE_SIZE, TILE_SIZE)))
+        for name in (prev_large_item, chunk.large_items.get(xy)):
+            if name:
+                self.dirty_rects.append(pg.Rect(world_xy, self.graphics[name].get_size()))
+
+    def get_tile_image(self, chunk: TerrainChunk, xy: tuple[int, int], tile_id: int) -> pg.Surface | None:
+        name = self.tile_names.get(tile_id, 'item extended')
+        image = self.graphics.get(name)
+        if image is not None and (image.get_width() > TILE_SIZE or image.get_height() > TILE_SIZE):
+            chunk.large_items[xy] = name
+            return None
+        return image
+
+    def update(self) -> None:
+        self.mined_tiles.clear()
+        for (x, y) in self.mining_map:
+            self.mined_tiles[x // CHUNK_SIZE, y // CHUNK_SIZE].add((x, y))
+
+
+class TerrainBuffer:
+    '''keeps the previous frame's terrain and scrolls it with the camera, only redrawing the exposed strips & dirty tiles'''
+    def __init__(
+        self, 
+        graphics: dict[str, pg.Surface], 
+        cam_offset: pg.Vector2, 
+        view_size: pg.Vector2,
+        chunk_manager: ChunkManager, 
+        chunk_cache: ChunkCache, 
+        get_mining_stage: callable,
+        get_mined_tile_image: callable
+    ):
+        self.graphics = graphics
+        self.cam_offset = cam_offset
+        self.view_size = view_size
+        self.chunk_manager = chunk_manager
+        self.chunk_cache = chunk_cache
+        self.get_mining_stage = get_mining_stage
+        self.get_mined_tile_image = get_mined_tile_image
+
+        self.image = self.screen_rect = None
+        self.offset = None # the camera offset the buffer was last drawn at
+        self.chunks = {}
+        self.mining_stages = {} # {tile coords: damage stage last drawn}
+
+    def scroll(self, x: int, y: int) -> list[pg.Rect]:
+        '''shift the buffer to the new offset & return the strips left exposed'''
+        w, h = self.screen_rect.size
+        if self.offset is None or abs(x - self.offset[0]) >= w or abs(y - self.offset[1]) >= h:
+            return [self.screen_rect.copy()]
+        dx, dy = x - self.offset[0], y - self.offset[1]
+        if not (dx or dy):
+            return []
+        self.image.scroll(-dx, -dy)
+        exposed = []
+        if dx:
+            exposed.append(pg.Rect(w - dx if dx > 0 else 0, 0, abs(dx), h))
+        if dy:
+            exposed.append(pg.Rect(0, h - dy if dy > 0 else 0, w, abs(dy)))
+        return exposed
+
+    def get_dirty_rects(self, x: int, y: int) -> list[pg.Rect]:
+        '''convert the world-space areas changed since the last frame to clipped screen rects'''
+        dirty_rects = [rect.move(-x, -y).clip(self.screen_rect) for rect in self.chunk_cache.dirty_rects]
+        self.chunk_cache.dirty_rects.clear()
+        mining_stages = {xy: self.get_mining_stage(*xy) for xy in self.chunk_cache.mining_map}
+        for (tx, ty), stage in mining_stages.items(): # tiles leaving the mining map are caught by the chunk refresh
+            if self.mining_stages.get((tx, ty)) != stage:
+                dirty_rects.append(pg.Rect(tx * TILE_SIZE - x, ty * TILE_SIZE - y, TILE_SIZE, TILE_SIZE).clip(self.screen_rect))
+        self.mining_stages = mining_stages
+        return [rect for rect in dirty_rects if rect]
+
+    def redraw(self, rect: pg.Rect, x: int, y: int) -> None:
+        chunk_px = self.chunk_cache.chunk_px
+        self.image.set_clip(rect)
+        self.image.fill((0, 0, 0, 0), rect)
+        blit_seq, large_items = [], []
+        for (cx, cy), chunk in self.chunks.items():
+            chunk_rect = pg.Rect(cx * chunk_px - x, cy * chunk_px - y, chunk_px, chunk_px)
+            if chunk_rect.colliderect(rect):
+                blit_seq.append((chunk.image, chunk_rect))
+            for (tx, ty), name in chunk.large_items.items(): # graphics extending past their tile would be clipped by the chunk's borders
+                image = self.graphics[name]
+                if rect.colliderect((tx * TILE_SIZE - x, ty * TILE_SIZE - y), image.get_size()):
+                    large_items.append((image, (tx * TILE_SIZE - x, ty * TILE_SIZE - y)))
+        blit_seq.extend(large_items)
+        for (tx, ty) in self.chunk_cache.mining_map:
+            tile_rect = pg.Rect(tx * TILE_SIZE - x, ty * TILE_SIZE - y, TILE_SIZE, TILE_SIZE)
+            if tile_rect.colliderect(rect):
+                blit_seq.append((self.get_mined_tile_image(tx, ty), tile_rect))
+        self.image.fblits(blit_seq)
+        self.image.set_clip(None)
+
+    def update(self) -> None:
+        if self.image is None or self.image.get_size() != self.view_size: # the render scale changed
+            self.image = pg.Surface(self.view_size, pg.SRCALPHA)
+            self.screen_rect = self.image.get_rect()
+            self.offset = None
+        x, y = int(self.cam_offset.x), int(self.cam_offset.y)
+        # refreshing the chunks queues the rects of any tiles edited since the last frame
+        self.chunks = {xy: self.chunk_cache.get_chunk(*xy) for xy in self.chunk_manager.chunk_keys}
+        for rect in self.scroll(x, y) + self.get_dirty_rects(x, y):
+            self.redraw(rect, x, y)
+        self.offset = (x, y)
+
+
+class BiomeTransition:
+    '''fade the new/old backgrounds in/out when crossing the border between biomes'''
+    def __init__(self, render_bg_imgs: callable):
         self.render_bg_imgs = render_bg_imgs
 
         self.active = False
         self.previous_biome = None
         self.bg_types = ('landscape', 'underground')
-        self.alphas_init = False
+        self.num_steps = 0
         self.alpha_factor = 3
         self.current_biome_min_alpha = 50
-        
-    def init_alphas(self, current_biome: str) -> None:
-        for bg_type in self.bg_types:
-            for img in self.graphics[self.previous_biome][bg_type].values():
-                img.set_alpha(255) 
-
-            for img in self.graphics[current_biome][bg_type].values():
-                img.set_alpha(self.current_biome_min_alpha) 
-            
-            self.alphas_init = True
 
     def run(self, current_biome: str) -> None:
-        if not self.alphas_init:
-            self.init_alphas(current_biome)
-            return
-        
+        previous_biome_alpha = max(0, 255 - (self.alpha_factor * self.num_steps))
+        current_biome_alpha = min(255, self.current_biome_min_alpha + (self.alpha_factor * self.num_steps))
         for bg_type in self.bg_types:
-            previous_biome_imgs = list(self.graphics[self.previous_biome][bg_type].values())
-            current_biome_imgs = list(self.graphics[current_biome][bg_type].values())
-
-            for img in previous_biome_imgs:
-                new_alpha = max(0, img.get_alpha() - self.alpha_factor)
-                img.set_alpha(new_alpha)
-                self.active = new_alpha > 0 
-
-            for img in current_biome_imgs:
-                new_alpha = min(255, img.get_alpha() + self.alpha_factor)
-                img.set_alpha(new_alpha)
-                self.active = new_alpha < 255
-            
-            self.render_bg_imgs(bg_type, current_biome, previous_biome_imgs)
-            self.render_bg_imgs(bg_type, current_biome, current_biome_imgs)
-
-        if not self.active:
-            self.alphas_init = False
+            self.render_bg_imgs(bg_type, self.previous_biome, previous_biome_alpha)
+            self.render_bg_imgs(bg_type, current_biome, current_biome_alpha)
+        
+        self.num_steps += 1
+        if current_biome_alpha == 255:
+            self.active = False
+            self.num_steps = 0
 
 
 class ToolAnimation:
-    def __init__(self, screen: pg.Surface, render_item_held: callable):
+    def __init__(self, screen: pg.Surface, render_item_held: callable, rotation_cache: RotationCache):
         self.screen = screen
         self.render_item_held = render_item_held
+        self.rotation_cache = rotation_cache
 
-    @staticmethod
-    def get_rotation(sprite: pg.sprite.Sprite, image: pg.Surface, dt: float) -> pg.Surface:
+    def get_rotation(self, sprite: pg.sprite.Sprite, image: pg.Surface, dt: float) -> pg.Surface:
         angle = 45 * sin(dt * 10)
-        return pg.transform.rotate(image, -angle if not sprite.facing_left else angle) # negative angles rotate clockwise
\ No newline at end of file
+        # negative angles rotate clockwise
+        return self.rotation_cache.get_rotation(image, -angle if not sprite.facing_left else angle, sprite.facing_left)
\ No newline at end of file
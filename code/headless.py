@@ -0,0 +1,99 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy') # set before pygame opens the display
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame as pg
+import json
+import argparse
+from time import perf_counter
+from statistics import mean, quantiles
+
+from settings import FPS, TILE_SIZE
+from main import Main
+from input_manager import InputManager
+
+class KeyState(dict):
+    '''indexed like pygame's key state, any key not in the dict is up'''
+    def __missing__(self, key: int) -> bool:
+        return False
+
+
+class ScriptedInput:
+    '''replays a list of steps over the (empty) input of the dummy devices, e.g
+    [{"from": 0, "to": 600, "hold": ["move right"]}, {"from": 120, "press": ["jump"]}, {"from": 300, "to": 360, "mouse": [x, y], "buttons": ["left"]}]
+    keys are key binding names or pygame key names, mouse coords are in world space & both tick bounds are inclusive'''
+    def __init__(self, steps: list[dict[str, any]], input_manager: InputManager, cam_offset: pg.Vector2):
+        self.steps = steps
+        self.keyboard, self.mouse = input_manager.keyboard, input_manager.mouse
+        self.cam_offset = cam_offset
+        self.mouse_xy = None # kept between steps since the dummy mouse overwrites it every tick
+
+    def get_key(self, name: str) -> int:
+        return self.keyboard.key_bindings[name] if name in self.keyboard.key_bindings else pg.key.key_code(name)
+
+    def apply(self, tick: int) -> None:
+        held_keys, pressed_keys = KeyState(), KeyState()
+        for step in self.steps:
+            start = step['from']
+            if not start <= tick <= step.get('to', start):
+                continue
+            for name in step.get('hold', ()):
+                held_keys[self.get_key(name)] = True
+            if tick == start:
+                for name in step.get('press', ()):
+                    held_keys[self.get_key(name)] = pressed_keys[self.get_key(name)] = True
+            if 'mouse' in step:
+                self.mouse_xy = tuple(step['mouse'])
+            for button in step.get('buttons', ()):
+                self.mouse.buttons_held[button] = True
+                if tick == start:
+                    self.mouse.buttons_pressed[button] = True
+        self.keyboard.held_keys, self.keyboard.pressed_keys = held_keys, pressed_keys
+        if self.mouse_xy:
+            self.mouse.world_xy = self.mouse_xy
+            self.mouse.screen_xy = (self.mouse_xy[0] - self.cam_offset.x, self.mouse_xy[1] - self.cam_offset.y)
+            self.mouse.tile_xy = (self.mouse_xy[0] // TILE_SIZE, self.mouse_xy[1] // TILE_SIZE)
+
+
+def print_stats(tick_times: list[float], dt: float, load_time: float) -> None:
+    total = sum(tick_times)
+    ms = [t * 1000 for t in tick_times]
+    p50, p95, p99 = (quantiles(ms, n=100, method='inclusive')[i - 1] for i in (50, 95, 99)) if len(ms) > 1 else (ms[0],) * 3
+    print(f'load time: {load_time:.2f}s')
+    print(f'ticks: {len(tick_times)} ({len(tick_times) * dt:.1f}s simulated in {total:.2f}s, {len(tick_times) * dt / total:.1f}x real time)')
+    print(f'throughput: {len(tick_times) / total:.1f} ticks/s')
+    print(f'tick ms: mean {mean(ms):.3f}, p50 {p50:.3f}, p95 {p95:.3f}, p99 {p99:.3f}, max {max(ms):.3f}')
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return n
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description='run the simulation without a display or any rendering')
+    parser.add_argument('--ticks', type=positive_int, default=FPS * 60)
+    parser.add_argument('--dt', type=float, default=1 / FPS, help='simulated seconds per tick')
+    parser.add_argument('--save', default='save.json', help='save file to load, a new world is generated if it does not exist')
+    parser.add_argument('--new', action='store_true', help='generate a new world even if the save file exists')
+    parser.add_argument('--script', help='json file of scripted input steps')
+    parser.add_argument('--warmup', type=int, default=0, help='ticks to run before the timed ones')
+    args = parser.parse_args()
+
+    start = perf_counter()
+    main = Main(None if args.new else args.save)
+    load_time = perf_counter() - start
+    before_tick = None
+    if args.script:
+        with open(args.script, 'r') as f:
+            before_tick = ScriptedInput(json.load(f), main.input_manager, main.cam.offset).apply
+    if args.warmup:
+        main.fast_forward(args.warmup, args.dt, before_tick)
+    tick_times = main.fast_forward(args.ticks, args.dt, before_tick and (lambda tick: before_tick(tick + args.warmup)))
+    print_stats(tick_times, args.dt, load_time)
+    pg.quit()
+
+if __name__ == '__main__':
+    run()
@@ -29,7 +29,15 @@ class Keyboard:
             'toggle HUD ui': pg.K_RSHIFT, # don't use h, reserved for rotating a pipe's transport direction horizontally
             'close ui window': pg.K_u,
             'stop holding item': pg.K_q,
-            'drop item': pg.K_z
+            'drop item': pg.K_z,
+            'toggle render stats': pg.K_F3,
+            'cycle render scale': pg.K_F4,
+            'toggle world map': pg.K_TAB,
+            'zoom in world map': pg.K_EQUALS,
+            'zoom out world map': pg.K_MINUS,
+            'pause simulation': pg.K_p,
+            'slow down simulation': pg.K_LEFTBRACKET,
+            'speed up simulation': pg.K_RIGHTBRACKET
         }
 
     def update(self) -> None:
@@ -42,13 +50,14 @@ class Mouse:
         self.buttons_pressed, self.buttons_held = {'left': False, 'right': False}, {'left': False, 'right': False}
         self.moving = False
         self.screen_xy = self.world_xy = self.tile_xy = None
+        self.render_scale = 1 # the world is drawn this many times larger than its pixels
         
     def get_movement(self, cam_offset: pg.Vector2) -> None:
         self.moving = False
         if pg.mouse.get_rel():
             self.moving = True
             self.screen_xy = pg.mouse.get_pos()
-            self.world_xy = (int(self.screen_xy[0] + cam_offset.x), int(self.screen_xy[1] + cam_offset.y))
+            self.world_xy = (int(self.screen_xy[0] / self.render_scale + cam_offset.x), int(self.screen_xy[1] / self.render_scale + cam_offset.y))
             self.tile_xy = (self.world_xy[0] // TILE_SIZE, self.world_xy[1] // TILE_SIZE)
     
     def update_click_states(self) -> None:
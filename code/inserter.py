@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from input_manager import InputManager
     from player import Player
+    from render_queue import RenderQueue
 
 import pygame as pg
 import math
@@ -27,9 +28,10 @@ class Inserter(TransportSprite):
         assets: dict[str, dict[str, any]], 
         tile_map: np.ndarray, 
         obj_map: np.ndarray, 
+        render_queue: RenderQueue,
         speed_factor: int=1
     ):
-        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map)
+        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, render_queue)
         self.speed_factor = speed_factor
 
         self.tile_borders = {
@@ -45,10 +47,11 @@ class Inserter(TransportSprite):
         self.rotate_speed = 1250
         self.rotate_dir = None
         self.original_img = self.image
+        self.rotation_cache = assets['rotation cache']
         self.alarms = {
             'transfer': Alarm(length=self.rotate_speed / self.speed_factor, fn=self.transfer, auto=True, loop=True),
             'receive item': Alarm(length=200, fn=self.receive_item, auto=False, loop=False),
-            'send item': Alarm(length=100, function=self.send_item, auto=False, loop=False),
+            'send item': Alarm(length=100, fn=self.send_item, auto=False, loop=False),
         }
         
     def config_transport_dir(self) -> None:
@@ -71,6 +74,8 @@ class Inserter(TransportSprite):
                 self.alarms['send item'].start()
 
     def receive_item(self) -> None:
+        if hasattr(self.obj_receive_from, 'sync'): # a sleeping machine's output is only caught up when it's needed
+            self.obj_receive_from.sync()
         if not isinstance(self.obj_receive_from, Pipe):
             if hasattr(self.obj_receive_from, 'output') and self.obj_receive_from.output['item']:
                 self.item_holding = self.obj_receive_from.output['item']
@@ -85,6 +90,8 @@ class Inserter(TransportSprite):
                 self.rotate(self.obj_receive_from, reset=True)
 
     def send_item(self) -> None:
+        if hasattr(self.obj_send_to, 'sync'):
+            self.obj_send_to.sync()
         if not isinstance(self.obj_send_to, Pipe):
             if self.obj_send_to.fuel_input['item'] in {None, self.item_holding}:
                 if self.obj_send_to.fuel_input['item'] is None:
@@ -102,7 +109,7 @@ class Inserter(TransportSprite):
         if not reset:
             dxy = pg.Vector2(self.rect.center) - pg.Vector2(target_obj.rect.center)
             angle = -math.degrees(math.atan2(dxy.y, dxy.x)) + 135 # negative since rotozoom rotates counterclockwise
-            self.image = pg.transform.rotozoom(self.original_img, angle, 1) 
+            self.image = self.rotation_cache.get_rotation(self.original_img, angle, smooth=True)
             center = self.rect.center # preserve the original center
             self.rect = self.image.get_rect(center=center)
         else:
@@ -115,16 +122,14 @@ class Inserter(TransportSprite):
         if self.receive_dir and self.send_dir:
             dirs = self.xy_to_cardinal[self.transport_idx]
             receive_dir_surf = self.dir_ui[dirs[self.receive_dir]]
-            self.screen.blit(receive_dir_surf, receive_dir_surf.get_frect(midbottom=self.rect.midtop - self.cam_offset))
+            self.render_queue.add('overlays', receive_dir_surf, receive_dir_surf.get_frect(midbottom=self.rect.midtop - self.cam_offset))
             send_dir_surf = self.dir_ui[dirs[self.send_dir]]
-            self.screen.blit(send_dir_surf, send_dir_surf.get_frect(midtop=self.rect.midbottom - self.cam_offset))
+            self.render_queue.add('overlays', send_dir_surf, send_dir_surf.get_frect(midtop=self.rect.midbottom - self.cam_offset))
         if self.item_holding:
             item_surf = self.graphics[self.item_holding]
-            self.screen.blit(item_surf, item_surf.get_rect(center=self.rect.midtop - self.cam_offset))
+            self.render_queue.add('overlays', item_surf, item_surf.get_rect(center=self.rect.midtop - self.cam_offset))
 
     def update(self, dt: float) -> None:
-        self.update_alarms()
-        self.render_transport_ui()
         self.config_transport_dir()
 
 
@@ -141,9 +146,10 @@ class BurnerInserter(Inserter):
         player: Player, 
         assets: dict[str, dict[str, any]], 
         tile_map: np.ndarray, 
-        obj_map: np.ndarray
+        obj_map: np.ndarray,
+        render_queue: RenderQueue
     ):
-        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map)
+        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, render_queue)
         self.tile_reach_radius = 1
         self.fuel_sources = {'coal': {'capacity': 50, 'burn speed': 6000}}
 
@@ -161,10 +167,11 @@ class ElectricInserter(Inserter):
         player: Player, 
         assets: dict[str, dict[str, any]], 
         tile_map: np.ndarray, 
-        obj_map: np.ndarray
+        obj_map: np.ndarray,
+        render_queue: RenderQueue
     ):
         speed_factor = 1.5
-        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, speed_factor)
+        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, render_queue, speed_factor)
         self.tile_reach_radius = 1
         self.fuel_sources = {'electricity': {}}
 
@@ -182,9 +189,10 @@ class LongHandedInserter(Inserter):
         player: Player, 
         assets: dict[str, dict[str, any]], 
         tile_map: np.ndarray, 
-        obj_map: np.ndarray
+        obj_map: np.ndarray,
+        render_queue: RenderQueue
     ):
         speed_factor = 1.25
-        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, mouse, keyboard, player, assets, tile_map, obj_map, speed_factor)
+        super().__init__(xy, image, z, sprite_groups, screen, cam_offset, mouse, keyboard, player, assets, tile_map, obj_map, render_queue, speed_factor)
         self.tile_reach_radius = 2
         self.fuel_sources = {'electricity': {}}
\ No newline at end of file
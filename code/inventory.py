@@ -25,6 +25,7 @@ class SpriteInventory:
                 self.contents = {}
             self.index = 0
         self.num_slots = 50
+        self.listeners = [] # called with (item, new amount) whenever an item's amount changes
         self.slot_capacity = defaultdict(lambda: 999)
         self.set_slot_capacity()
         
@@ -34,6 +35,14 @@ class SpriteInventory:
         for tool in TOOLS.keys():
             self.slot_capacity[tool] = 99   
 
+    def add_listener(self, fn: callable) -> None:
+        self.listeners.append(fn)
+
+    def notify(self, item: str) -> None:
+        amount = self.contents[item]['amount'] if item in self.contents else 0
+        for fn in self.listeners:
+            fn(item, amount)
+
     def add_item(self, item: str, amount: int=1) -> None:
         items = self.contents.keys()
         if item not in items:
@@ -45,6 +54,7 @@ class SpriteInventory:
             if item in self.slot_capacity.keys():
                 max_amount = min(amount, self.slot_capacity['item'] - self.contents[item]['amount'])
             self.contents[item]['amount'] += max_amount
+        self.notify(item)
         if not self.parent_sprite.item_holding:
             self.parent_sprite.item_holding = item
             self.index = self.contents[item]['index']
@@ -59,6 +69,13 @@ class SpriteInventory:
             del self.contents[item]
             for i, (name, data) in enumerate(self.contents.items()):
                 data['index'] = i
+        self.notify(item)
+
+    def clear(self) -> None:
+        items = list(self.contents)
+        self.contents.clear()
+        for item in items:
+            self.notify(item)
 
 
 class PlayerInventory(SpriteInventory):
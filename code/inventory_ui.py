@@ -57,6 +57,8 @@ class InventoryUI:
         self.icon_size = pg.Vector2(TILE_SIZE, TILE_SIZE)
         self.icon_padding = ((self.slot_len, self.slot_len) - self.icon_size) // 2
         self.render = True
+        self.panel = ui.panel()
+        self.icon_rects = [] # (screen rect, item name) of the icons on the panel, for rendering names on hover
         inv_dims = InventoryDimensions(
             self.outline_rect_expanded, self.outline_rect_closed, pg.Rect(self.icon_padding, self.icon_size), 
             self.slot_len, self.num_cols, self.num_rows
@@ -72,16 +74,25 @@ class InventoryUI:
             self.num_rows = self.num_rows_closed
             self.outline_rect = self.outline_rect_closed
 
+    def get_visible_contents(self) -> list[tuple[str, dict[str, int]]]:
+        inv_contents = list(self.inventory.contents.items()) # storing in a list to avoid the 'dictionary size changed during iteration' error when removing placed items
+        return inv_contents if self.expand else inv_contents[:self.max_idx_closed]
+
+    def get_panel_key(self, contents: list[tuple[str, dict[str, int]]]) -> tuple:
+        selected_idx = self.inventory.index if self.player.item_holding else None
+        return (selected_idx, *((item_name, item_data['amount'], item_data['index']) for item_name, item_data in contents))
+
     def render_bg(self) -> None:
-        self.gen_bg(self.outline_rect, transparent=True)
-        self.gen_outline(self.outline_rect)
+        rect = self.panel.to_local(self.outline_rect)
+        self.gen_bg(rect, transparent=True, surf=self.panel.surf)
+        self.gen_outline(rect, surf=self.panel.surf)
 
     def render_slots(self) -> None:
         selected_idx = self.inventory.index
         for x in range(self.num_cols):
             for y in range(self.num_rows):
-                box = pg.Rect((self.padding, self.top) + pg.Vector2(x * self.slot_len, y * self.slot_len), (self.slot_len - 1, self.slot_len - 1))
-                pg.draw.rect(self.screen, 'black', box, 1)
+                box = self.panel.to_local(pg.Rect((self.padding, self.top) + pg.Vector2(x * self.slot_len, y * self.slot_len), (self.slot_len - 1, self.slot_len - 1)))
+                pg.draw.rect(self.panel.surf, 'black', box, 1)
                 if self.player.item_holding and (y * (self.num_rows - 1) * self.num_cols) + x == selected_idx:
                     self.highlight_slot(box)
 
@@ -90,22 +101,26 @@ class InventoryUI:
         hl_surf.fill('gray')
         hl_surf.set_alpha(50)
         hl_rect = hl_surf.get_rect(topleft = slot.topleft)
-        self.screen.blit(hl_surf, hl_rect)
+        self.panel.surf.blit(hl_surf, hl_rect)
         
-    def render_icons(self) -> None:
-        inv_contents = list(self.inventory.contents.items()) # storing in a list to avoid the 'dictionary size changed during iteration' error when removing placed items
-        for item_name, item_data in inv_contents if self.expand else inv_contents[:self.max_idx_closed]:
+    def render_icons(self, contents: list[tuple[str, dict[str, int]]]) -> None:
+        icons, labels = [], []
+        self.icon_rects.clear()
+        for item_name, item_data in contents:
             try:
                 surf = self.get_item_surf(item_name)
                 row, col = divmod(item_data['index'], self.num_cols) # determine the slot an item corresponds to
                 topleft = self.outline_rect.topleft + pg.Vector2(col * self.slot_len, row * self.slot_len)
                 padding = (pg.Vector2(self.slot_len, self.slot_len) - surf.get_size()) // 2
                 rect = surf.get_rect(topleft=topleft + padding)
-                self.screen.blit(surf, rect)
-                self.render_item_amount(item_data['amount'], topleft + padding)
-                self.render_inv_item_name(rect, item_name)
+                icons.append((surf, self.panel.to_local(rect)))
+                labels.append((item_data['amount'], self.panel.to_local(topleft + padding)))
+                self.icon_rects.append((rect, item_name))
             except KeyError:
                 pass
+        self.panel.surf.fblits(icons) # draw every icon in 1 call before the text rendered over them
+        for amount, xy in labels:
+            self.render_item_amount(amount, xy, surf=self.panel.surf)
 
     def get_item_surf(self, name: str) -> pg.Surface:
         surf = self.graphics[name]
@@ -113,7 +128,12 @@ class InventoryUI:
 
     def update(self) -> None:
         if self.render:
-            self.render_bg()
-            self.render_slots()
-            self.render_icons()
+            contents = self.get_visible_contents()
+            if self.panel.needs_redraw(self.outline_rect, self.get_panel_key(contents)):
+                self.render_bg()
+                self.render_slots()
+                self.render_icons(contents)
+            self.panel.render()
+            for rect, item_name in self.icon_rects:
+                self.render_inv_item_name(rect, item_name)
             self.item_drag.update()
\ No newline at end of file
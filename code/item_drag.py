@@ -19,7 +19,7 @@ class ItemDrag:
         sprite_manager: SpriteManager, 
         input_manager: InputManager
     ):
-        self.screen = ui.screen
+        self.render_queue = ui.render_queue
         self.cam_offset = ui.cam_offset
         self.graphics = ui.assets['graphics']
         self.player = ui.player
@@ -118,7 +118,7 @@ class ItemDrag:
 
     def render_item_drag(self) -> None:
         self.rect.topleft = self.get_grid_xy()
-        self.screen.blit(self.image, self.rect)
+        self.render_queue.add('overlays', self.image, self.rect.copy())
         if self.player.item_holding in PLACEABLE_ITEMS:
             item_xy_world = (pg.Vector2(self.rect.topleft) + self.cam_offset) // TILE_SIZE
             if 'pipe' in self.player.item_holding and self.keyboard.pressed_keys[pg.K_r]:
@@ -13,6 +13,7 @@ from collections import defaultdict
 from math import ceil
 
 from settings import MAP_SIZE, TILE_SIZE, TILES, RAMP_TILES, TILE_REACH_RADIUS, Z_LAYERS, OBJ_ITEMS, PRODUCTION, PIPE_TRANSPORT_DIRS
+from tile_edits import tile_edits
 
 class ItemPlacement:
     def __init__(
@@ -38,7 +39,9 @@ class ItemPlacement:
         self.player = player
         self.graphics = assets['graphics']
         self.gen_outline, self.gen_bg, self.render_item_amount = ui.gen_outline, ui.gen_bg, ui.render_item_amount
+        self.render_queue = ui.render_queue
         self.save_data = save_data
+        self.tint_images = {} # keyed by (size, valid placement)
        
         self.obj_map = np.full(MAP_SIZE, None, dtype=object) # stores every tile an object overlaps with (tile_map only stores the topleft since it controls rendering)
         self.machine_ids = {self.names_to_ids[k] for k in PRODUCTION} | {self.names_to_ids['item extended']}
@@ -92,6 +95,7 @@ class ItemPlacement:
 
     def place_single_tile_item(self, tile_xy: tuple[int, int], sprite: pg.sprite.Sprite, old_pipe_idx: int=None) -> None: # passing the item name if a class needs to be initialized
         self.tile_map[tile_xy] = self.names_to_ids[sprite.item_holding]
+        tile_edits.mark(tile_xy)
         self.collision_map.update_map(tile_xy, add_tile=True)
         sprite.inventory.remove_item()
         if sprite.item_holding in OBJ_ITEMS:
@@ -106,6 +110,7 @@ class ItemPlacement:
                     self.init_obj(sprite.item_holding, tiles_covered)
             else:
                 self.tile_map[xy] = self.names_to_ids['item extended'] 
+            tile_edits.mark(xy)
             self.collision_map.update_map(xy, add_tile=True)
         sprite.inventory.remove_item(sprite.item_holding)
 
@@ -119,10 +124,13 @@ class ItemPlacement:
         return tiles
 
     def render_ui(self, icon_image: pg.Surface, icon_rect: pg.Rect, xy: tuple[int, int], player: Player) -> None:
-        tint_image = pg.Surface(icon_image.get_size())
-        tint_image.fill('green' if self.valid_placement(self.get_tiles_covered(xy, icon_image), player) else 'red')
-        tint_image.set_alpha(25)
-        self.screen.blit(tint_image, tint_image.get_rect(topleft=icon_rect.topleft))
+        key = (icon_image.get_size(), self.valid_placement(self.get_tiles_covered(xy, icon_image), player))
+        if key not in self.tint_images:
+            tint_image = pg.Surface(key[0])
+            tint_image.fill('green' if key[1] else 'red')
+            tint_image.set_alpha(25)
+            self.tint_images[key] = tint_image
+        self.render_queue.add('overlays', self.tint_images[key], icon_rect.topleft)
 
     def init_obj(self, name: str, tiles_covered: list[tuple[int, int]]) -> None:
         obj = self.items_init_when_placed[name if 'pipe' not in name else name.split(' ')[0]]
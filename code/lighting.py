@@ -0,0 +1,126 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from procgen import ProcGen
+    from chunk_manager import ChunkManager
+    from render_queue import RenderQueue
+    from weather import Sky
+
+import pygame as pg
+import numpy as np
+from dataclasses import dataclass
+
+from settings import TILES, RAMP_TILES, TILE_SIZE, CHUNK_SIZE, MAP_SIZE, LIGHT_LEVELS, LIGHT_SOURCES, LIGHT_OPAQUE_FALLOFF, LIGHT_AMBIENT, \
+    LIGHT_CACHE_MAX_BYTES
+from surface_cache import SurfaceCache
+
+@dataclass(slots=True)
+class LightChunk:
+    sun: np.ndarray # light levels reaching each tile from the surface
+    torch: np.ndarray # light levels reaching each tile from placed light sources
+    open_sky: np.ndarray # transparent tiles with nothing above them, the sky already shades these
+    tile_ids: np.ndarray # copy of the tile map region the light depends on
+
+
+class Lighting:
+    '''propagates light per chunk with vectorized relaxation & draws it as 1 upscaled multiply layer'''
+    def __init__(self, render_queue: RenderQueue, cam_offset: pg.Vector2, chunk_manager: ChunkManager, proc_gen: ProcGen, sky: Sky):
+        self.render_queue = render_queue
+        self.cam_offset = cam_offset
+        self.chunk_manager = chunk_manager
+        self.tile_map = proc_gen.tile_map
+        self.names_to_ids = proc_gen.names_to_ids
+        self.sky = sky
+
+        self.max_level = LIGHT_LEVELS - 1
+        self.padding = self.max_level # no light travels further than this, so tiles outside the padding can't affect a chunk
+        self.chunks = SurfaceCache(LIGHT_CACHE_MAX_BYTES)
+        # per-tile-id lookups so the propagation never loops over tiles in python
+        num_ids = max(self.names_to_ids.values()) + 1
+        opaque_ids = [self.names_to_ids[name] for name in (*TILES, *RAMP_TILES, 'tree base') if name in self.names_to_ids]
+        self.opaque = np.zeros(num_ids, dtype=bool)
+        self.opaque[opaque_ids] = True
+        self.falloff = np.where(self.opaque, LIGHT_OPAQUE_FALLOFF, 1).astype(np.int16)
+        self.source_levels = np.zeros(num_ids, dtype=np.int16)
+        for name, level in LIGHT_SOURCES.items():
+            self.source_levels[self.names_to_ids[name]] = min(level, self.max_level)
+
+        self.version = 0 # incremented whenever a chunk's light changes
+        self.image = None
+        self.image_key = None
+        self.image_xy = (0, 0)
+
+    def get_region(self, cx: int, cy: int) -> tuple[int, int, int, int]:
+        '''the chunk's tile bounds expanded by the padding & clamped to the map'''
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+        return (
+            max(0, x0 - self.padding),
+            max(0, y0 - self.padding),
+            min(MAP_SIZE[0], x0 + CHUNK_SIZE + self.padding),
+            min(MAP_SIZE[1], y0 + CHUNK_SIZE + self.padding)
+        )
+
+    def get_chunk(self, cx: int, cy: int) -> LightChunk:
+        rx0, _, rx1, ry1 = self.get_region(cx, cy)
+        tile_ids = self.tile_map[rx0:rx1, :ry1] # includes every tile above the chunk since they decide where sunlight reaches
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None or not np.array_equal(chunk.tile_ids, tile_ids):
+            chunk = self.calc_chunk(cx, cy, tile_ids.copy())
+            self.chunks.add((cx, cy), chunk, chunk.sun.nbytes + chunk.torch.nbytes + chunk.open_sky.nbytes + chunk.tile_ids.nbytes)
+            self.version += 1
+        return chunk
+
+    def calc_chunk(self, cx: int, cy: int, tile_ids: np.ndarray) -> LightChunk:
+        rx0, ry0, rx1, ry1 = self.get_region(cx, cy)
+        open_sky = np.logical_and.accumulate(~self.opaque[tile_ids], axis=1)[:, ry0:] # transparent all the way up to the top of the map
+        region_ids = tile_ids[:, ry0:]
+        falloff = self.falloff[region_ids]
+        light = np.stack((np.where(open_sky, self.max_level, 0).astype(np.int16), self.source_levels[region_ids]))
+        spread = np.empty_like(light)
+        for _ in range(self.max_level):
+            spread.fill(0)
+            np.maximum(spread[:, 1:], light[:, :-1], out=spread[:, 1:])
+            np.maximum(spread[:, :-1], light[:, 1:], out=spread[:, :-1])
+            np.maximum(spread[:, :, 1:], light[:, :, :-1], out=spread[:, :, 1:])
+            np.maximum(spread[:, :, :-1], light[:, :, 1:], out=spread[:, :, :-1])
+            spread -= falloff
+            if not (spread > light).any():
+                break
+            np.maximum(light, spread, out=light)
+
+        # crop the padding back off
+        x0, y0 = cx * CHUNK_SIZE - rx0, cy * CHUNK_SIZE - ry0
+        crop = (slice(x0, x0 + CHUNK_SIZE), slice(y0, y0 + CHUNK_SIZE))
+        return LightChunk(light[0][crop].astype(np.uint8), light[1][crop].astype(np.uint8), open_sky[crop].copy(), tile_ids)
+
+    def get_daylight(self) -> float:
+        '''quantized so the light layer is only rebuilt a handful of times over a day/night cycle'''
+        return round(float(self.sky.rgb[2]) / self.sky.max_rgb[2] * 16) / 16
+
+    def render_image(self, chunks: dict[tuple[int, int], LightChunk], daylight: float) -> None:
+        min_cx, min_cy = min(cx for cx, _ in chunks), min(cy for _, cy in chunks)
+        max_cx, max_cy = max(cx for cx, _ in chunks), max(cy for _, cy in chunks)
+        levels = np.arange(LIGHT_LEVELS) / self.max_level
+        sun_lut = (LIGHT_AMBIENT + (255 - LIGHT_AMBIENT) * levels * daylight).astype(np.uint8)
+        torch_lut = (LIGHT_AMBIENT + (255 - LIGHT_AMBIENT) * levels).astype(np.uint8)
+
+        brightness = np.full(((max_cx - min_cx + 1) * CHUNK_SIZE, (max_cy - min_cy + 1) * CHUNK_SIZE), 255, dtype=np.uint8)
+        for (cx, cy), chunk in chunks.items():
+            x0, y0 = (cx - min_cx) * CHUNK_SIZE, (cy - min_cy) * CHUNK_SIZE
+            w, h = chunk.sun.shape # smaller than the chunk size along the map's edges
+            brightness[x0:x0 + w, y0:y0 + h] = np.where(chunk.open_sky, 255, np.maximum(sun_lut[chunk.sun], torch_lut[chunk.torch]))
+
+        small_image = pg.surfarray.make_surface(np.repeat(brightness[:, :, None], 3, axis=2))
+        self.image = pg.transform.smoothscale(small_image, (small_image.width * TILE_SIZE, small_image.height * TILE_SIZE))
+        self.image_xy = (min_cx * CHUNK_SIZE * TILE_SIZE, min_cy * CHUNK_SIZE * TILE_SIZE)
+
+    def update(self) -> None:
+        if not self.chunk_manager.chunk_keys:
+            return
+        chunks = {xy: self.get_chunk(*xy) for xy in self.chunk_manager.chunk_keys}
+        daylight = self.get_daylight()
+        image_key = (self.chunk_manager.chunk_keys[0], self.chunk_manager.chunk_keys[-1], self.version, daylight)
+        if image_key != self.image_key: # otherwise the previous image is only moved with the camera
+            self.render_image(chunks, daylight)
+            self.image_key = image_key
+        self.render_queue.add('light', self.image, (self.image_xy[0] - self.cam_offset.x, self.image_xy[1] - self.cam_offset.y))
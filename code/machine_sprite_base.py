@@ -12,6 +12,7 @@ from abc import ABC
 
 from settings import Z_LAYERS, GRAVITY, TILE_SIZE, BIOME_WIDTH, TILE_SIZE
 from sprite_base_classes import Sprite
+from alarm import scheduler
 
 @dataclass(slots=True)
 class MachineInventorySlot:
@@ -34,6 +35,9 @@ class MachineInventory:
 
 
 class Machine(Sprite, ABC):
+    sleeps = False # whether the machine can be put to sleep & caught up in closed form while the player is away
+    active = False
+
     def __init__(
         self, 
         xy: tuple[int, int], 
@@ -66,8 +70,38 @@ class Machine(Sprite, ABC):
             self.fuel_input = save_data['fuel input'] if save_data else {'item': None, 'amount': 0}
             self.output = save_data['output'] if save_data else {'item': None, 'amount': 0}
             self.pipe_connections = {}
-            
-        self.active = False
+
+        self.sleep_time = None # simulated time the machine was last advanced to while asleep
+        self.sleeping_alarms = [] # names of the alarms that were running when it fell asleep
+
+    def sleep(self) -> None:
+        running = {name: alarm for name, alarm in self.alarms.items() if alarm.running}
+        # back-dated to when the cycles underway started so their progress counts toward the catch-up
+        self.sleep_time = min((alarm.start_time for alarm in running.values()), default=scheduler.now)
+        self.sleeping_alarms = list(running)
+        for alarm in running.values():
+            alarm.stop()
+
+    def sync(self) -> None:
+        '''advance a sleeping machine to the current time, e.g before it's saved or an inserter takes from it'''
+        if self.sleep_time is not None: # only advanced by the time catch_up used so a partly finished cycle carries over
+            self.sleep_time += self.catch_up(scheduler.now - self.sleep_time)
+
+    def wake(self) -> None:
+        '''the alarms resume partway through their cycles with whatever time the catch-up didn't use'''
+        self.sync()
+        for name in self.sleeping_alarms:
+            if alarm := self.alarms.get(name): # the recipe may have changed while asleep
+                alarm.start(scheduler.now - (scheduler.now - self.sleep_time) % alarm.length)
+        self.sleeping_alarms.clear()
+        self.sleep_time = None
+
+    def catch_up(self, elapsed: float) -> float:
+        '''apply the crafts/fuel/output of elapsed ms of simulated time at once & return how many of those ms were used'''
+        return elapsed
 
     def init_ui(self, ui_cls: MachineUI) -> None:
-        self.ui = ui_cls(machine=self, **self.ui_params) # not initializing self.ui until the machine variant (burner/electric) is determined
\ No newline at end of file
+        self.ui = ui_cls(machine=self, **self.ui_params) # not initializing self.ui until the machine variant (burner/electric) is determined
+
+    def render(self) -> None:
+        self.ui.update()
\ No newline at end of file
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from input_manager import InputManager
+    from player import Player
+    from ui import UI
+
+import pygame as pg
+import numpy as np
+from abc import ABC
+
+from machine_sprite_base import Machine
+from settings import MACHINE_TABLE_ROWS
+
+class MachineTable:
+    '''struct-of-arrays state for every furnace & drill, all of them are advanced by 1 vectorized step per tick'''
+    columns = {
+        'progress': np.float64, # ms into the current cycle (smelting an item/extracting an ore)
+        'length': np.float64, # ms per cycle, 0 until the machine has something to work on
+        'fuel_progress': np.float64,
+        'fuel_length': np.float64, # ms per unit of fuel burned, 0 for machines that don't burn their fuel
+        'fuel': np.int32,
+        'input': np.int32, # items left to smelt/ore left in the ground
+        'output': np.int32,
+        'capacity': np.int32,
+        'used': np.bool_,
+        'active': np.bool_ # from the last step, read by the ui
+    }
+
+    def __init__(self, num_rows: int=MACHINE_TABLE_ROWS):
+        for name, dtype in self.columns.items():
+            setattr(self, name, np.zeros(num_rows, dtype=dtype))
+        self.owners = [None] * num_rows
+        self.free_rows = list(range(num_rows - 1, -1, -1)) # popped from the end so rows are filled in order
+
+    def add(self, owner: TableMachine) -> int:
+        if not self.free_rows:
+            self.grow()
+        row = self.free_rows.pop()
+        for name in self.columns:
+            getattr(self, name)[row] = 0
+        self.used[row] = True
+        self.owners[row] = owner
+        return row
+
+    def remove(self, row: int) -> None:
+        self.used[row] = self.active[row] = False
+        self.owners[row] = None
+        self.free_rows.append(row)
+
+    def grow(self) -> None:
+        num_rows = len(self.owners)
+        for name in self.columns:
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros_like(getattr(self, name)))))
+        self.owners.extend([None] * num_rows)
+        self.free_rows.extend(range(num_rows * 2 - 1, num_rows - 1, -1))
+
+    def step(self, dt: float) -> None:
+        '''advance every machine by dt ms, a long step can finish several cycles & only the rows that finished any or ran out of fuel call back into python'''
+        # only burners need fuel, electric machines have no fuel slot
+        active = self.used & (self.length > 0) & (self.input > 0) & ((self.fuel_length == 0) | (self.fuel > 0)) & (self.output < self.capacity)
+        self.active = active
+        idle = ~active
+        self.progress[idle] = self.fuel_progress[idle] = 0 # an interrupted cycle starts over
+        if not active.any():
+            return
+        rows = np.flatnonzero(active)
+        length, fuel_length = self.length[rows], self.fuel_length[rows]
+        burning = fuel_length > 0
+        fuel_progress = self.fuel_progress[rows]
+        # a burner stops once its last unit of fuel burns out
+        run_time = np.where(burning, np.minimum(dt, self.fuel[rows] * fuel_length - fuel_progress), dt)
+
+        start = self.progress[rows]
+        num_cycles = (start + run_time) // length
+        num_done = np.minimum(num_cycles, np.minimum(self.input[rows], self.capacity[rows] - self.output[rows]))
+        capped = num_done < num_cycles # out of input/output space, so it stops when its last cycle finishes
+        run_time[capped] = num_done[capped] * length[capped] - start[capped]
+        self.progress[rows] = start + run_time - num_done * length
+
+        fuel_progress += np.where(burning, run_time, 0)
+        num_burned = np.zeros_like(num_done)
+        num_burned[burning] = np.minimum(fuel_progress[burning] // fuel_length[burning], self.fuel[rows][burning])
+        self.fuel_progress[rows] = fuel_progress - num_burned * fuel_length
+        self.fuel[rows] -= num_burned.astype(np.int32)
+
+        num_done = num_done.astype(np.int32)
+        self.input[rows] -= num_done
+        self.output[rows] += num_done
+        for i in np.flatnonzero(num_done).tolist():
+            self.owners[rows[i]].complete_cycle(int(num_done[i]))
+        for i in np.flatnonzero((num_burned > 0) & (self.fuel[rows] == 0)).tolist():
+            self.owners[rows[i]].inv.input_slots['fuel'].item = None
+
+    def get_pct(self, row: int, fuel: bool=False) -> float:
+        progress, length = (self.fuel_progress, self.fuel_length) if fuel else (self.progress, self.length)
+        return min(100, (progress[row] / length[row]) * 100) if length[row] else 0
+
+
+class TableSlot:
+    '''a machine inventory slot whose amount is a column of the machine table'''
+    __slots__ = ('table', 'column', 'row', '_item', 'rect', 'valid_inputs', 'max_capacity', 'on_item_change')
+
+    def __init__(
+        self,
+        table: MachineTable,
+        column: str,
+        row: int,
+        valid_inputs: set=None,
+        max_capacity: int=99,
+        on_item_change: callable=None
+    ):
+        self.table = table
+        self.column = column # looked up by name since the columns are replaced when the table grows
+        self.row = row
+        self._item = None
+        self.rect = None
+        self.valid_inputs = valid_inputs
+        self.max_capacity = max_capacity
+        self.on_item_change = on_item_change
+
+    @property
+    def item(self) -> str | None:
+        return self._item
+
+    @item.setter
+    def item(self, item: str | None) -> None:
+        changed = item != self._item
+        self._item = item
+        if changed and self.on_item_change:
+            self.on_item_change()
+
+    @property
+    def amount(self) -> int:
+        return int(getattr(self.table, self.column)[self.row])
+
+    @amount.setter
+    def amount(self, amount: int) -> None:
+        getattr(self.table, self.column)[self.row] = amount
+
+
+class TableMachine(Machine, ABC):
+    '''a machine whose progress, fuel & slot amounts are a row of the machine table, the sprite is only a view for the ui & saves'''
+    def __init__(
+        self,
+        xy: tuple[int, int],
+        image: pg.Surface,
+        sprite_groups: list[pg.sprite.Group],
+        screen: pg.Surface,
+        cam_offset: pg.Vector2,
+        input_manager: InputManager,
+        player: Player,
+        assets: dict[str, dict[str, any]],
+        tile_map: np.ndarray,
+        obj_map: np.ndarray,
+        ui: UI,
+        rect_in_sprite_radius: callable,
+        save_data: dict[str, any],
+        machine_table: MachineTable
+    ):
+        super().__init__(
+            xy, image, sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, ui,
+            rect_in_sprite_radius, save_data
+        )
+        self.machine_table = machine_table
+        self.row = machine_table.add(self)
+
+    @property
+    def active(self) -> bool:
+        return bool(self.machine_table.active[self.row])
+
+    def get_slot(self, column: str, valid_inputs: set=None, max_capacity: int=99, on_item_change: callable=None) -> TableSlot:
+        return TableSlot(self.machine_table, column, self.row, valid_inputs, max_capacity, on_item_change)
+
+    @staticmethod
+    def load_slot(slot: TableSlot, data: dict[str, any]) -> None:
+        slot.amount = data['amount']
+        slot.item = data['item']
+
+    @staticmethod
+    def get_slot_save_data(slot: TableSlot | None) -> dict[str, any]:
+        return {'item': slot.item, 'amount': slot.amount} if slot else {'item': None, 'amount': 0}
+
+    def get_pct(self) -> float:
+        return self.machine_table.get_pct(self.row)
+
+    def get_fuel_pct(self) -> float:
+        return self.machine_table.get_pct(self.row, fuel=True)
+
+    def complete_cycle(self, num_cycles: int) -> None:
+        '''called by the table once it has moved num_cycles items from the input to the output'''
+        pass
+
+    def kill(self) -> None:
+        self.machine_table.remove(self.row)
+        super().kill()
@@ -26,6 +26,9 @@ class MachineUI:
         self.player = player
         self.graphics, self.fonts, self.colors = assets['graphics'], assets['fonts'], assets['colors']
         self.gen_outline, self.gen_bg, self.render_item_amount = ui.gen_outline, ui.gen_bg, ui.render_item_amount
+        self.render_queue, self.world_to_screen = ui.render_queue, ui.world_to_screen
+        self.render_text, self.get_icon = ui.render_text, ui.get_icon
+        self.panel = ui.panel()
         self.rect_in_sprite_radius = rect_in_sprite_radius
        
         self.render = False
@@ -36,7 +39,7 @@ class MachineUI:
         self.icons = self.graphics['icons']
         self.box_len = 40
         self.padding = 15
-        self.empty_fuel_surf = pg.transform.scale(self.icons['empty fuel'].convert_alpha(), pg.Vector2(machine.image.get_size()) * 0.8)
+        self.empty_fuel_surf = self.get_icon(self.icons['empty fuel'], pg.Vector2(machine.image.get_size()) * 0.8).copy() # copied since its colorkey & alpha are changed
         self.empty_fuel_surf.set_colorkey((255, 255, 255))
         self.empty_fuel_surf.set_alpha(150)
         self.machine_mask = pg.mask.from_surface(machine.image)
@@ -44,7 +47,7 @@ class MachineUI:
         self.key_close_ui = self.keyboard.key_bindings['close ui window']
 
     def update_bg_rect(self) -> None:
-        self.bg_rect = pg.Rect(self.machine.rect.midtop - self.cam_offset - pg.Vector2(self.bg_w // 2, self.bg_h + self.padding), (self.bg_w, self.bg_h))
+        self.bg_rect = pg.Rect(self.world_to_screen(self.machine.rect.midtop) - pg.Vector2(self.bg_w // 2, self.bg_h + self.padding), (self.bg_w, self.bg_h))
 
     def check_input(self) -> Slot | None:
         return next((slot for slot in self.machine.inv if slot.rect.collidepoint(self.mouse.screen_xy)), None)
@@ -66,39 +69,66 @@ class MachineUI:
             
     def highlight_surf_when_hovered(self) -> None:
         if self.mouse_hover:
-            self.screen.blit(self.machine_mask_surf, self.machine.rect.topleft - self.cam_offset, special_flags=pg.BLEND_RGBA_SUB)
+            self.render_queue.add('highlights', self.machine_mask_surf, self.machine.rect.topleft - self.cam_offset)
+
+    def get_slots(self) -> list[InvSlot]:
+        return [s for s in [*self.machine.inv.input_slots.values(), self.machine.inv.output_slot] if s.rect]
+
+    def get_panel_key(self) -> tuple:
+        '''everything drawn on the panel, extended by each machine's ui'''
+        return tuple((slot.item, slot.amount, slot.rect.collidepoint(self.mouse.screen_xy)) for slot in self.get_slots())
+
+    def get_progress_width(self, percent: float, width: int=None) -> int:
+        '''the progress bar only needs redrawing when its fill crosses a pixel'''
+        return int(((width if width else self.box_len) - 2) * (percent / 100))
 
     def render_inv(self, color='black', icon_scale: int=None, slot_preview: bool=False) -> None: 
-        self.update_inv_rects()
-        for slot in [s for s in [*self.machine.inv.input_slots.values(), self.machine.inv.output_slot] if s.rect]: 
-            self.gen_bg(slot.rect, self.colors['ui bg highlight'] if slot.rect.collidepoint(self.mouse.screen_xy) else color) 
-            self.gen_outline(slot.rect)
+        for slot in self.get_slots(): 
+            rect = self.panel.to_local(slot.rect)
+            self.gen_bg(rect, self.colors['ui bg highlight'] if slot.rect.collidepoint(self.mouse.screen_xy) else color, surf=self.panel.surf) 
+            self.gen_outline(rect, surf=self.panel.surf)
             if slot.item or (slot_preview and slot.valid_inputs): # checking valid inputs to avoid rendering a preview of nothing if the assembler's output slot is empty
                 self.render_inv_contents(slot, icon_scale, slot_preview)
         
     def render_inv_contents(self, slot: InvSlot, icon_scale: int | None, slot_preview: bool=False) -> None:
         try:
-            surf = self.graphics[slot.item if not slot_preview else next(iter(slot.valid_inputs))].copy() # valid_inputs only contains 1 string
+            surf = self.graphics[slot.item if not slot_preview else next(iter(slot.valid_inputs))] # valid_inputs only contains 1 string
         except KeyError:
             return
         if icon_scale is not None:
-            surf = pg.transform.scale(surf, pg.Vector2(surf.get_size()) * icon_scale)
+            surf = self.get_icon(surf, pg.Vector2(surf.get_size()) * icon_scale)
         if not slot.amount > 0 and slot_preview:
+            surf = surf.copy()
             surf.set_alpha(150)
-        self.screen.blit(surf, surf.get_frect(center=slot.rect.center))
+        rect = self.panel.to_local(slot.rect)
+        self.panel.surf.blit(surf, surf.get_frect(center=rect.center))
         if slot.amount:
-            self.render_item_amount(slot.amount, slot.rect.bottomright - pg.Vector2(5, 5))
+            self.render_item_amount(slot.amount, rect.bottomright - pg.Vector2(5, 5), surf=self.panel.surf)
 
     def render_progress_bar(self, inv_box: pg.Rect, percent: float, width=None, padding: pg.Vector2=pg.Vector2(0, 1), color: str='black') -> None:
-        bar = pg.Rect(inv_box.bottomleft + padding, (width if width else self.box_len, self.progress_bar_height))
-        pg.draw.rect(self.screen, color, bar, 1)
-        progress_rect = pg.Rect(bar.topleft + pg.Vector2(1, 1), ((bar.width - 2) * (percent / 100), bar.height - 2))
-        pg.draw.rect(self.screen, 'forestgreen', progress_rect)
+        bar = pg.Rect(self.panel.to_local(inv_box).bottomleft + padding, (width if width else self.box_len, self.progress_bar_height))
+        pg.draw.rect(self.panel.surf, color, bar, 1)
+        progress_rect = pg.Rect(bar.topleft + pg.Vector2(1, 1), (self.get_progress_width(percent, width), bar.height - 2))
+        pg.draw.rect(self.panel.surf, 'forestgreen', progress_rect)
 
     def update_fuel_status(self) -> None:
         slots = self.machine.inv.input_slots
         if 'smelt' in slots and not slots['fuel'].item:
-            self.screen.blit(self.empty_fuel_surf, self.empty_fuel_surf.get_rect(center=self.machine.rect.center - self.cam_offset))
+            self.render_queue.add('overlays', self.empty_fuel_surf, self.empty_fuel_surf.get_rect(center=self.machine.rect.center - self.cam_offset))
+
+    def render_interface(self) -> None:
+        self.update_bg_rect()
+        if self.rect_in_sprite_radius(self.player, self.machine.rect): # the bg rect is scaled for the screen, so measure in world space
+            self.check_panel_input()
+            self.update_inv_rects()
+            if self.panel.needs_redraw(self.bg_rect, self.get_panel_key()):
+                self.render_panel()
+            self.panel.render()
+        else:
+            self.render = False
+
+    def check_panel_input(self) -> None:
+        pass
 
     def update(self) -> None:
         self.mouse_hover = self.machine.rect.collidepoint(self.mouse.world_xy)
@@ -5,8 +5,9 @@ from os.path import join
 import json
 from collections import defaultdict
 import re
+from time import perf_counter
 
-from settings import RES, FPS, Z_LAYERS, MAP_SIZE, MAP_SIZE, TILE_SIZE
+from settings import RES, FPS, SIM_TIME_SCALES, Z_LAYERS, MAP_SIZE, MAP_SIZE, TILE_SIZE
 from procgen import ProcGen
 from player import Player
 from inventory import SpriteInventory, PlayerInventory
@@ -17,18 +18,22 @@ from physics_engine import PhysicsEngine
 from sprite_manager import SpriteManager
 from input_manager import InputManager
 from ui import UI
+from render_queue import RenderQueue
 from item_placement import ItemPlacement
 from helper_functions import load_subfolders, cls_name_to_str
+from alarm import scheduler
+from sim_clock import SimClock
 
 class Main:
-    def __init__(self):
+    def __init__(self, save_file: str | None='save.json'):
         pg.init()
         pg.display.set_caption('matrioshka')
         self.running = True
         self.clock = pg.time.Clock()
+        self.sim_clock = SimClock(SIM_TIME_SCALES)
         screen = pg.display.set_mode(RES)
       
-        save_data = self.get_save_data()
+        save_data = self.get_save_data(save_file)
         if save_data:
             player_data = save_data['sprites']['player'][0] # index 0 to get the dictionary within the list
             player_xy = player_data['xy']
@@ -42,10 +47,11 @@ class Main:
         
         self.asset_manager = AssetManager()
         assets = self.asset_manager.assets
+        self.render_queue = RenderQueue(screen, assets['fonts']['item label small'], assets['colors']['text'], assets['text cache'].render)
 
         self.physics_engine = PhysicsEngine(self.proc_gen, self.cam.offset, self.input_manager.keyboard)
         
-        self.sprite_manager = SpriteManager(screen, offset, assets, self.proc_gen, self.physics_engine, self.input_manager, save_data)
+        self.sprite_manager = SpriteManager(screen, self.render_queue, offset, assets, self.proc_gen, self.physics_engine, self.input_manager, save_data)
 
         self.player = Player( 
             player_xy if save_data else self.proc_gen.player_spawn_point,
@@ -61,7 +67,7 @@ class Main:
         )
         self.sprite_manager.player = self.player
 
-        self.ui = UI(screen, offset, assets, self.input_manager, self.sprite_manager, self.player, self.proc_gen, save_data)
+        self.ui = UI(screen, self.render_queue, offset, assets, self.input_manager, self.sprite_manager, self.player, self.proc_gen, save_data)
         self.sprite_manager.ui = self.ui
 
         self.item_placement = ItemPlacement(
@@ -80,10 +86,11 @@ class Main:
         self.ui.inventory_ui.item_placement = self.item_placement
         self.ui.inventory_ui.item_drag.item_placement = self.item_placement
 
-        self.chunk_manager = ChunkManager(self.cam.offset)
+        self.chunk_manager = ChunkManager(self.cam.offset, self.cam.view_size, self.proc_gen.tile_map)
 
         self.graphics_engine = GraphicsEngine(
             screen, 
+            self.render_queue,
             self.cam, 
             assets['graphics'], 
             self.ui, 
@@ -96,11 +103,11 @@ class Main:
         )
 
     def make_save(self, file: str) -> None:
-        visited_tiles = self.ui.mini_map.visited_tiles
+        self.sprite_manager.sync_machines() # sleeping machines are saved as of now
         data = defaultdict(list, {
             **self.proc_gen.make_save(), 
             'current biome': self.player.current_biome, 
-            'visited tiles': visited_tiles if isinstance(visited_tiles, list) else visited_tiles.tolist(), 
+            'visited tiles': self.ui.mini_map.visited_tiles.make_save(), 
             'weather': self.graphics_engine.weather.sky.make_save(), 
             'sprites': defaultdict(list) 
         })
@@ -112,21 +119,55 @@ class Main:
         for sprite in [s for s in self.sprite_manager.all_sprites if hasattr(s, 'get_save_data')]:
             data['sprites'][cls_name_to_str(sprite)].append(sprite.get_save_data())
 
-    def get_save_data(self) -> dict[str, list|dict] | None:
+    def get_save_data(self, file: str | None) -> dict[str, list|dict] | None:
+        '''no file generates a new world'''
         data = None
-        if os.path.exists('save.json'):
-            with open('save.json', 'r') as f:
+        if file and os.path.exists(file):
+            with open(file, 'r') as f:
                 data = json.load(f)
         return data
     
-    def update(self, dt: float) -> None:
-        self.input_manager.update(self.cam.offset)
+    def update_sim_clock(self) -> None:
+        pressed_keys, key_bindings = self.input_manager.keyboard.pressed_keys, self.input_manager.keyboard.key_bindings
+        if pressed_keys[key_bindings['pause simulation']]:
+            self.sim_clock.toggle_pause()
+        elif pressed_keys[key_bindings['slow down simulation']]:
+            self.sim_clock.change_time_scale(-1)
+        elif pressed_keys[key_bindings['speed up simulation']]:
+            self.sim_clock.change_time_scale(1)
+
+    def simulate(self, dt: float) -> None:
+        '''advance the world by dt simulated seconds without drawing anything'''
+        scheduler.update(self.sim_clock.now) # fires every alarm that's due before the sprites update
         self.physics_engine.update(self.player, dt)
-        self.graphics_engine.update(dt) 
-        self.sprite_manager.update(self.player, dt) # keep below the graphics engine otherwise the ui for machines will be rendered over
-        self.graphics_engine.terrain.render_water()
+        self.sprite_manager.update(self.player, dt)
         self.proc_gen.current_biome = self.player.current_biome
 
+    def render(self, dt: float) -> None:
+        self.graphics_engine.update(dt)
+        self.sprite_manager.render(self.player) # keep below the graphics engine otherwise the ui for machines will be rendered over
+        self.render_queue.end_frame()
+
+    def update(self, dt: float) -> None:
+        self.input_manager.update(self.cam.offset)
+        self.update_sim_clock()
+        dt = self.sim_clock.advance(dt)
+        self.simulate(dt)
+        self.render(dt)
+
+    def fast_forward(self, num_ticks: int, dt: float=1 / FPS, before_tick: callable=None) -> list[float]:
+        '''run num_ticks fixed steps as fast as possible without rendering, returns how long each tick took in seconds'''
+        tick_times = []
+        for tick in range(num_ticks):
+            start = perf_counter()
+            pg.event.pump() # keeps the window responsive & resets the just pressed keys
+            self.input_manager.update(self.cam.offset)
+            if before_tick:
+                before_tick(tick) # e.g to override the input with a script
+            self.simulate(self.sim_clock.step(dt))
+            tick_times.append(perf_counter() - start)
+        return tick_times
+
     def run(self) -> None:
         while self.running:
             for event in pg.event.get():
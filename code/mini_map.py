@@ -7,13 +7,51 @@ if TYPE_CHECKING:
 
 import pygame as pg
 import numpy as np
+from base64 import b64encode, b64decode
+from math import ceil
 
 from settings import MAP_SIZE, TILE_SIZE, TILES
 
+class VisitedTiles:
+    '''explored tiles stored as 1 bit each, packed along the y axis'''
+    def __init__(self, saved_data: str | list[list[bool]] | None):
+        self.num_bytes_y = ceil(MAP_SIZE[1] / 8)
+        if saved_data is None:
+            self.bits = np.zeros((MAP_SIZE[0], self.num_bytes_y), dtype=np.uint8)
+        elif isinstance(saved_data, str):
+            self.bits = np.frombuffer(b64decode(saved_data), dtype=np.uint8).reshape(MAP_SIZE[0], self.num_bytes_y).copy()
+        else: # saved before the tiles were packed
+            self.bits = np.packbits(np.array(saved_data, dtype=bool), axis=1)
+        self.marked_region = None # (x0, y0, x1, y1) bounding the tiles marked since the world map last read it
+
+    def get(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        '''unpack a region into a bool array'''
+        byte_y0 = y0 // 8
+        bits = np.unpackbits(self.bits[x0:x1, byte_y0:ceil(y1 / 8)], axis=1)
+        return bits[:, y0 - byte_y0 * 8:y1 - byte_y0 * 8].view(bool)
+
+    def mark(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        byte_y0, byte_y1 = y0 // 8, ceil(y1 / 8)
+        bits = np.unpackbits(self.bits[x0:x1, byte_y0:byte_y1], axis=1)
+        bits[:, y0 - byte_y0 * 8:y1 - byte_y0 * 8] = 1
+        self.bits[x0:x1, byte_y0:byte_y1] = np.packbits(bits, axis=1)
+        if region := self.marked_region:
+            x0, y0, x1, y1 = min(x0, region[0]), min(y0, region[1]), max(x1, region[2]), max(y1, region[3])
+        self.marked_region = (x0, y0, x1, y1)
+
+    def pop_marked_region(self) -> tuple[int, int, int, int] | None:
+        region, self.marked_region = self.marked_region, None
+        return region
+
+    def make_save(self) -> str:
+        return b64encode(self.bits.tobytes()).decode('ascii')
+
+
 class MiniMap:
     def __init__(self, ui: UI, proc_gen: ProcGen, sprite_manager: SpriteManager):
         self.screen = ui.screen
         self.cam_offset = ui.cam_offset
+        self.render_queue = ui.render_queue
         self.gen_outline = ui.gen_outline
         self.saved_data = ui.saved_data
         self.tile_map = proc_gen.tile_map
@@ -21,7 +59,8 @@ class MiniMap:
         self.ids_to_names = proc_gen.ids_to_names
         self.get_tile_material = sprite_manager.mining.get_tile_material
         
-        self.visited_tiles = np.array(self.saved_data['visited tiles']) if self.saved_data else np.full(MAP_SIZE, False, dtype = bool)
+        self.visited_tiles = VisitedTiles(self.saved_data['visited tiles'] if self.saved_data else None)
+        self.visit_xy = None # the tile the visited area was last centered on
         self.update_radius = 6
         self.tiles_x, self.tiles_y = 80, 80
         self.tile_px_w, self.tile_px_h = 2, 2
@@ -41,6 +80,24 @@ class MiniMap:
         self.tree_px_height = 8
         self.branch_y = self.tree_px_height // 2
 
+        self.tile_rgbs = self.get_tile_rgbs()
+        self.tree_base_id = self.names_to_ids['tree base']
+        self.tile_image = pg.Surface((self.tiles_x, self.tiles_y)) # 1px per tile, scaled up once per redraw
+        self.image = pg.Surface((self.outline_w, self.outline_h))
+        self.window = self.window_tiles = self.window_visited = None # what the image was last drawn from
+
+    def get_tile_rgbs(self) -> np.ndarray:
+        '''rgb lookup table indexed by tile id, objects are drawn as the air they're placed in'''
+        tile_rgbs = np.empty((max(self.ids_to_names) + 1, 3), dtype=np.uint8)
+        tile_rgbs[:] = self.non_tiles['air']['rgb']
+        for tile_id, name in self.ids_to_names.items():
+            material = self.get_tile_material(tile_id) # ramps share their material's color
+            if material in self.terrain_tiles:
+                tile_rgbs[tile_id] = TILES[material]['rgb']
+            elif name in self.non_tiles:
+                tile_rgbs[tile_id] = self.non_tiles[name]['rgb']
+        return tile_rgbs
+
     def render_outline(self) -> None:
         if self.render:
             base_rect = pg.Rect(*self.topleft, self.outline_w, self.outline_h)
@@ -49,83 +106,58 @@ class MiniMap:
             pg.draw.rect(self.screen, 'black', outline1, 1)
 
     def render_tiles(self) -> None:
-        tile_map, visited_map = self.get_map_slices()
-        cols, rows = tile_map.shape
-        for y in range(rows): # keep y first otherwise tree branches to the right get blitted over by the following x index
-            for x in range(cols):
-                image = pg.Surface((self.tile_px_w, self.tile_px_h))
-                if visited_map[x, y]:
-                    tile_id = tile_map[x, y]
-                    tile_name = self.ids_to_names[tile_id]
-                    if tile_name in self.non_tiles:
-                        tile_color = self.non_tiles[tile_name]['rgb']
-                        if tile_name == 'tree base':
-                            self.render_tree(image, tile_color, x, y)
-                    else:
-                        if tile_name != 'obj extended':
-                            if tile_name in self.terrain_tiles:
-                                tile_color = TILES[tile_name]['rgb']
-                            else:
-                                pass
-                        else:
-                            pass
-                else:
-                    tile_color = 'black'
-                image.fill(tile_color)
-                rect = image.get_rect(topleft = self.topleft + (x * self.tile_px_w, y * self.tile_px_h))
-                self.screen.blit(image, rect)
-
-    def render_tree(self, image: pg.Surface, tile_color: str, x: int, y: int) -> None:
-        image.fill(tile_color)
+        window, tile_map, visited_map = self.get_map_slices()
+        if window != self.window or not np.array_equal(tile_map, self.window_tiles) or not np.array_equal(visited_map, self.window_visited):
+            self.window, self.window_tiles, self.window_visited = window, tile_map, visited_map
+            self.draw_image(tile_map, visited_map)
+        self.screen.blit(self.image, self.topleft)
+
+    def draw_image(self, tile_map: np.ndarray, visited_map: np.ndarray) -> None:
+        rgb = self.tile_rgbs[tile_map]
+        rgb[~visited_map] = 0
+        self.render_trees(rgb, *np.nonzero((tile_map == self.tree_base_id) & visited_map))
+        pg.surfarray.blit_array(self.tile_image, rgb)
+        pg.transform.scale(self.tile_image, self.image.get_size(), self.image)
+
+    def render_trees(self, rgb: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+        '''draw a trunk up from each tree base with a branch on either side'''
+        tree_rgb = self.non_tiles['tree base']['rgb']
         for i in range(self.tree_px_height):
-            rect = image.get_rect(topleft = self.topleft + (x * self.tile_px_w, (y - i) * self.tile_px_h))
-            self.screen.blit(image, rect)
+            trunk = ys - i >= 0
+            rgb[xs[trunk], ys[trunk] - i] = tree_rgb
             if i == self.branch_y:
-                left_branch = image.get_rect(topleft = self.topleft + ((x - 1) * self.tile_px_w, (y - i) * self.tile_px_h))
-                right_branch = image.get_rect(topleft = self.topleft + ((x + 1) * self.tile_px_w, (y - i) * self.tile_px_h))
-                self.screen.blit(image, left_branch)
-                self.screen.blit(image, right_branch)
-
-    def get_map_slices(self) -> tuple[np.ndarray, np.ndarray]:
-        '''returns the slice of the tile map to display & the updated visited tiles map'''
-        screen_w = self.screen.get_width() // 2
-        screen_h = self.screen.get_height() // 2
-        tile_offset_x = int((self.cam_offset.x + screen_w) / TILE_SIZE) # not using int division since the camera offset is a vector2
-        tile_offset_y = int((self.cam_offset.y + screen_h) / TILE_SIZE)
-
-        left = max(0, tile_offset_x - self.border_dist_x)
-        right = min(self.tile_map.shape[0], tile_offset_x + self.border_dist_x)
-        top_default = tile_offset_y - self.border_dist_y # keeping the default in case it's negative so the top/bottom row calculation can be adjusted
-        top = max(0, top_default)
-        bottom = min(self.tile_map.shape[1], tile_offset_y + self.border_dist_y)
-        if top_default < 0:
-            bottom += abs(top_default) # prevents rows below from being occluded when the camera offset is negative 
-        
-        left_visited = max(0, tile_offset_x - self.update_radius)
-        right_visited = min(self.tile_map.shape[0], tile_offset_x + self.update_radius)
-        top_default = tile_offset_y - self.update_radius
-        top_visited = max(0, tile_offset_y - self.update_radius)
-        bottom_visited = min(self.tile_map.shape[1], tile_offset_y + self.update_radius)
-        if top_default < 0:
-            bottom_visited += abs(top_default)
-        self.visited_tiles[left_visited:right_visited, top_visited:bottom_visited] = True
-        
-        start_x = max(0, self.border_dist_x - (tile_offset_x - left))
-        start_y = max(0, self.border_dist_y - (tile_offset_y - top))
-        
-        map_slice = self.tile_map[left:right, top:bottom]
-        map_cols, map_rows = map_slice.shape
-        cols = min(map_cols, self.tiles_x - start_x) 
-        rows = min(map_rows, self.tiles_y - start_y)
+                for dx in (-1, 1):
+                    branch = trunk & (0 <= xs + dx) & (xs + dx < self.tiles_x)
+                    rgb[xs[branch] + dx, ys[branch] - i] = tree_rgb
 
-        full_slice = np.full((self.tiles_x, self.tiles_y), self.names_to_ids['air'], dtype = np.uint8)
-        full_slice[start_x:start_x + map_cols, start_y:start_y + map_rows] = map_slice[start_x:start_x + map_cols, start_y:start_y + map_rows]
-        
-        visited_slice = np.full((self.tiles_x, self.tiles_y), False, dtype = bool)
-        visited_slice[start_x:start_x + cols, start_y:start_y + rows] = self.visited_tiles[left:left + cols, top:top + rows]
-        
-        return full_slice, visited_slice
+    def get_map_slices(self) -> tuple[tuple[int, int], np.ndarray, np.ndarray]:
+        '''returns the topleft tile of the window, the slice of the tile map to display & the updated visited tiles map'''
+        view_w = self.screen.get_width() // self.render_queue.scale
+        view_h = self.screen.get_height() // self.render_queue.scale
+        tile_offset_x = int((self.cam_offset.x + view_w // 2) / TILE_SIZE) # not using int division since the camera offset is a vector2
+        tile_offset_y = int((self.cam_offset.y + view_h // 2) / TILE_SIZE)
+
+        if (tile_offset_x, tile_offset_y) != self.visit_xy: # only mark tiles after crossing into a new one
+            self.visit_xy = (tile_offset_x, tile_offset_y)
+            left_visited = max(0, tile_offset_x - self.update_radius)
+            right_visited = min(self.tile_map.shape[0], tile_offset_x + self.update_radius)
+            top_visited = max(0, tile_offset_y - self.update_radius)
+            bottom_visited = min(self.tile_map.shape[1], tile_offset_y + self.update_radius)
+            if left_visited < right_visited and top_visited < bottom_visited:
+                self.visited_tiles.mark(left_visited, top_visited, right_visited, bottom_visited)
+
+        # tiles outside the map stay unvisited so they're drawn black
+        left, top = tile_offset_x - self.border_dist_x, tile_offset_y - self.border_dist_y
+        map_left, map_top = max(0, left), max(0, top)
+        map_right, map_bottom = min(self.tile_map.shape[0], left + self.tiles_x), min(self.tile_map.shape[1], top + self.tiles_y)
+        full_slice = np.full((self.tiles_x, self.tiles_y), self.names_to_ids['air'], dtype=self.tile_map.dtype)
+        visited_slice = np.full((self.tiles_x, self.tiles_y), False, dtype=bool)
+        if map_left < map_right and map_top < map_bottom:
+            window = (slice(map_left - left, map_right - left), slice(map_top - top, map_bottom - top))
+            full_slice[window] = self.tile_map[map_left:map_right, map_top:map_bottom]
+            visited_slice[window] = self.visited_tiles.get(map_left, map_top, map_right, map_bottom)
+        return (left, top), full_slice, visited_slice
 
     def update(self) -> None:
         self.render_outline()
-        self.render_tiles()
\ No newline at end of file
+        self.render_tiles()
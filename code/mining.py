@@ -5,6 +5,8 @@ if TYPE_CHECKING:
 
 import pygame as pg
 
+from tile_edits import tile_edits
+
 class Mining:
     def __init__(
         self, 
@@ -55,6 +57,7 @@ class Mining:
         if self.mining_map[mouse_tile_xy]['hardness'] == 0:
             sprite.inventory.add_item(self.get_tile_material(self.tile_map[mouse_tile_xy]))
             self.tile_map[mouse_tile_xy] = self.names_to_ids['air']
+            tile_edits.mark(mouse_tile_xy)
             self.update_map(mouse_tile_xy, remove_tile = True)
             del self.mining_map[mouse_tile_xy]
     
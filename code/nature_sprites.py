@@ -71,7 +71,6 @@ class Tree(Sprite):
         self.delay_alarm = Alarm(length=500) # prevents cut_down() from being called every frame
 
     def cut_down(self, sprite: pg.sprite.Sprite, get_tool_strength: callable, pick_up_item: callable) -> None:
-        self.delay_alarm.update()
         if not self.delay_alarm.running:
             sprite.state = 'chopping'
             axe_material = sprite.item_holding.split()[0]
@@ -4,6 +4,7 @@ if TYPE_CHECKING:
     from input_manager import InputManager
     from player import Player
     from inserter import Inserter
+    from render_queue import RenderQueue
 
 import pygame as pg
 import numpy as np
@@ -11,6 +12,7 @@ import numpy as np
 from settings import MAP_SIZE, TILE_SIZE, PIPE_TRANSPORT_DIRS, Z_LAYERS
 from transport_sprite_base import TransportSprite
 from alarm import Alarm
+from tile_edits import tile_edits
 
 class Pipe(TransportSprite):
     def __init__(
@@ -26,9 +28,10 @@ class Pipe(TransportSprite):
         tile_map: np.ndarray,
         obj_map: np.ndarray,
         names_to_ids: dict[str, int],
-        variant_idx: int
+        variant_idx: int,
+        render_queue: RenderQueue
     ):
-        super().__init__(xy, image, Z_LAYERS['main'], sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map)
+        super().__init__(xy, image, Z_LAYERS['main'], sprite_groups, screen, cam_offset, input_manager, player, assets, tile_map, obj_map, render_queue)
         self.names_to_ids = names_to_ids
         self.variant_idx = variant_idx
         
@@ -58,6 +61,7 @@ class Pipe(TransportSprite):
             self.variant_idx = (self.variant_idx + 1) % len(PIPE_TRANSPORT_DIRS)
             self.image = self.graphics[f'pipe {self.variant_idx}']
             self.tile_map[self.tile_xy] = self.tile_IDs[f'pipe {self.variant_idx}']
+            tile_edits.mark(self.tile_xy)
             self.get_connected_objs()
 
     def transport(self) -> None:
@@ -99,15 +103,15 @@ class Pipe(TransportSprite):
     def render_transport_ui(self) -> None:
         if self.variant_idx <= 5:
             dir_surf = self.dir_ui[self.xy_to_cardinal[self.variant_idx][self.transport_dir]]
-            self.screen.blit(dir_surf, dir_surf.get_frect(center=self.rect.center - self.cam_offset))
+            self.render_queue.add('overlays', dir_surf, dir_surf.get_frect(center=self.rect.center - self.cam_offset))
         else:
             for axis in ('horizontal', 'vertical'):
                 dir_surf = self.dir_ui[self.xy_to_cardinal[self.variant_idx][self.transport_dir[axis]]]
-                self.screen.blit(dir_surf, dir_surf.get_rect(center=self.rect.center - self.cam_offset))
+                self.render_queue.add('overlays', dir_surf, dir_surf.get_rect(center=self.rect.center - self.cam_offset))
 
         if self.item_holding:
             item_surf = self.graphics[self.item_holding]
-            self.screen.blit(item_surf, item_surf.get_rect(center=self.rect.center - self.cam_offset))
+            self.render_queue.add('overlays', item_surf, item_surf.get_rect(center=self.rect.center - self.cam_offset))
 
     def extract_item(self) -> None:
         if self.mouse.buttons_pressed['left'] and self.mouse.tile_xy == self.tile_xy and \
@@ -117,8 +121,6 @@ class Pipe(TransportSprite):
             self.item_holding = None
 
     def update(self, dt: float) -> None:
-        self.update_alarms()
-        self.render_transport_ui()
         self.update_rotation()
         self.config_transport_dir()
         self.extract_item()
\ No newline at end of file
@@ -37,7 +37,7 @@ class Player(Colonist):
             save_data=save_data
         )
         self.keyboard = keyboard
-        self.z = Z_LAYERS['player']
+        sprite_manager.all_sprites.change_z(self, Z_LAYERS['player'])
         self.inventory = PlayerInventory(self, None if not save_data else save_data['inventory data'])
 
         self.heart_surf = self.graphics['icons']['heart']
@@ -51,16 +51,19 @@ class Player(Colonist):
         self.hp = self.max_hp
         self.oxygen_lvl = self.max_oxygen_lvl
         self.underwater = False
-        self.alarms['lose oxygen'].running = False
+        self.alarms['lose oxygen'].stop()
         self.rect.center = self.spawn_point
         self.frame_idx = 0
         self.direction = pg.Vector2()
         self.grounded = True
         self.gravity = self.default_gravity
-        self.inventory.contents.clear()
+        self.inventory.clear()
         self.item_holding = None
     
     def update(self, dt: float) -> None:
         super().update(dt)
         self.inventory.get_idx_selection(self.keyboard)
+
+    def render(self) -> None:
+        super().render()
         self.render_hearts()
\ No newline at end of file
@@ -45,7 +45,7 @@ class ProcGen:
         existing_ids = len(ids_to_names)
         for i, name in enumerate([
             *TILES.keys(), *RAMP_TILES, *[k for k in PRODUCTION if k != 'pipe'], *[f'pipe {i}' for i in range(len(PIPE_TRANSPORT_DIRS))], 
-            *ELECTRICITY, *LOGISTICS, *STORAGE.keys(), 'tree base', 'water', 
+            *ELECTRICITY, *LOGISTICS, *STORAGE.keys(), 'tree base', 'water', 'wood torch'
         ]):
             id_num = existing_ids + i
             names_to_ids[name] = id_num
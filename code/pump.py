@@ -38,7 +38,7 @@ class Pump(Sprite):
         self.direction = 'right' if not save_data else save_data['direction']
         self.liquid = None if not save_data else save_data['liquid']
         self.speed = {'water': 1200, 'lava': 2400}
-        self.alarm = Alarm(None, self.pump_liquid, False, False, False)
+        self.alarm = Alarm(None, self.pump_liquid)
 
     def pump_liquid(self) -> None:
         pass
@@ -55,8 +55,6 @@ class Pump(Sprite):
                 if alarm.length != speed:
                     alarm.length = speed
                 alarm.start()
-            else:
-                alarm.update()
 
     def get_save_data(self) -> dict[str, any]:
         return {'active': self.active, 'direction': self.direction, 'liquid': self.liquid}
\ No newline at end of file
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Iterable
+
+import pygame as pg
+
+from settings import RENDER_LAYERS, SCALED_IMAGE_CACHE_MAX_BYTES
+from surface_cache import SurfaceCache
+
+class RenderQueue:
+    '''collects blits per layer over the frame & submits each layer with a single fblits call'''
+    def __init__(self, screen: pg.Surface, font: pg.Font, text_color: str, render_text: callable):
+        self.screen = screen
+        self.font = font
+        self.text_color = text_color
+        self.render_text = render_text
+
+        self.layers = {name: [] for name in RENDER_LAYERS} # keys are in z order
+        self.layer_flags = {'light': pg.BLEND_MULT, 'highlights': pg.BLEND_RGBA_SUB} # blend flags for layers that aren't simply drawn over the ones below
+        self.blit_counts = dict.fromkeys(RENDER_LAYERS, 0)
+        self.frame_blit_counts = dict.fromkeys(RENDER_LAYERS, 0) # totals from the last completed frame
+        self.show_stats = False
+
+        self.scale = 1
+        self.world_surf = screen # only separate from the screen when the world is rendered at a lower resolution
+        self.presented = False # whether the world surface was already scaled onto the screen this frame
+        self.scaled_images = SurfaceCache(SCALED_IMAGE_CACHE_MAX_BYTES) # world overlays queued after presenting, keyed by (surface, scale)
+
+    def set_scale(self, scale: int, view_size: pg.Vector2) -> None:
+        self.scale = scale
+        self.world_surf = self.screen if scale == 1 else pg.Surface(view_size)
+        self.scaled_images.clear()
+
+    def add(self, layer: str, surf: pg.Surface, xy: tuple[int, int] | pg.Vector2 | pg.Rect) -> None:
+        self.layers[layer].append((surf, xy))
+
+    def extend(self, layer: str, blit_seq: Iterable[tuple[pg.Surface, tuple[int, int]]]) -> None:
+        self.layers[layer].extend(blit_seq)
+
+    def get_scaled_image(self, surf: pg.Surface) -> pg.Surface:
+        '''surfaces are cached by identity, so anything queued here shouldn't be drawn on after its first use'''
+        key = (surf, self.scale)
+        image = self.scaled_images.get(key)
+        if image is None:
+            image = pg.transform.scale_by(surf, self.scale)
+            self.scaled_images.add(key, image, self.scaled_images.get_surf_bytes(image))
+        if image.get_alpha() != surf.get_alpha(): # fading text & translucent previews change their alpha without a new surface
+            image.set_alpha(surf.get_alpha())
+        return image
+
+    def flush(self, layers: Iterable[str]=None) -> None:
+        '''draw the queued layers (all by default) in z order'''
+        for name in RENDER_LAYERS if layers is None else layers:
+            if blit_seq := self.layers[name]:
+                flags = self.layer_flags.get(name, 0)
+                if self.scale == 1:
+                    self.screen.fblits(blit_seq, flags)
+                elif not self.presented:
+                    self.world_surf.fblits(blit_seq, flags)
+                else: # the world was already scaled up, so scale the late blits individually
+                    self.screen.fblits([(self.get_scaled_image(surf), (xy[0] * self.scale, xy[1] * self.scale)) for surf, xy in blit_seq], flags)
+                self.blit_counts[name] += len(blit_seq)
+                blit_seq.clear()
+
+    def present(self) -> None:
+        '''draw the world layers & scale them up to fill the screen, the ui is drawn over them at the native resolution'''
+        self.flush()
+        if self.scale != 1:
+            pg.transform.scale(self.world_surf, self.screen.get_size(), self.screen)
+        self.presented = True
+
+    def render_stats(self) -> None:
+        y = self.screen.get_height()
+        for name, count in reversed(self.frame_blit_counts.items()):
+            text = self.render_text(self.font, f'{name}: {count}', False, self.text_color)
+            y -= text.get_height()
+            self.screen.blit(text, (5, y))
+
+    def end_frame(self) -> None:
+        self.flush()
+        for name in self.blit_counts:
+            self.frame_blit_counts[name], self.blit_counts[name] = self.blit_counts[name], 0
+        if self.show_stats:
+            self.render_stats()
+        self.presented = False
@@ -1,8 +1,24 @@
 RES = (1280, 720)
 FPS = 60
+SIM_TIME_SCALES = (0.25, 0.5, 1, 2, 4, 8) # multipliers of real time the simulation can run at
+SIM_LOD_INTERVAL = 500 # ms of simulated time between checks for machines to put to sleep/wake up
+SIM_WAKE_DIST = RES # x/y distance from the player within which sleeping machines wake up
+SIM_SLEEP_DIST = (RES[0] * 3 // 2, RES[1] * 3 // 2) # further than the wake distance so machines near the edge don't toggle every check
+MACHINE_TABLE_ROWS = 64 # initial rows for furnace/drill state, doubled whenever it fills up
 
 TILE_SIZE = 16
 CHUNK_SIZE = 24
+CHUNK_CACHE_MAX_BYTES = 64 * 1024 ** 2 # pre-rendered terrain chunks are evicted once their surfaces exceed this
+MINING_STAGES = 4 # number of damage overlays a tile cycles through while being mined
+ROTATION_CACHE_MAX_BYTES = 8 * 1024 ** 2
+ROTATION_ANGLE_STEP = 3 # degrees
+TEXT_CACHE_MAX_BYTES = 4 * 1024 ** 2
+ICON_ATLAS_PAGE_SIZE = (512, 512)
+LIGHT_LEVELS = 16 # a full strength light source reaches LIGHT_LEVELS - 1 tiles through open space
+LIGHT_SOURCES = {'wood torch': 12} # {tile: light level}
+LIGHT_OPAQUE_FALLOFF = 4 # light levels lost per solid tile (1 per open tile)
+LIGHT_AMBIENT = 40 # brightness (0-255) of tiles no light reaches
+LIGHT_CACHE_MAX_BYTES = 16 * 1024 ** 2
 CELL_SIZE = 10
 MAP_SIZE = (3000, 200)
 WORLD_EDGE_RIGHT = (MAP_SIZE[0] * TILE_SIZE) - 19 # minus 19 to prevent going partially off-screen
@@ -87,6 +103,10 @@ TILE_ORE_RATIO = 50 # amount of ore 1 tile is worth
 GRAVITY = 1200
 
 Z_LAYERS = {'clouds': 0, 'bg': 1, 'main': 2, 'player': 3}
+RENDER_LAYERS = ('sky', 'bg', 'terrain', 'sprites', 'water', 'light', 'highlights', 'overlays') # batched blit layers of the world, in the order they're drawn
+RENDER_SCALES = (1, 2) # the world is rendered at RES // scale & scaled up to the window
+SCALED_IMAGE_CACHE_MAX_BYTES = 8 * 1024 ** 2
+WORLD_MAP_SCALES = (1, 4, 16) # tiles per pixel for each zoom level of the world map, each divides the next
 
 # 'producers' specifies who/what can craft a given item
 TOOLS = {
@@ -205,7 +225,7 @@ PLACEABLE_ITEMS = [
     *ELECTRICITY, *[f'{k} chest' for k in STORAGE['chest']['materials']], 'glass', 'lab', 'wood torch'
 ]
 
-OBJ_ITEMS = [item for item in PLACEABLE_ITEMS if item not in {*TILES, 'glass'}] # has a class to instantiate after placement
+OBJ_ITEMS = [item for item in PLACEABLE_ITEMS if item not in {*TILES, 'glass', 'wood torch'}] # has a class to instantiate after placement
 
 FOOD = {
     'fruits': [
@@ -0,0 +1,25 @@
+class SimClock:
+    '''simulated time, advanced by the main loop rather than read from the wall clock so it can be paused, scaled & fast-forwarded'''
+    def __init__(self, time_scales: tuple[float, ...]):
+        self.time_scales = time_scales
+        self.time_scale = 1
+        self.paused = False
+        self.now = 0 # milliseconds of simulated time, what the alarm scheduler runs on
+        self.ticks = 0
+
+    def step(self, dt: float) -> float:
+        '''advance by dt simulated seconds regardless of the pause/time scale'''
+        self.now += dt * 1000
+        self.ticks += 1
+        return dt
+
+    def advance(self, dt: float) -> float:
+        '''convert a frame's real dt to simulated seconds'''
+        return 0 if self.paused else self.step(dt * self.time_scale)
+
+    def toggle_pause(self) -> None:
+        self.paused = not self.paused
+
+    def change_time_scale(self, step: int) -> None:
+        idx = max(0, min(self.time_scales.index(self.time_scale) + step, len(self.time_scales) - 1))
+        self.time_scale = self.time_scales[idx]
@@ -5,14 +5,21 @@ from settings import TILE_SIZE
 
 class Sprite(pg.sprite.Sprite, ABC):
     def __init__(self, xy: tuple[int, int], image: pg.Surface, z: int, sprite_groups: list[pg.sprite.Group]):
+        self.z = z # layer to render on, assigned before joining the groups since they bucket sprites by it
+        self.render_flags = 0
         super().__init__(*sprite_groups)
         self.xy = xy
         self.image = image
         self.rect = self.image.get_rect(topleft=self.xy)
-        self.z = z # layer to render on
+
+    def render(self) -> None:
+        '''draw anything beyond the sprite's image, update() only simulates so this is skipped when running headless'''
+        pass
 
 
 class AnimatedSprite(pg.sprite.Sprite, ABC):
+    shared_frame_sets = {} # {id(source frames): (source frames, {facing left: {state: frames}})}, built once & shared by every sprite using the same frames
+
     def __init__(
         self, 
         xy: tuple[int, int], 
@@ -26,12 +33,14 @@ class AnimatedSprite(pg.sprite.Sprite, ABC):
         animation_speed: int | dict[str, int],
         gravity: int
     ):
+        self.z = z
+        self.render_flags = 0
         super().__init__(*sprite_groups)
         self.xy = xy
         self.cam_offset = cam_offset
         self.frames = frames
+        self.frame_sets = self.get_frame_sets(frames)
         self.screen = screen
-        self.z = z
         self.move_speed = move_speed
         self.animation_speed = animation_speed
         self.gravity = gravity
@@ -41,4 +50,16 @@ class AnimatedSprite(pg.sprite.Sprite, ABC):
         self.image = self.frames[self.state][self.frame_idx]
         self.rect = self.image.get_rect(midbottom=self.xy)
         self.direction = pg.Vector2()
-        self.tile_xy = (self.xy[0] // TILE_SIZE, self.xy[1] // TILE_SIZE)
\ No newline at end of file
+        self.tile_xy = (self.xy[0] // TILE_SIZE, self.xy[1] // TILE_SIZE)
+
+    def render(self) -> None:
+        pass
+
+    def get_frame_sets(self, frames: dict[str, dict[int, pg.Surface]]) -> dict[bool, dict[str, list[pg.Surface]]]:
+        '''the source frames face left, the right-facing set is flipped here rather than every frame'''
+        key = id(frames) # the source frames are kept in the entry so their id can't be reused by another dict
+        if key not in AnimatedSprite.shared_frame_sets:
+            facing_left = {state: [imgs[i] for i in sorted(imgs)] for state, imgs in frames.items()}
+            facing_right = {state: [pg.transform.flip(img, True, False) for img in imgs] for state, imgs in facing_left.items()}
+            AnimatedSprite.shared_frame_sets[key] = (frames, {True: facing_left, False: facing_right})
+        return AnimatedSprite.shared_frame_sets[key][1]
\ No newline at end of file
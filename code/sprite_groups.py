@@ -0,0 +1,52 @@
+from __future__ import annotations
+from typing import Iterator
+
+import pygame as pg
+
+from settings import Z_LAYERS
+
+# role flags cached on each sprite by the groups below, checked while rendering instead of testing group membership
+ANIMATED = 1
+COLONIST = 2
+TRANSPORT = 4
+
+class RenderGroup(pg.sprite.Group):
+    '''keeps its sprites bucketed by z layer as they're added/removed so rendering never has to sort them'''
+    def __init__(self, *sprites: pg.sprite.Sprite):
+        self.z_buckets = {z: {} for z in sorted(Z_LAYERS.values())} # {z: {sprite: None}}, dicts preserve the order sprites were added in
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pg.sprite.Sprite, layer: None=None) -> None:
+        super().add_internal(sprite, layer)
+        if sprite.z not in self.z_buckets:
+            self.z_buckets[sprite.z] = {}
+            self.z_buckets = dict(sorted(self.z_buckets.items()))
+        self.z_buckets[sprite.z][sprite] = None
+
+    def remove_internal(self, sprite: pg.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        self.z_buckets[sprite.z].pop(sprite, None)
+
+    def change_z(self, sprite: pg.sprite.Sprite, z: int) -> None:
+        self.remove_internal(sprite)
+        sprite.z = z
+        self.add_internal(sprite)
+
+    def sprites_by_z(self) -> Iterator[pg.sprite.Sprite]:
+        for bucket in self.z_buckets.values():
+            yield from bucket
+
+
+class RoleGroup(pg.sprite.Group):
+    '''sets its role flag on the sprites it holds'''
+    def __init__(self, role_flag: int, *sprites: pg.sprite.Sprite):
+        self.role_flag = role_flag
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pg.sprite.Sprite, layer: None=None) -> None:
+        super().add_internal(sprite, layer)
+        sprite.render_flags = getattr(sprite, 'render_flags', 0) | self.role_flag
+
+    def remove_internal(self, sprite: pg.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        sprite.render_flags &= ~self.role_flag
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from input_manager import InputManager
     from sprite_base import SpriteBase
     from procgen import ProcGen
+    from render_queue import RenderQueue
 
 import pygame as pg
 from os.path import join
@@ -14,7 +15,8 @@ from random import choice, randint
 from itertools import islice
 
 from helper_functions import load_image, cls_name_to_str
-from settings import TILE_SIZE, TILES, TILE_REACH_RADIUS, TOOLS, FPS, Z_LAYERS, MAP_SIZE, RES, TREE_BIOMES, PRODUCTION, LOGISTICS
+from settings import TILE_SIZE, TILES, TILE_REACH_RADIUS, TOOLS, FPS, Z_LAYERS, MAP_SIZE, RES, TREE_BIOMES, PRODUCTION, LOGISTICS, \
+    SIM_LOD_INTERVAL, SIM_WAKE_DIST, SIM_SLEEP_DIST
 from player import Player
 from mining import Mining
 from crafting import Crafting
@@ -26,11 +28,15 @@ from pipe import Pipe
 from inserter import BurnerInserter, ElectricInserter, LongHandedInserter
 from assembler import Assembler
 from pump import Pump
+from machine_table import MachineTable
+from sprite_groups import RenderGroup, RoleGroup, ANIMATED, COLONIST, TRANSPORT
+from alarm import Alarm
 
 class SpriteManager:
     def __init__(
         self, 
         screen: pg.Surface, 
+        render_queue: RenderQueue,
         cam_offset: pg.Vector2, 
         assets: dict[str, dict[str, any]], 
         proc_gen: ProcGen,
@@ -39,6 +45,7 @@ class SpriteManager:
         save_data: dict[str, any] | None
     ):
         self.screen = screen
+        self.render_queue = render_queue
         self.cam_offset = cam_offset
         self.assets, self.graphics = assets, assets['graphics']
         self.tile_map = proc_gen.tile_map
@@ -53,13 +60,13 @@ class SpriteManager:
         self.keyboard, self.mouse = input_manager.keyboard, input_manager.mouse
         self.save_data = save_data
 
-        self.all_sprites = pg.sprite.Group()
+        self.all_sprites = RenderGroup()
         self.active_sprites = pg.sprite.Group() # has an update method
-        self.animated_sprites = pg.sprite.Group()
+        self.animated_sprites = RoleGroup(ANIMATED)
         self.player_sprite = pg.sprite.GroupSingle()
-        self.colonist_sprites = pg.sprite.Group()
+        self.colonist_sprites = RoleGroup(COLONIST)
         self.mech_sprites = pg.sprite.Group()
-        self.logistics_sprites = pg.sprite.Group()
+        self.logistics_sprites = RoleGroup(TRANSPORT)
         self.nature_sprites = pg.sprite.Group()
         self.cloud_sprites = pg.sprite.Group()
         self.tree_sprites = pg.sprite.Group()
@@ -85,6 +92,8 @@ class SpriteManager:
             )
         }
         self.ui, self.item_placement, self.player = None, None, None # not initialized until after the sprite manager
+        self.lod_alarm = Alarm(SIM_LOD_INTERVAL, self.update_sim_lod, auto=True, loop=True)
+        self.machine_table = MachineTable() # furnaces & drills are stepped together here rather than in their own update methods
     
     def init_trees(self) -> None:
         if self.current_biome in TREE_BIOMES:
@@ -144,8 +153,7 @@ class SpriteManager:
     @staticmethod
     def end_action(sprite: pg.sprite.Sprite) -> None:
         sprite.state = 'idle'
-        idle_img = sprite.frames['idle'][0]
-        sprite.image = idle_img if sprite.facing_left else pg.transform.flip(idle_img, True, False)
+        sprite.image = sprite.frame_sets[sprite.facing_left]['idle'][0]
 
     def pick_up_item(self, obj: object, name: str, amount: int=1) -> None:
         for sprite in self.get_sprites_in_radius(obj.rect, self.human_sprites):
@@ -197,14 +205,44 @@ class SpriteManager:
             ])
             if 'drill' in name:
                 params.update([('names_to_ids', self.names_to_ids), ('ids_to_names', self.ids_to_names)])
+            if 'drill' in name or 'furnace' in name:
+                params['machine_table'] = self.machine_table
         elif 'pipe' in name or name == 'pump':
             params.update([('names_to_ids', self.names_to_ids), ('variant_idx', int(name[-1]))] if 'pipe' in name else [('names_to_ids', self.names_to_ids)])
             params['sprite_groups'].append(self.logistics_sprites)
+            if 'pipe' in name:
+                params['render_queue'] = self.render_queue
+        elif 'inserter' in name:
+            params['render_queue'] = self.render_queue
         return params
 
+    def update_sim_lod(self) -> None:
+        '''machines far from the player leave the active sprites & are caught up in closed form once they're back in range'''
+        player_rect = self.player.rect
+        for machine in [m for m in self.mech_sprites if getattr(m, 'sleeps', False)]: # pumps aren't machines
+            if machine.sleep_time is None:
+                if not self.rect_in_sprite_radius(machine, player_rect, *SIM_SLEEP_DIST):
+                    machine.sleep()
+                    self.active_sprites.remove(machine)
+            elif self.rect_in_sprite_radius(machine, player_rect, *SIM_WAKE_DIST):
+                machine.wake()
+                self.active_sprites.add(machine)
+
+    def sync_machines(self) -> None:
+        for machine in self.mech_sprites:
+            if getattr(machine, 'sleep_time', None) is not None:
+                machine.sync()
+
     def update(self, player: pg.sprite.Sprite, dt: float) -> None:
+        self.machine_table.step(dt * 1000)
         for sprite in self.active_sprites:
             sprite.update(dt)
         self.mining.update(self.keyboard.held_keys, player, self.mouse.tile_xy)
         self.wood_gathering.update(player, self.mouse.buttons_held, self.mouse.world_xy)
-        self.init_clouds(player)
\ No newline at end of file
+        self.init_clouds(player)
+
+    def render(self, player: pg.sprite.Sprite) -> None:
+        '''only sprites close enough to be drawn update their overlays & ui, plus any machine whose window is still open'''
+        for sprite in self.active_sprites:
+            if self.rect_in_sprite_radius(sprite, player.rect) or (hasattr(sprite, 'ui') and sprite.ui.render):
+                sprite.render()
\ No newline at end of file
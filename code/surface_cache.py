@@ -0,0 +1,116 @@
+from __future__ import annotations
+from typing import Hashable
+
+import pygame as pg
+from collections import OrderedDict
+
+class SurfaceCache:
+    '''least-recently-used store for rendered surfaces, bounded by their combined size in bytes'''
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+
+        self.entries = OrderedDict() # {key: (value, size in bytes)}
+        self.num_bytes = 0
+        self.hits = self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> any:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+        self.misses += 1
+        return None
+
+    def add(self, key: Hashable, value: any, num_bytes: int=None) -> any:
+        if key in self.entries:
+            self.remove(key)
+        if num_bytes is None:
+            num_bytes = self.get_surf_bytes(value)
+        self.entries[key] = (value, num_bytes)
+        self.num_bytes += num_bytes
+        while self.num_bytes > self.max_bytes and len(self.entries) > 1: # always keep the newest entry
+            self.remove(next(iter(self.entries)))
+        return value
+
+    def remove(self, key: Hashable) -> None:
+        _, num_bytes = self.entries.pop(key)
+        self.num_bytes -= num_bytes
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.num_bytes = 0
+
+    @staticmethod
+    def get_surf_bytes(surf: pg.Surface) -> int:
+        return surf.get_pitch() * surf.get_height()
+
+
+class RotationCache(SurfaceCache):
+    '''rotated (& optionally flipped) copies of surfaces, with the angle snapped to a fixed step so repeated swings reuse the same images'''
+    def __init__(self, max_bytes: int, angle_step: int):
+        super().__init__(max_bytes)
+        self.angle_step = angle_step
+
+    def get_rotation(self, surf: pg.Surface, angle: float, flip_x: bool=False, smooth: bool=False) -> pg.Surface:
+        angle = (round(angle / self.angle_step) * self.angle_step) % 360
+        key = (surf, angle, flip_x, smooth) # keying by the surface itself keeps it alive so its id can't be reused
+        image = self.get(key)
+        if image is None:
+            image = pg.transform.flip(surf, True, False) if flip_x else surf
+            image = self.add(key, pg.transform.rotozoom(image, angle, 1) if smooth else pg.transform.rotate(image, angle))
+        return image
+
+
+class TextCache(SurfaceCache):
+    '''rendered strings shared by the whole ui, callers must copy a surface before changing it (e.g. its alpha)'''
+    def render(self, font: pg.Font, text: str, antialias: bool, color: str | tuple[int, int, int]) -> pg.Surface:
+        key = (font, text, antialias, color)
+        image = self.get(key)
+        if image is None:
+            image = self.add(key, font.render(text, antialias, color))
+        return image
+
+
+class IconAtlas:
+    '''icons scaled once per ui size & shelf-packed onto shared pages, handed out as subsurfaces'''
+    def __init__(self, page_size: tuple[int, int]):
+        self.page_size = page_size
+
+        self.icons = {} # {(source surface, size): subsurface}
+        self.pages = []
+        self.shelves = [] # [top, height, next x] for each row of the newest page
+        self.page_bottom = 0 # where the next shelf starts
+
+    def get_icon(self, surf: pg.Surface, size: tuple[int, int]) -> pg.Surface:
+        '''the returned surface shares its pixels with the page, copy it before changing its alpha'''
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        key = (surf, size) # keying by the surface itself keeps it alive so its id can't be reused
+        if key not in self.icons:
+            image = surf if surf.get_size() == size else pg.transform.scale(surf, size)
+            if size[0] > self.page_size[0] or size[1] > self.page_size[1]: # too large to share a page
+                self.icons[key] = image
+            else:
+                page, xy = self.allocate(*size)
+                page.blit(image, xy, special_flags=pg.BLEND_RGBA_MAX) # copy the pixels as-is rather than blending them over the empty page
+                self.icons[key] = page.subsurface((xy, size))
+        return self.icons[key]
+
+    def allocate(self, w: int, h: int) -> tuple[pg.Surface, tuple[int, int]]:
+        for shelf in self.shelves:
+            top, height, x = shelf
+            if h <= height and x + w <= self.page_size[0]:
+                shelf[2] += w
+                return self.pages[-1], (x, top)
+        if not self.pages or self.page_bottom + h > self.page_size[1]:
+            self.pages.append(pg.Surface(self.page_size, pg.SRCALPHA))
+            self.shelves.clear()
+            self.page_bottom = 0
+        self.shelves.append([self.page_bottom, h, w])
+        self.page_bottom += h
+        return self.pages[-1], (0, self.shelves[-1][0])
@@ -0,0 +1,13 @@
+class TileEdits:
+    '''tiles changed after the world was generated, recorded where they're edited so views of the whole map never have to diff it'''
+    def __init__(self):
+        self.tiles = set()
+
+    def mark(self, tile_xy: tuple[int, int]) -> None:
+        self.tiles.add((int(tile_xy[0]), int(tile_xy[1])))
+
+    def drain(self) -> set[tuple[int, int]]:
+        tiles, self.tiles = self.tiles, set()
+        return tiles
+
+tile_edits = TileEdits() # shared by every site that writes to the tile map, read by the world map
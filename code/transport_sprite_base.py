@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from input_manager import InputManager
     import numpy as np
+    from render_queue import RenderQueue
 
 import pygame as pg
 from abc import ABC
@@ -23,6 +24,7 @@ class TransportSprite(Machine, ABC):
         assets: dict[str, dict[str, any]], 
         tile_map: np.ndarray, 
         obj_map: np.ndarray, 
+        render_queue: RenderQueue=None,
         save_data: dict[str, any]=None
     ):
         super().__init__(
@@ -39,6 +41,7 @@ class TransportSprite(Machine, ABC):
             obj_map, 
             save_data=save_data
         )
+        self.render_queue = render_queue # the direction arrows & held items are drawn as overlays
         self.dir_ui = self.graphics['transport dirs']
         self.item_holding = None
         self.xy_to_dir = {
@@ -55,9 +58,6 @@ class TransportSprite(Machine, ABC):
             10: {(1, 0): 'E', (-1, 0): 'W', (0, 1): 'S'}
         }
         self.obj_connections = {}
-        if hasattr(self, 'rotated_over'): # is an inserter
-             self.image = self.image.copy() # for the rotations
 
-    def update_alarms(self) -> None:
-        for alarm in self.alarms.values():
-            alarm.update()
\ No newline at end of file
+    def render(self) -> None:
+        self.render_transport_ui()
@@ -6,12 +6,14 @@ if TYPE_CHECKING:
     from sprite_manager import SpriteManager
     from player import Player
     from procgen import ProcGen
+    from render_queue import RenderQueue
 
 import pygame as pg
 from collections import defaultdict
 
 from settings import TILE_SIZE, RES
 from mini_map import MiniMap
+from world_map import WorldMap
 from craft_window import CraftWindow
 from inventory_ui import InventoryUI
 from alarm import Alarm
@@ -20,6 +22,7 @@ class UI:
     def __init__(
         self, 
         screen: pg.Surface, 
+        render_queue: RenderQueue,
         cam_offset: pg.Vector2, 
         assets: dict[str, dict[str, any]], 
         input_manager: InputManager, 
@@ -29,19 +32,24 @@ class UI:
         saved_data: dict[str, any] | None
     ):
         self.screen = screen
+        self.render_queue = render_queue
         self.cam_offset = cam_offset
         self.assets, self.fonts, self.colors = assets, assets['fonts'], assets['colors']
         self.keyboard, self.mouse = input_manager.keyboard, input_manager.mouse
         self.player, self.inventory = player, player.inventory
         self.saved_data = saved_data
+        self.bg_surfs = {} # filled backgrounds keyed by (size, color, alpha)
+        self.render_text = assets['text cache'].render
+        self.get_icon = assets['icon atlas'].get_icon
 
         self.mini_map = MiniMap(self, proc_gen, sprite_manager)
+        self.world_map = WorldMap(self, proc_gen, self.mini_map)
         self.mouse_grid = MouseGrid(self)
         self.inventory_ui = InventoryUI(self, input_manager, sprite_manager)
 
         self.craft_window = CraftWindow(self, sprite_manager)
-        self.HUD = HUD(self.screen, self.assets, self.craft_window.outline_rect.right, self.gen_outline, self.gen_bg)
-        for key in ('expand inventory ui', 'toggle inventory ui', 'toggle craft window ui', 'toggle mini map ui', 'toggle HUD ui'):
+        self.HUD = HUD(self.screen, self.assets, self.craft_window.outline_rect.right, self.gen_outline, self.gen_bg, self.panel)
+        for key in ('expand inventory ui', 'toggle inventory ui', 'toggle craft window ui', 'toggle mini map ui', 'toggle HUD ui', 'toggle render stats'):
             setattr(self, '_'.join(key.split(' ')), self.keyboard.key_bindings[key])
         self.active_item_names = []
     
@@ -57,27 +65,41 @@ class UI:
         padding: int=1, 
         radius: int=0, 
         draw: bool=True, 
-        return_outline: bool=False
+        return_outline: bool=False,
+        surf: pg.Surface=None
     ) -> None | pg.Rect:
         if color is None: # avoids evaluating 'self' prematurely when set as a default parameter
             color = self.assets['colors']['outline bg']
         outline = pg.Rect(rect.topleft - pg.Vector2(padding, padding), (rect.width + (padding * 2), rect.height + (padding * 2)))
         if draw:
-            pg.draw.rect(self.screen, color, outline, width, radius)
+            pg.draw.rect(self.screen if surf is None else surf, color, outline, width, radius)
         if return_outline: # use the outline as the base rect for creating another outline
             return outline
 
-    def gen_bg(self, rect: pg.Rect, color: str | tuple[int, int, int]='black', transparent: bool=False, alpha: int=None) -> None:
+    def gen_bg(
+        self, 
+        rect: pg.Rect, 
+        color: str | tuple[int, int, int]='black', 
+        transparent: bool=False, 
+        alpha: int=None, 
+        surf: pg.Surface=None
+    ) -> None:
         if alpha is None:
             alpha = 200 if transparent else 255
-        img = pg.Surface(rect.size)
-        img.fill(color)
-        img.set_alpha(alpha)
-        self.screen.blit(img, rect)
+        key = (tuple(rect.size), color, alpha)
+        if key not in self.bg_surfs:
+            img = pg.Surface(rect.size)
+            img.fill(color)
+            img.set_alpha(alpha)
+            self.bg_surfs[key] = img
+        (self.screen if surf is None else surf).blit(self.bg_surfs[key], rect)
+
+    def panel(self, margin: int=2) -> Panel:
+        return Panel(self.screen, margin)
 
     def render_inv_item_name(self, rect: pg.Rect, name: str) -> None:
         if rect.collidepoint(pg.mouse.get_pos()):
-            font = self.assets['fonts']['item label'].render(name, True, self.assets['colors']['text'])
+            font = self.render_text(self.assets['fonts']['item label'], name, True, self.assets['colors']['text'])
             self.screen.blit(font, font.get_rect(topleft = rect.bottomleft))
 
     def render_new_item_name(self, item_name: str, item_rect: pg.Rect, amount: int) -> None:
@@ -89,8 +111,8 @@ class UI:
                 item_name, 
                 color, 
                 255, 
-                self.assets['fonts']['item label'].render(f'+{amount} {item_name} ({item_total})', True, color),
-                self.screen, 
+                self.render_text(self.assets['fonts']['item label'], f'+{amount} {item_name} ({item_total})', True, color).copy(), # copied since its alpha fades out
+                self.render_queue, 
                 self.cam_offset, 
                 world_coords, 
                 Alarm(2000)
@@ -106,7 +128,11 @@ class UI:
         bounding_box = (width - (padding * 2), height - (padding * 2))
         aspect_ratio = min(image.width / bounding_box[0], image.height / bounding_box[1]) # avoid stretching an image too wide/tall
         scale = (min(bounding_box[0], image.width * aspect_ratio), min(bounding_box[1], image.height * aspect_ratio))
-        return pg.transform.scale(self.assets['graphics'][item_name], scale)
+        return self.get_icon(self.assets['graphics'][item_name], scale)
+
+    def world_to_screen(self, xy: tuple[int, int]) -> pg.Vector2:
+        '''for ui anchored to the world but drawn at the native resolution'''
+        return (pg.Vector2(xy) - self.cam_offset) * self.render_queue.scale
 
     def get_grid_xy(self) -> pg.Vector2:
         return ((pg.Vector2(self.mouse.world_xy) // TILE_SIZE) * TILE_SIZE) - self.cam_offset
@@ -131,15 +157,18 @@ class UI:
         elif pressed_keys[self.toggle_HUD_ui]:
             self.HUD.render = not self.HUD.render
 
-    def render_item_amount(self, amount: int, coords: tuple[int, int], add_x_offset: bool=True) -> None:
-        image = self.assets['fonts']['number'].render(str(amount), False, self.assets['colors']['text'])
+        elif pressed_keys[self.toggle_render_stats]:
+            self.render_queue.show_stats = not self.render_queue.show_stats
+
+    def render_item_amount(self, amount: int, coords: tuple[int, int], add_x_offset: bool=True, surf: pg.Surface=None) -> None:
+        image = self.render_text(self.assets['fonts']['number'], str(amount), False, self.assets['colors']['text'])
         x_offset = 0
         if add_x_offset: # making it optional in case the amount will never reach a lengthy value
             num_digits = len(str(amount))
             x_offset = 5 * (num_digits - 2) if num_digits > 2 else 0 # move 3+ digit values to the left by 5px for every remaining digit 
         rect = image.get_rect(center = (coords[0] + x_offset, coords[1] - 2))
-        self.gen_bg(rect, transparent=True)
-        self.screen.blit(image, rect)
+        self.gen_bg(rect, transparent=True, surf=surf)
+        (self.screen if surf is None else surf).blit(image, rect)
 
     def update(self) -> None:
         self.update_render_states()
@@ -149,38 +178,47 @@ class UI:
         self.craft_window.update() # keep above the inventory ui otherwise item names may be rendered behind the window
         self.inventory_ui.update()
         self.update_item_name_data()
+        self.world_map.update() # drawn over the rest of the ui while it's open
         
 
 class MouseGrid:
     def __init__(self, ui: UI):
         self.mouse = ui.mouse
-        self.screen = ui.screen
+        self.render_queue = ui.render_queue
         self.cam_offset = ui.cam_offset
         self.get_grid_xy = ui.get_grid_xy
 
         self.tile_w = self.tile_h = 3
+        self.cell_surf = pg.Surface((TILE_SIZE, TILE_SIZE), pg.SRCALPHA)
+        pg.draw.rect(self.cell_surf, (255, 255, 255, 10), (0, 0, TILE_SIZE, TILE_SIZE), 1) # (0, 0) is relative to the topleft of cell_surf 
 
     def render_grid(self) -> None:
         if self.mouse.moving or self.mouse.buttons_pressed['left']:
             topleft = self.get_grid_xy()
-            for x in range(self.tile_w):
-                for y in range(self.tile_h):
-                    cell_surf = pg.Surface((TILE_SIZE, TILE_SIZE), pg.SRCALPHA)
-                    cell_surf.fill((0, 0, 0, 0))
-                    pg.draw.rect(cell_surf, (255, 255, 255, 10), (0, 0, TILE_SIZE, TILE_SIZE), 1) # (0, 0) is relative to the topleft of cell_surf 
-                    self.screen.blit(cell_surf, cell_surf.get_rect(topleft=topleft + pg.Vector2(x * TILE_SIZE, y * TILE_SIZE)))
+            self.render_queue.extend('overlays', [
+                (self.cell_surf, topleft + pg.Vector2(x * TILE_SIZE, y * TILE_SIZE)) for x in range(self.tile_w) for y in range(self.tile_h)
+            ])
 
     def update(self) -> None:
         self.render_grid()
 
 
 class HUD:
-    def __init__(self, screen: pg.Surface, assets: dict[str, dict[str, any]], craft_window_right: int, gen_outline: callable, gen_bg: callable):
+    def __init__(
+        self, 
+        screen: pg.Surface, 
+        assets: dict[str, dict[str, any]], 
+        craft_window_right: int, 
+        gen_outline: callable, 
+        gen_bg: callable, 
+        panel: callable
+    ):
         self.screen = screen
         self.assets = assets
         self.craft_window_right = craft_window_right
         self.gen_outline = gen_outline
         self.gen_bg = gen_bg
+        self.panel = panel()
 
         self.colors = self.assets['colors']
         self.fonts = self.assets['fonts']
@@ -191,13 +229,14 @@ class HUD:
         self.render = True
 
     def render_bg(self) -> None:
-        self.image = pg.Surface((self.width, self.height))
-        self.rect = self.image.get_rect(topleft = (self.get_left_point(), 0))
-        self.gen_bg(self.rect, transparent=True)
-        
-        outline1 = self.gen_outline(self.rect, draw = False, return_outline = True)
-        outline2 = self.gen_outline(outline1, draw = True)
-        pg.draw.rect(self.screen, 'black', outline1, 1)
+        self.rect = pg.Rect(self.get_left_point(), 0, self.width, self.height)
+        if self.panel.needs_redraw(self.rect, (self.shift_right,)):
+            surf, rect = self.panel.surf, self.panel.to_local(self.rect)
+            self.gen_bg(rect, transparent=True, surf=surf)
+            outline1 = self.gen_outline(rect, draw = False, return_outline = True)
+            outline2 = self.gen_outline(outline1, draw = True, surf=surf)
+            pg.draw.rect(surf, 'black', outline1, 1)
+        self.panel.render()
 
     def get_left_point(self) -> int:
         default = (RES[0] // 2) - (self.width // 2)
@@ -219,7 +258,7 @@ class ItemName:
         color: str, 
         alpha: int, 
         font: pg.Font, 
-        screen: pg.Surface, 
+        render_queue: RenderQueue, 
         cam_offset: pg.Vector2, 
         world_coords: tuple[int, int], 
         alarm: Alarm
@@ -228,7 +267,7 @@ class ItemName:
         self.color = color
         self.alpha = alpha
         self.font = font
-        self.screen = screen
+        self.render_queue = render_queue
         self.cam_offset = cam_offset
         self.world_coords = world_coords
         self.alarm = alarm
@@ -237,10 +276,40 @@ class ItemName:
         if not self.alarm.running:
             self.alarm.start()
             return
-        self.alarm.update()    
         
         self.alpha = max(0, self.alpha - 2)
         self.font.set_alpha(self.alpha)
         screen_coords = self.world_coords - self.cam_offset
-        self.screen.blit(self.font, self.font.get_rect(midbottom = screen_coords))
-        self.world_coords[1] -= index + 1 # move north across the screen
\ No newline at end of file
+        self.render_queue.add('overlays', self.font, self.font.get_rect(midbottom = screen_coords))
+        self.world_coords[1] -= index + 1 # move north across the screen
+
+
+class Panel:
+    '''a cached ui surface, only redrawn when the state it was drawn from changes'''
+    def __init__(self, screen: pg.Surface, margin: int=2):
+        self.screen = screen
+        self.margin = margin # room for the outlines drawn around the panel's rect
+        self.surf = None
+        self.origin = pg.Vector2() # screen coordinates of the surface's topleft
+        self.key = None
+
+    def needs_redraw(self, rect: pg.Rect, key: tuple) -> bool:
+        '''moving the panel only changes where it's blitted, the key has to cover everything drawn on it'''
+        self.origin = pg.Vector2(rect.topleft) - (self.margin, self.margin)
+        size = (rect.width + (self.margin * 2), rect.height + (self.margin * 2))
+        if self.surf is None or self.surf.get_size() != size:
+            self.surf = pg.Surface(size, pg.SRCALPHA)
+        elif key == self.key:
+            return False
+        else:
+            self.surf.fill((0, 0, 0, 0))
+        self.key = key
+        return True
+
+    def to_local(self, rect: pg.Rect | pg.Vector2 | tuple[int, int]) -> pg.Rect | pg.Vector2:
+        if isinstance(rect, pg.Rect):
+            return rect.move(-self.origin)
+        return pg.Vector2(rect) - self.origin
+
+    def render(self) -> None:
+        self.screen.blit(self.surf, self.origin)
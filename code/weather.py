@@ -1,3 +1,8 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from render_queue import RenderQueue
+
 import pygame as pg
 import numpy as np
 
@@ -5,15 +10,15 @@ from settings import RES
 from alarm import Alarm
 
 class Weather:
-    def __init__(self, screen: pg.Surface, save_data: dict[str, any]) -> None:
-        self.sky = Sky(screen, save_data)
+    def __init__(self, render_queue: RenderQueue, save_data: dict[str, any]) -> None:
+        self.sky = Sky(render_queue, save_data)
 
     def update(self) -> None:
         self.sky.update()
 
 class Sky:
-    def __init__(self, screen: pg.Surface, save_data: dict[str, any]) -> None:
-        self.screen = screen
+    def __init__(self, render_queue: RenderQueue, save_data: dict[str, any]) -> None:
+        self.render_queue = render_queue
 
         self.image = pg.Surface(RES)
         self.rgb = np.array(save_data['sky rgb'] if save_data else [150, 200, 255], dtype=int)
@@ -23,10 +28,12 @@ class Sky:
         self.rgb_tint_ranges = np.array([[50, 100], [125, 175]], dtype=int) # apply the tint in the morning & evening
         self.tint_alpha = save_data['sky tint alpha'] if save_data else 0
         self.tint_update = save_data['sky tint update'] if save_data else 1
+        self.tint_rgb = np.array([255, 100, 100], dtype=int)
+        self.render_key = None # (sky rgb, tint alpha) the image was last filled with
         
         self.alarms = {
-            'day/night cycle': Alarm(length=10_000, function=self.day_night_cycle, auto_start=True, loop=True),
-            'tint update': Alarm(length=1000, function=self.update_tint, auto_start=False, loop=True)
+            'day/night cycle': Alarm(length=10_000, fn=self.day_night_cycle, auto=True, loop=True),
+            'tint update': Alarm(length=1000, fn=self.update_tint, auto=False, loop=True)
         }
 
     def day_night_cycle(self) -> None:
@@ -34,15 +41,13 @@ class Sky:
         if np.array_equal(self.rgb, self.max_rgb) or np.array_equal(self.rgb, self.min_rgb):
             self.rgb_update *= -1
 
-    def render_tint(self) -> None:
+    def get_tint_alpha(self) -> int:
         min_range, max_range = self.rgb_tint_ranges[0 if self.rgb_update > 0 else 1]
         if min_range < self.rgb[2] < max_range: # checking the 2nd index since it's the last to reach min_range
             if not self.alarms['tint update'].running:
                 self.alarms['tint update'].start()
-            tint_image = pg.Surface(RES)
-            tint_image.fill((255, 100, 100))
-            tint_image.set_alpha(self.tint_alpha)
-            self.screen.blit(tint_image, (0, 0), special_flags=pg.BLEND_RGBA_ADD)
+            return self.tint_alpha
+        return 0
 
     def update_tint(self) -> None:
         if (self.tint_alpha == 0 and self.tint_update == -1) or (self.tint_alpha == 255 and self.tint_update == 1):
@@ -51,14 +56,16 @@ class Sky:
             self.tint_alpha += self.tint_update
 
     def render(self) -> None:
-        self.image.fill(self.rgb)
-        self.screen.blit(self.image, (0, 0))
-        self.render_tint()
+        render_key = (*self.rgb.tolist(), self.get_tint_alpha())
+        if render_key != self.render_key: # the rgb & tint only change once per alarm period
+            # the tint is additive, so the composite is the sky color plus the tint scaled by its alpha
+            tint = (self.tint_rgb * render_key[-1]) // 255
+            self.image.fill(np.minimum(self.rgb + tint, 255).tolist())
+            self.render_key = render_key
+        self.render_queue.add('sky', self.image, (0, 0))
         
     def update(self) -> None:
         self.render()
-        for alarm in self.alarms.values():
-            alarm.update()
 
     def make_save(self) -> dict[str, list|int]:
         return {'sky rgb': self.rgb.tolist(), 'sky rgb update': self.rgb_update, 'sky tint alpha': self.tint_alpha, 'sky tint update': self.tint_update}
\ No newline at end of file
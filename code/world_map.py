@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ui import UI
+    from procgen import ProcGen
+    from mini_map import MiniMap
+
+import pygame as pg
+import numpy as np
+from math import ceil
+
+from settings import MAP_SIZE, TILE_SIZE, WORLD_MAP_SCALES
+from tile_edits import tile_edits
+
+class WorldMap:
+    '''the whole explored world drawn from a pyramid of color-reduced tile images, 1 per zoom level'''
+    def __init__(self, ui: UI, proc_gen: ProcGen, mini_map: MiniMap):
+        self.screen = ui.screen
+        self.gen_outline, self.gen_bg = ui.gen_outline, ui.gen_bg
+        self.keyboard = ui.keyboard
+        self.player = ui.player
+        self.tile_map = proc_gen.tile_map
+        self.tile_rgbs = mini_map.tile_rgbs
+        self.visited_tiles = mini_map.visited_tiles
+
+        self.block_size = WORLD_MAP_SCALES[-1] # every level is updated in blocks of this many tiles
+        # padded so each block reduces evenly, the padding stays black
+        self.padded_size = (ceil(MAP_SIZE[0] / self.block_size) * self.block_size, ceil(MAP_SIZE[1] / self.block_size) * self.block_size)
+        self.levels = [np.zeros((self.padded_size[0] // scale, self.padded_size[1] // scale, 3), dtype=np.uint8) for scale in WORLD_MAP_SCALES]
+        self.display_surfs = {} # level images scaled up to fill the panel, cleared whenever a level changes
+        # built while loading so opening the map only has to catch up on edits
+        tile_edits.drain()
+        self.visited_tiles.pop_marked_region()
+        self.reduce_blocks(0, 0, *self.padded_size)
+        self.level_surfs = [pg.surfarray.make_surface(level) for level in self.levels]
+
+        self.padding = 20
+        self.rect = self.screen.get_rect().inflate(-self.padding * 2, -self.padding * 2)
+        self.level_idx = len(WORLD_MAP_SCALES) - 1 # start zoomed out to show the whole world
+        self.render = False
+        self.key_toggle = self.keyboard.key_bindings['toggle world map']
+        self.key_zoom_in = self.keyboard.key_bindings['zoom in world map']
+        self.key_zoom_out = self.keyboard.key_bindings['zoom out world map']
+
+    def reduce_blocks(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        '''recolor the tiles in a block-aligned region & average them down into every level'''
+        w, h = min(x1, MAP_SIZE[0]) - x0, min(y1, MAP_SIZE[1]) - y0
+        base = self.levels[0]
+        base[x0:x0 + w, y0:y0 + h] = self.tile_rgbs[self.tile_map[x0:x0 + w, y0:y0 + h]]
+        base[x0:x0 + w, y0:y0 + h][~self.visited_tiles.get(x0, y0, x0 + w, y0 + h)] = 0
+        region = base[x0:x1, y0:y1].astype(np.uint16)
+        for scale, level in zip(WORLD_MAP_SCALES[1:], self.levels[1:]):
+            cols, rows = (x1 - x0) // scale, (y1 - y0) // scale
+            level[x0 // scale:x0 // scale + cols, y0 // scale:y0 // scale + rows] = region.reshape(cols, scale, rows, scale, 3).mean(axis=(1, 3))
+
+    def get_dirty_blocks(self) -> set[tuple[int, int]]:
+        '''blocks holding tiles that were edited or explored since the last update'''
+        b = self.block_size
+        dirty_blocks = {(x // b, y // b) for x, y in tile_edits.drain()}
+        if region := self.visited_tiles.pop_marked_region():
+            x0, y0, x1, y1 = region
+            dirty_blocks.update((bx, by) for bx in range(x0 // b, ceil(x1 / b)) for by in range(y0 // b, ceil(y1 / b)))
+        return dirty_blocks
+
+    def update_pyramid(self) -> None:
+        if not (dirty_blocks := self.get_dirty_blocks()):
+            return
+        b = self.block_size
+        for bx, by in dirty_blocks:
+            x0, y0 = bx * b, by * b
+            self.reduce_blocks(x0, y0, x0 + b, y0 + b)
+            for scale, level, surf in zip(WORLD_MAP_SCALES, self.levels, self.level_surfs):
+                px = pg.surfarray.pixels3d(surf) # locks the surface until it's deleted
+                region = (slice(x0 // scale, (x0 + b) // scale), slice(y0 // scale, (y0 + b) // scale))
+                px[region] = level[region]
+                del px
+        self.display_surfs.clear()
+
+    def get_display_surf(self) -> pg.Surface:
+        '''zoomed out levels are scaled up by a whole number until they fill the panel'''
+        if self.level_idx not in self.display_surfs:
+            surf = self.level_surfs[self.level_idx].subsurface((0, 0, *(ceil(n / WORLD_MAP_SCALES[self.level_idx]) for n in MAP_SIZE)))
+            zoom = max(1, min(self.rect.width // surf.width, self.rect.height // surf.height))
+            self.display_surfs[self.level_idx] = pg.transform.scale_by(surf, zoom) if zoom > 1 else surf
+        return self.display_surfs[self.level_idx]
+
+    def render_map(self) -> None:
+        self.gen_bg(self.rect, transparent=True)
+        self.gen_outline(self.gen_outline(self.rect, draw=False, return_outline=True))
+        surf = self.get_display_surf()
+        px_per_tile = surf.width / MAP_SIZE[0]
+        # center the view on the player without scrolling past the map's edges
+        player_x, player_y = (pg.Vector2(self.player.rect.center) / TILE_SIZE) * px_per_tile
+        area = pg.Rect(0, 0, min(surf.width, self.rect.width), min(surf.height, self.rect.height))
+        area.center = (int(player_x), int(player_y))
+        area.clamp_ip(surf.get_rect())
+        topleft = pg.Vector2(self.rect.center) - pg.Vector2(area.size) // 2
+        self.screen.blit(surf, topleft, area)
+        pg.draw.circle(self.screen, 'red', topleft + (player_x - area.x, player_y - area.y), 3)
+
+    def update(self) -> None:
+        pressed_keys = self.keyboard.pressed_keys
+        if pressed_keys[self.key_toggle]:
+            self.render = not self.render
+        if self.render:
+            if pressed_keys[self.key_zoom_in]:
+                self.level_idx = max(0, self.level_idx - 1)
+            elif pressed_keys[self.key_zoom_out]:
+                self.level_idx = min(len(WORLD_MAP_SCALES) - 1, self.level_idx + 1)
+            self.update_pyramid()
+            self.render_map()